@@ -6,6 +6,7 @@ from logging import getLogger
 import pandas as pd
 import wblca_benchmark_v2_data_prep.utils.general as gen
 import wblca_benchmark_v2_data_prep.data_record.internal_data_calcs as calc
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 
 
@@ -19,6 +20,9 @@ def create_internal_data():
     - Removes projects that are not in the given design phase or final reports.
     - Reorders and renames columns for data record.
     - Writes internal data to excel.
+
+    If incremental builds are enabled, nothing is written when the data entry
+    templates are the ones used before.
     """
     main_directory = Path(__file__).parents[2]
     dets_path = main_directory.joinpath(
@@ -38,6 +42,12 @@ def create_internal_data():
     internal_data_logger = getLogger("1_internal_data_script")
     internal_data_logger.info("Logger has been set up.")
 
+    manifest = manifest_util.configured_manifest(
+        main_directory, config_path, "1_internal_data", [Path(__file__), calc]
+    )
+    if manifest.is_current("internal_data", [dets_path]):
+        return
+
     internal_data_logger.info("Read data entry templates file.")
     dets = pd.read_csv(dets_path, index_col=False)
 
@@ -79,10 +89,12 @@ def create_internal_data():
         metadata_col_order=internal_data_col_order,
     )
 
-    calc.write_internal_data_to_excel(
+    internal_data_file = calc.write_internal_data_to_excel(
         internal_data=internal_data,
         public_dataset_directory=internal_directory,
     )
+    manifest.record("internal_data", [dets_path], [internal_data_file])
+    manifest.save()
     internal_data_logger.info("Internal data created.")
 
 
@@ -4,8 +4,11 @@
 from pathlib import Path
 from logging import getLogger
 import pandas as pd
+import wblca_benchmark_v2_data_prep.utils.artifacts as artifacts
 import wblca_benchmark_v2_data_prep.utils.general as gen
 import wblca_benchmark_v2_data_prep.data_record.metadata_calcs as calc
+import wblca_benchmark_v2_data_prep.data_record.harmonized_cache as cache_util
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 
 
@@ -22,10 +25,14 @@ def create_buildings_metadata():
     - Creates intensities for all impact categories and properly renames all impacts.
     - Creates null and NA values across the data record based on conditional rules.
     - Writes data to public directory.
+
+    If incremental builds are enabled, nothing is written when the harmonized lca
+    results and internal data are the ones used before.
     """
     main_directory = Path(__file__).parents[2]
-    wblca_output_path = main_directory.joinpath(
-        "data/data_record/raw/combined_harmonized.csv"
+    artifact_format = artifacts.configured_format(main_directory)
+    wblca_output_path = artifact_format.path(
+        main_directory.joinpath("data/data_record/raw"), "combined_harmonized"
     )
     internal_data_path = main_directory.joinpath(
         "data/data_record/internal/internal_data.xlsx"
@@ -33,7 +40,22 @@ def create_buildings_metadata():
     config_path = main_directory.joinpath("references/config_data_record.yml")
     public_dataset_directory = main_directory.joinpath("data/data_record/public")
 
-    wblca_output = gen.read_csv(wblca_output_path)
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        config_path,
+        "2_buildings_metadata",
+        [
+            Path(__file__),
+            main_directory.joinpath("references/config_lca_results.yml"),
+            calc,
+            cache_util,
+            artifacts,
+        ],
+    )
+    inputs = [wblca_output_path, internal_data_path]
+    if manifest.is_current("buildings_metadata", inputs):
+        return
+
     internal_data = pd.read_excel(internal_data_path, index_col=False).set_index(
         "project_index"
     )
@@ -63,6 +85,12 @@ def create_buildings_metadata():
     assert impact_renaming is not None, "The dict for impact renaming could not be set"
     buildings_metadata_logger.info("End configuration.")
 
+    # read only the columns used from the harmonized lca results
+    wblca_output = cache_util.configured_cache(main_directory).read(
+        wblca_output_path,
+        columns=["CLF Model ID", "Life Cycle Stage", "Cat_Ele_1", *impact_type_list],
+    )
+
     # remove module d and site, mep and ffe scopes
     buildings_metadata_logger.info(
         "Exclude Module D and scopes that are not in %s.", scope_type
@@ -109,10 +137,12 @@ def create_buildings_metadata():
 
     project_metadata = calc.null_override_project_metadata(project_metadata)
 
-    calc.write_buildings_metadata_to_excel(
+    buildings_metadata_file = calc.write_buildings_metadata_to_excel(
         project_metadata=project_metadata,
         public_dataset_directory=public_dataset_directory,
     )
+    manifest.record("buildings_metadata", inputs, [buildings_metadata_file])
+    manifest.save()
     buildings_metadata_logger.info("Buildings_metadata created.")
 
 
@@ -4,9 +4,12 @@
 from pathlib import Path
 from logging import getLogger
 import pandas as pd
+import wblca_benchmark_v2_data_prep.utils.artifacts as artifacts
 import wblca_benchmark_v2_data_prep.utils.general as gen
 import wblca_benchmark_v2_data_prep.data_record.results_calcs as calc
 import wblca_benchmark_v2_data_prep.data_record.metadata_calcs as meta
+import wblca_benchmark_v2_data_prep.data_record.harmonized_cache as cache_util
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 
 
@@ -25,10 +28,14 @@ def create_lca_full_results():
     - Renames columns and sorts based on:
         'project_index', 'omniclass_element', 'life_cycle_stage', 'service_life'
     - Writes final result to public directory.
+
+    If incremental builds are enabled, nothing is written when the harmonized lca
+    results and internal data are the ones used before.
     """
     main_directory = Path(__file__).parents[2]
-    wblca_output_path = main_directory.joinpath(
-        "data/data_record/raw/combined_harmonized.csv"
+    artifact_format = artifacts.configured_format(main_directory)
+    wblca_output_path = artifact_format.path(
+        main_directory.joinpath("data/data_record/raw"), "combined_harmonized"
     )
     internal_data_path = main_directory.joinpath(
         "data/data_record/internal/internal_data.xlsx"
@@ -47,8 +54,24 @@ def create_lca_full_results():
     lca_full_results_logger = getLogger("3_lca_full_results_script")
     lca_full_results_logger.info("Logger has been set up.")
 
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        config_path,
+        "3_lca_full_results",
+        [
+            Path(__file__),
+            main_directory.joinpath("references/config_lca_results.yml"),
+            calc,
+            meta,
+            cache_util,
+            artifacts,
+        ],
+    )
+    inputs = [wblca_output_path, internal_data_path]
+    if manifest.is_current("lca_full_results", inputs):
+        return
+
     lca_full_results_logger.info("Begin configuration.")
-    wblca_output = gen.read_csv(wblca_output_path)
     internal_data = pd.read_excel(internal_data_path, index_col=False)
 
     config = gen.read_yaml(config_path)
@@ -73,6 +96,18 @@ def create_lca_full_results():
     )
     lca_full_results_logger.info("End configuration.")
 
+    # read only the columns used from the harmonized lca results
+    wblca_output = cache_util.configured_cache(main_directory).read(
+        wblca_output_path,
+        columns=[
+            "CLF Model ID",
+            "Cat_Ele_2",
+            "Cat_Mat_2",
+            "Tool",
+            *full_results_column_renaming,
+        ],
+    )
+
     lca_full_results_logger.info("Begin lca_full_results creation.")
     internal_data_for_area = calc.prep_internal_data_for_area_calcs(internal_data)
     prepped_wblca_output = calc.prep_internal_wblca_output(
@@ -112,10 +147,12 @@ def create_lca_full_results():
         ascending=[True, False, True, True],
     )
 
-    calc.write_full_lca_results_to_excel(
+    lca_full_results_file = calc.write_full_lca_results_to_excel(
         final_output=final_output,
         public_dataset_directory=public_dataset_directory,
     )
+    manifest.record("lca_full_results", inputs, [lca_full_results_file])
+    manifest.save()
     lca_full_results_logger.info("Lca_full_results created.")
 
 
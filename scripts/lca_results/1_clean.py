@@ -5,7 +5,11 @@ from pathlib import Path
 from logging import getLogger
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 import wblca_benchmark_v2_data_prep.lca_results.clean as clean_util
+import wblca_benchmark_v2_data_prep.lca_results.ingestion as ingestion_util
+import wblca_benchmark_v2_data_prep.utils.artifacts as artifacts
+import wblca_benchmark_v2_data_prep.utils.file_io as file_io
 import wblca_benchmark_v2_data_prep.utils.general as general_util
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 
 
 def clean_raw_tally_files():
@@ -13,10 +17,11 @@ def clean_raw_tally_files():
 
     This script does the following:
 
-    - Reads tally files in raw directory
+    - Reads tally files in raw directory, skipping files cleaned before if
+      incremental builds are enabled
     - Cleans tally files
     - adjusts the csi division of tally walls
-    - writes tally files to cleaned directory
+    - writes tally files to cleaned directory in the configured artifact format
     """
     current_file_path = Path(__file__)
     main_directory = current_file_path.parents[2]
@@ -33,20 +38,43 @@ def clean_raw_tally_files():
 
     main_clean_logger = getLogger("1_clean_script")
     main_clean_logger.info("Logger has been set up.")
+    artifact_format = artifacts.configured_format(main_directory)
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        main_directory.joinpath("references/config_lca_results.yml"),
+        "1_clean_tally",
+        [current_file_path, clean_util, artifacts, general_util],
+    )
 
-    for tally_file in raw_tally_directory.glob("*.csv"):
-        main_clean_logger.info("Begin cleaning of %s", tally_file.stem)
-        # read tally files
-        tally_df = general_util.read_csv(tally_file)
-
-        tally_df = clean_util.clean_tally_df(tally_df=tally_df, tally_file=tally_file)
-
-        adjusted_tally_df = clean_util.adjust_tally_walls(tally_df)
-
-        general_util.write_to_csv(
-            adjusted_tally_df, cleaned_tally_directory, tally_file.stem
-        )
-        main_clean_logger.info("End cleaning of %s", tally_file.stem)
+    tally_files = [
+        tally_file
+        for tally_file in raw_tally_directory.glob("*.csv")
+        if not manifest.is_current(tally_file.name, [tally_file])
+    ]
+    jobs = file_io.configured_jobs(main_directory)
+    # read tally files ahead and write cleaned files behind the cleaning
+    with file_io.WriteBehind(jobs) as writer:
+        for tally_file, tally_df in zip(
+            tally_files, file_io.read_ahead(general_util.read_csv, tally_files, jobs)
+        ):
+            main_clean_logger.info("Begin cleaning of %s", tally_file.stem)
+            tally_df = clean_util.clean_tally_df(
+                tally_df=tally_df, tally_file=tally_file
+            )
+
+            adjusted_tally_df = clean_util.adjust_tally_walls(tally_df)
+
+            writer.submit(
+                artifact_format.write,
+                adjusted_tally_df,
+                cleaned_tally_directory,
+                tally_file.stem,
+                done=lambda cleaned_tally_file, tally_file=tally_file: manifest.record(
+                    tally_file.name, [tally_file], [cleaned_tally_file]
+                ),
+            )
+            main_clean_logger.info("End cleaning of %s", tally_file.stem)
+    manifest.save()
 
 
 def clean_raw_oneclick_files():
@@ -54,9 +82,10 @@ def clean_raw_oneclick_files():
 
     This script does the following:
 
-    - Reads oneclick files in raw directory
+    - Reads oneclick files in raw directory, from the excel cache if unchanged,
+      skipping files cleaned before if incremental builds are enabled
     - Cleans oneclick files
-    - writes oneclick files to cleaned directory
+    - writes oneclick files to cleaned directory in the configured artifact format
     """
     current_file_path = Path(__file__)
     main_directory = current_file_path.parents[2]
@@ -75,20 +104,48 @@ def clean_raw_oneclick_files():
 
     main_clean_logger = getLogger("1_clean_script")
     main_clean_logger.info("Logger has been set up.")
+    artifact_format = artifacts.configured_format(main_directory)
+    ingestion = ingestion_util.configured_ingestion(main_directory)
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        main_directory.joinpath("references/config_lca_results.yml"),
+        "1_clean_oneclick",
+        [
+            current_file_path,
+            main_directory.joinpath("references/config_harmonize.yml"),
+            clean_util,
+            ingestion_util,
+            artifacts,
+        ],
+    )
 
-    for oneclick_file in raw_oneclick_directory.glob("*.xlsx"):
-        main_clean_logger.info("Begin cleaning of %s", oneclick_file.stem)
-        # read oneclick files
-        oneclick_df = clean_util.read_excel(oneclick_file)
-
-        oneclick_df = clean_util.clean_oneclick_df(
-            oneclick_df=oneclick_df, oneclick_file=oneclick_file
-        )
-
-        general_util.write_to_csv(
-            oneclick_df, cleaned_oneclick_directory, oneclick_file.stem
-        )
-        main_clean_logger.info("End cleaning of %s", oneclick_file.stem)
+    oneclick_files = [
+        oneclick_file
+        for oneclick_file in raw_oneclick_directory.glob("*.xlsx")
+        if not manifest.is_current(oneclick_file.name, [oneclick_file])
+    ]
+    jobs = file_io.configured_jobs(main_directory)
+    # read oneclick files ahead and write cleaned files behind the cleaning
+    with file_io.WriteBehind(jobs) as writer:
+        for oneclick_file, oneclick_df in zip(
+            oneclick_files, file_io.read_ahead(ingestion.read, oneclick_files, jobs)
+        ):
+            main_clean_logger.info("Begin cleaning of %s", oneclick_file.stem)
+            oneclick_df = clean_util.clean_oneclick_df(
+                oneclick_df=oneclick_df, oneclick_file=oneclick_file
+            )
+
+            writer.submit(
+                artifact_format.write,
+                oneclick_df,
+                cleaned_oneclick_directory,
+                oneclick_file.stem,
+                done=lambda cleaned_file, oneclick_file=oneclick_file: manifest.record(
+                    oneclick_file.name, [oneclick_file], [cleaned_file]
+                ),
+            )
+            main_clean_logger.info("End cleaning of %s", oneclick_file.stem)
+    manifest.save()
 
 
 if __name__ == "__main__":
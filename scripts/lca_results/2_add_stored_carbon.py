@@ -3,9 +3,11 @@
 
 from pathlib import Path
 from logging import getLogger
-import pandas as pd
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
-import wblca_benchmark_v2_data_prep.utils.general as gen
+import wblca_benchmark_v2_data_prep.lca_results.stored_carbon as stored_carbon_util
+import wblca_benchmark_v2_data_prep.utils.artifacts as artifacts
+import wblca_benchmark_v2_data_prep.utils.file_io as file_io
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 
 
 def add_stored_carbon():
@@ -14,9 +16,10 @@ def add_stored_carbon():
 
     This script does the following:
 
-    - Reads tally files in cleaned directory
-    - Reads stored carbon database
-    - Merges database with tally file
+    - Reads tally files in cleaned directory, skipping files whose stored carbon
+      was added before if incremental builds are enabled
+    - Loads the stored carbon lookup, compiled once per version of the database
+    - Looks up the stored carbon factor of each material name of the tally file
     - Creates new Stored Biogenic Carbon column
     - Updates each A1-A3 value in Stored Biogenic Carbon column with mass * stored carbon factor
     - Writes file to csc directory
@@ -38,39 +41,43 @@ def add_stored_carbon():
 
     csc_logger = getLogger("2_add_stored_carbon_script")
     csc_logger.info("Logger has been set up.")
+    artifact_format = artifacts.configured_format(main_directory)
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        main_directory.joinpath("references/config_lca_results.yml"),
+        "2_add_stored_carbon",
+        [current_file_path, stored_bio_database_path, artifacts, stored_carbon_util],
+    )
 
-    csc_logger.info("Read stored carbon database.")
-    full_stored_bio_database = pd.read_excel(stored_bio_database_path, sheet_name="csc")
-    stored_bio_data_short = full_stored_bio_database[
-        ["Name_Tally Material", "Stored Carbon (C02eq/kg)"]
-    ]
-
-    for tally_file in cleaned_tally_directory.glob("*.csv"):
-        csc_logger.info("Begin adding stored carbon to %s", tally_file.name)
-        tally_df = gen.read_csv(tally_file)
-
-        csc_logger.info("Merge stored carbon database based on material name.")
-        merged_tally_df = tally_df.merge(
-            right=stored_bio_data_short,
-            left_on="Material Name",
-            right_on="Name_Tally Material",
-            how="left",
-        )
-
-        merged_tally_df["Stored Biogenic Carbon"] = 0.0
+    csc_logger.info("Load stored carbon lookup.")
+    lookup = stored_carbon_util.configured_lookup(main_directory)
 
-        csc_logger.info("Calculate stored carbon for materials in A1-A3 stage")
-        merged_tally_df.loc[
-            (merged_tally_df["Life Cycle Stage"] == "[A1-A3] Product")
-            | (merged_tally_df["Life Cycle Stage"] == "Product"),
-            "Stored Biogenic Carbon",
-        ] = (
-            merged_tally_df["Mass Total (kg)"]
-            * merged_tally_df["Stored Carbon (C02eq/kg)"]
-        )
+    tally_files = [
+        tally_file
+        for tally_file in artifact_format.glob(cleaned_tally_directory)
+        if not manifest.is_current(tally_file.name, [tally_file])
+    ]
+    jobs = file_io.configured_jobs(main_directory)
+    # read tally files ahead and write csc files behind the lookup
+    with file_io.WriteBehind(jobs) as writer:
+        for tally_file, tally_df in zip(
+            tally_files, file_io.read_ahead(artifact_format.read, tally_files, jobs)
+        ):
+            csc_logger.info("Begin adding stored carbon to %s", tally_file.name)
+            csc_logger.info("Calculate stored carbon for materials in A1-A3 stage")
+            csc_tally_df = lookup.add_stored_carbon(tally_df)
 
-        gen.write_to_csv(merged_tally_df, csc_tally_directory, f"{tally_file.stem}_csc")
-        csc_logger.info("Added stored carbon to %s", tally_file.name)
+            writer.submit(
+                artifact_format.write,
+                csc_tally_df,
+                csc_tally_directory,
+                f"{tally_file.stem}_csc",
+                done=lambda csc_tally_file, tally_file=tally_file: manifest.record(
+                    tally_file.name, [tally_file], [csc_tally_file]
+                ),
+            )
+            csc_logger.info("Added stored carbon to %s", tally_file.name)
+    manifest.save()
 
 
 if __name__ == "__main__":
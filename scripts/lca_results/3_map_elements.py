@@ -6,10 +6,17 @@ from logging import getLogger
 from wblca_benchmark_v2_data_prep.lca_results.MappingImplementation import (
     TallyElementMapper,
     OneClickElementMapper,
+    configured_mapper_options,
 )
+import wblca_benchmark_v2_data_prep.lca_results.all_ele_filters as ele
+import wblca_benchmark_v2_data_prep.lca_results.batch as batch_util
+import wblca_benchmark_v2_data_prep.lca_results.mapping_cache as cache_util
 import wblca_benchmark_v2_data_prep.lca_results.oneclick_ele_filters as oc_fi
+import wblca_benchmark_v2_data_prep.lca_results.profiling as profiling
 import wblca_benchmark_v2_data_prep.lca_results.tally_ele_filters as t_fi
-import wblca_benchmark_v2_data_prep.utils.general as gen
+import wblca_benchmark_v2_data_prep.utils.artifacts as artifacts
+import wblca_benchmark_v2_data_prep.utils.file_io as file_io
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 
 
@@ -21,7 +28,8 @@ def map_tally_elements():
     - Instantiates filters created in tally_ele_filters
     - Reads tally files
     - Instantiates a mapper object
-    - Loops through the filters and applies them to the tally file
+    - Loops through the filters and applies them to the tally file, skipping
+      entries found in the mapping cache
     - Writes the element mapped file to the element_mapped directory
     """
     current_file_path = Path(__file__)
@@ -55,26 +63,50 @@ def map_tally_elements():
         t_fi.Windows("CLF Omni"),
     ]
 
-    for tally_file in ex_bio_tally_directory.glob("*.csv"):
-        main_map_ele_logger.info("Begin mapping elements for %s", tally_file.name)
-        # read combined tally files
-        tally_df = gen.read_csv(tally_file)
+    profiler = profiling.configured_profiler(main_directory)
+    mapper_options = configured_mapper_options(main_directory)
+    artifact_format = artifacts.configured_format(main_directory)
 
+    def classify(tally_df):
         # instantiate ElementMapper
-        Mapper = TallyElementMapper(tally_df, t_fi.Ceilings("CLF Omni"))
+        Mapper = TallyElementMapper(
+            tally_df, t_fi.Ceilings("CLF Omni"), profiler=profiler, **mapper_options
+        )
         Mapper.do_filtering()
 
         for fil in tally_filters:
             Mapper.change_filter_type(fil)
             Mapper.do_filtering()
+        return Mapper.df
+
+    cache = cache_util.load_cache(
+        directory=cache_util.configured_cache_dir(main_directory),
+        stage="tally_elements",
+        predicates=ele.define_tally_filters(),
+        filters=[t_fi.Ceilings("CLF Omni")] + tally_filters,
+        label_columns=["CLF Omni"],
+    )
 
-        Mapper.write_csv(
-            main_directory.joinpath(
-                f"data/lca_results/element_mapped/tally/{tally_file.stem}_EleMapped.csv"
-            )
-        )
-        main_map_ele_logger.info("Elements mapped for %s.", tally_file.name)
-        # Mapper.write_pickle()
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        main_directory.joinpath("references/config_lca_results.yml"),
+        "tally_elements",
+        [current_file_path, batch_util, cache_util, artifacts, *cache_util.module_paths()],
+    )
+
+    batch_util.map_files(
+        files=artifact_format.glob(ex_bio_tally_directory),
+        map_df=lambda df: cache_util.map_with_cache(cache, df, classify),
+        write_directory=main_directory.joinpath("data/lca_results/element_mapped/tally"),
+        suffix="_EleMapped",
+        corpus_name="Tally_Corpus_EleMapped",
+        batch=batch_util.configured_batch(main_directory),
+        logger=main_map_ele_logger,
+        artifact_format=artifact_format,
+        manifest=manifest,
+        jobs=file_io.configured_jobs(main_directory),
+    )
+    profiling.write_profile(profiler, main_directory, "tally_elements")
 
 
 def map_oneclick_elements():
@@ -85,7 +117,8 @@ def map_oneclick_elements():
     - Instantiates filters created in oneclick_ele_filters
     - Reads oneclick files
     - Instantiates a mapper object
-    - Loops through the filters and applies them to the oneclick file
+    - Loops through the filters and applies them to the oneclick file, skipping
+      entries found in the mapping cache
     - Writes the element mapped file to the element_mapped directory
     """
     current_file_path = Path(__file__)
@@ -116,26 +149,52 @@ def map_oneclick_elements():
         oc_fi.CSIDivision("CLF Omni"),
     ]
 
-    for oneclick_file in cleaned_oneclick_directory.glob("*.csv*"):
-        main_map_ele_logger.info("Begin mapping elements for %s", oneclick_file.name)
-        oneclick_df = gen.read_csv(oneclick_file)
+    profiler = profiling.configured_profiler(main_directory)
+    mapper_options = configured_mapper_options(main_directory)
+    artifact_format = artifacts.configured_format(main_directory)
 
+    def classify(oneclick_df):
         Mapper = OneClickElementMapper(
-            oneclick_df, oc_fi.OmniClassSubstructure("CLF Omni")
+            oneclick_df,
+            oc_fi.OmniClassSubstructure("CLF Omni"),
+            profiler=profiler,
+            **mapper_options,
         )
         Mapper.do_filtering()
 
         for fil in oneclick_filters:
             Mapper.change_filter_type(fil)
             Mapper.do_filtering()
+        return Mapper.df
+
+    cache = cache_util.load_cache(
+        directory=cache_util.configured_cache_dir(main_directory),
+        stage="oneclick_elements",
+        predicates=ele.define_oneclick_filters(),
+        filters=[oc_fi.OmniClassSubstructure("CLF Omni")] + oneclick_filters,
+        label_columns=["CLF Omni"],
+    )
 
-        Mapper.write_csv(
-            main_directory.joinpath(
-                f"data/lca_results/element_mapped/oneclick/{oneclick_file.stem}_EleMapped.csv"
-            )
-        )
-        main_map_ele_logger.info("Elements mapped for %s.", oneclick_file.name)
-        # Mapper.write_pickle()
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        main_directory.joinpath("references/config_lca_results.yml"),
+        "oneclick_elements",
+        [current_file_path, batch_util, cache_util, artifacts, *cache_util.module_paths()],
+    )
+
+    batch_util.map_files(
+        files=artifact_format.glob(cleaned_oneclick_directory),
+        map_df=lambda df: cache_util.map_with_cache(cache, df, classify),
+        write_directory=main_directory.joinpath("data/lca_results/element_mapped/oneclick"),
+        suffix="_EleMapped",
+        corpus_name="OneClick_Corpus_EleMapped",
+        batch=batch_util.configured_batch(main_directory),
+        logger=main_map_ele_logger,
+        artifact_format=artifact_format,
+        manifest=manifest,
+        jobs=file_io.configured_jobs(main_directory),
+    )
+    profiling.write_profile(profiler, main_directory, "oneclick_elements")
 
 
 if __name__ == "__main__":
@@ -6,10 +6,17 @@ from logging import getLogger
 from wblca_benchmark_v2_data_prep.lca_results.MappingImplementation import (
     TallyMaterialQuantityMapper,
     OneClickMaterialQuantityMapper,
+    configured_mapper_options,
 )
+import wblca_benchmark_v2_data_prep.lca_results.all_mat_filters as mat
+import wblca_benchmark_v2_data_prep.lca_results.batch as batch_util
+import wblca_benchmark_v2_data_prep.lca_results.mapping_cache as cache_util
 import wblca_benchmark_v2_data_prep.lca_results.oneclick_mat_filters as oc_fi
+import wblca_benchmark_v2_data_prep.lca_results.profiling as profiling
 import wblca_benchmark_v2_data_prep.lca_results.tally_mat_filters as t_fi
-import wblca_benchmark_v2_data_prep.utils.general as gen
+import wblca_benchmark_v2_data_prep.utils.artifacts as artifacts
+import wblca_benchmark_v2_data_prep.utils.file_io as file_io
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 
 
@@ -97,84 +104,80 @@ def map_tally_materials():
         t_fi.FinalOtherMaterialQuantityTwoOther("MQ_2")
     ]
 
-    for tally_file in ele_mapped_tally_directory.glob("*.csv"):
-        main_map_mat_logger.info("Begin mapping materials for %s", tally_file.name)
-        # read combined tally files
-        tally_df = gen.read_csv(tally_file)
+    profiler = profiling.configured_profiler(main_directory)
+    mapper_options = configured_mapper_options(main_directory)
+    artifact_format = artifacts.configured_format(main_directory)
 
+    def classify(tally_df):
         # instantiate Material Mapper for Material Quantity One
-        main_map_mat_logger.info("Working on MQ_1 of %s", tally_file.name)
-        MaterialQuantityOneMapper = TallyMaterialQuantityMapper(
-            tally_df,
+        main_map_mat_logger.info("Working on MQ_1")
+        MaterialQuantityMapper = TallyMaterialQuantityMapper(
+            tally_df, profiler=profiler, **mapper_options
         )
 
         for fil in tally_material_quantity_one_filters:
-            MaterialQuantityOneMapper.change_filter_type(fil)
-            MaterialQuantityOneMapper.do_filtering()
-
-        material_quantity_one_updated_tally_df = MaterialQuantityOneMapper.df
-
-        main_map_mat_logger.info("Working on MQ_2 of %s", tally_file.name)
-        # instantiate Material Mapper for Material Quantity Two using updated df
-        MaterialQuantityTwoMapper = TallyMaterialQuantityMapper(
-            material_quantity_one_updated_tally_df,
-        )
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
 
+        main_map_mat_logger.info("Working on MQ_2")
+        # recompute only the filters on columns written so far
+        MaterialQuantityMapper.refresh_filters()
         for fil in tally_material_quantity_two_filters:
-            MaterialQuantityTwoMapper.change_filter_type(fil)
-            MaterialQuantityTwoMapper.do_filtering()
-
-        mq_one_and_two_updated_tally_df = MaterialQuantityTwoMapper.df
-
-        main_map_mat_logger.info(
-            "Working on MQ_1 of %s to sort Other Materials", tally_file.name
-        )
-        # instantiate Material Mapper for Material Quantity one of other materials using updated df
-        MaterialQuantityOneOtherMapper = TallyMaterialQuantityMapper(
-            mq_one_and_two_updated_tally_df,
-        )
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
 
+        main_map_mat_logger.info("Working on MQ_1 to sort Other Materials")
+        MaterialQuantityMapper.refresh_filters()
         for fil in tally_material_quantity_one_other_filters:
-            MaterialQuantityOneOtherMapper.change_filter_type(fil)
-            MaterialQuantityOneOtherMapper.do_filtering()
-
-        mq_one_two_and_other_one_updated_tally_df = MaterialQuantityOneOtherMapper.df
-
-        main_map_mat_logger.info(
-            "Working on MQ_2 of %s to sort Other Materials", tally_file.name
-        )
-        # instantiate Material Mapper for Material Quantity Two using updated df
-        MaterialQuantityTwoOtherMapper = TallyMaterialQuantityMapper(
-            mq_one_two_and_other_one_updated_tally_df,
-        )
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
 
+        main_map_mat_logger.info("Working on MQ_2 to sort Other Materials")
+        MaterialQuantityMapper.refresh_filters()
         for fil in tally_material_quantity_two_other_filters:
-            MaterialQuantityTwoOtherMapper.change_filter_type(fil)
-            MaterialQuantityTwoOtherMapper.do_filtering()
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
 
-        mq_one_two_and_other_one_two_updated_tally_df = (
-            MaterialQuantityTwoOtherMapper.df
-        )
+        main_map_mat_logger.info("Working on MQ_2 to replace Other values")
+        MaterialQuantityMapper.refresh_filters()
+        for fil in tally_material_quantity_two_unique_other_filters:
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
+
+        return MaterialQuantityMapper.df
+
+    cache = cache_util.load_cache(
+        directory=cache_util.configured_cache_dir(main_directory),
+        stage="tally_materials",
+        predicates=mat.define_tally_filters(),
+        filters=tally_material_quantity_one_filters
+        + tally_material_quantity_two_filters
+        + tally_material_quantity_one_other_filters
+        + tally_material_quantity_two_other_filters
+        + tally_material_quantity_two_unique_other_filters,
+        label_columns=["MQ_1", "MQ_2"],
+    )
 
-        main_map_mat_logger.info(
-            "Working on MQ_2 of %s to replace Other values", tally_file.name
-        )
-        # instantiate Material Mapper for Material Quantity Two using updated df
-        MaterialQuantityTwoFinalOtherMapper = TallyMaterialQuantityMapper(
-            mq_one_two_and_other_one_two_updated_tally_df,
-        )
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        main_directory.joinpath("references/config_lca_results.yml"),
+        "tally_materials",
+        [current_file_path, batch_util, cache_util, artifacts, *cache_util.module_paths()],
+    )
 
-        for fil in tally_material_quantity_two_unique_other_filters:
-            MaterialQuantityTwoFinalOtherMapper.change_filter_type(fil)
-            MaterialQuantityTwoFinalOtherMapper.do_filtering()
-
-        # write to csv
-        MaterialQuantityTwoFinalOtherMapper.write_csv(
-            main_directory.joinpath(
-                f"data/lca_results/material_mapped/tally/{tally_file.stem}_MatMapped.csv"
-            )
-        )
-        # Mapper.write_pickle()
+    batch_util.map_files(
+        files=artifact_format.glob(ele_mapped_tally_directory),
+        map_df=lambda df: cache_util.map_with_cache(cache, df, classify),
+        write_directory=main_directory.joinpath("data/lca_results/material_mapped/tally"),
+        suffix="_MatMapped",
+        corpus_name="Tally_Corpus_MatMapped",
+        batch=batch_util.configured_batch(main_directory),
+        logger=main_map_mat_logger,
+        artifact_format=artifact_format,
+        manifest=manifest,
+        jobs=file_io.configured_jobs(main_directory),
+    )
+    profiling.write_profile(profiler, main_directory, "tally_materials")
 
 
 def map_oneclick_materials():
@@ -262,84 +265,80 @@ def map_oneclick_materials():
         oc_fi.FinalOtherMaterialQuantityTwoOther("MQ_2")
     ]
 
-    for oneclick_file in ele_mapped_oneclick_directory.glob("*.csv"):
-        main_map_mat_logger.info("Begin mapping materials for %s", oneclick_file.name)
-        # read combined tally files
-        tally_df = gen.read_csv(oneclick_file)
+    profiler = profiling.configured_profiler(main_directory)
+    mapper_options = configured_mapper_options(main_directory)
+    artifact_format = artifacts.configured_format(main_directory)
 
+    def classify(tally_df):
         # instantiate Material Mapper for Material Quantity One
-        main_map_mat_logger.info("Working on MQ_1 of %s", oneclick_file.name)
-        MaterialQuantityOneMapper = OneClickMaterialQuantityMapper(
-            tally_df,
+        main_map_mat_logger.info("Working on MQ_1")
+        MaterialQuantityMapper = OneClickMaterialQuantityMapper(
+            tally_df, profiler=profiler, **mapper_options
         )
 
         for fil in oneclick_material_quantity_one_filters:
-            MaterialQuantityOneMapper.change_filter_type(fil)
-            MaterialQuantityOneMapper.do_filtering()
-
-        material_quantity_one_updated_tally_df = MaterialQuantityOneMapper.df
-
-        main_map_mat_logger.info("Working on MQ_2 of %s", oneclick_file.name)
-        # instantiate Material Mapper for Material Quantity Two using updated df
-        MaterialQuantityTwoMapper = OneClickMaterialQuantityMapper(
-            material_quantity_one_updated_tally_df,
-        )
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
 
+        main_map_mat_logger.info("Working on MQ_2")
+        # recompute only the filters on columns written so far
+        MaterialQuantityMapper.refresh_filters()
         for fil in oneclick_material_quantity_two_filters:
-            MaterialQuantityTwoMapper.change_filter_type(fil)
-            MaterialQuantityTwoMapper.do_filtering()
-
-        mq_one_and_two_updated_tally_df = MaterialQuantityTwoMapper.df
-
-        main_map_mat_logger.info(
-            "Working on MQ_1 of %s to sort Other Materials", oneclick_file.name
-        )
-        # instantiate Material Mapper for Material Quantity one of other materials using updated df
-        MaterialQuantityOneOtherMapper = OneClickMaterialQuantityMapper(
-            mq_one_and_two_updated_tally_df,
-        )
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
 
+        main_map_mat_logger.info("Working on MQ_1 to sort Other Materials")
+        MaterialQuantityMapper.refresh_filters()
         for fil in oneclick_material_quantity_one_other_filters:
-            MaterialQuantityOneOtherMapper.change_filter_type(fil)
-            MaterialQuantityOneOtherMapper.do_filtering()
-
-        mq_one_two_and_other_one_updated_tally_df = MaterialQuantityOneOtherMapper.df
-
-        main_map_mat_logger.info(
-            "Working on MQ_2 of %s to sort Other Materials", oneclick_file.name
-        )
-        # instantiate Material Mapper for Material Quantity Two using updated df
-        MaterialQuantityTwoOtherMapper = OneClickMaterialQuantityMapper(
-            mq_one_two_and_other_one_updated_tally_df,
-        )
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
 
+        main_map_mat_logger.info("Working on MQ_2 to sort Other Materials")
+        MaterialQuantityMapper.refresh_filters()
         for fil in oneclick_material_quantity_two_other_filters:
-            MaterialQuantityTwoOtherMapper.change_filter_type(fil)
-            MaterialQuantityTwoOtherMapper.do_filtering()
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
 
-        mq_one_two_and_other_one_two_updated_tally_df = (
-            MaterialQuantityTwoOtherMapper.df
-        )
+        main_map_mat_logger.info("Working on MQ_2 to replace Other values")
+        MaterialQuantityMapper.refresh_filters()
+        for fil in oneclick_material_quantity_two_unique_other_filters:
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
+
+        return MaterialQuantityMapper.df
+
+    cache = cache_util.load_cache(
+        directory=cache_util.configured_cache_dir(main_directory),
+        stage="oneclick_materials",
+        predicates=mat.define_oneclick_filters(),
+        filters=oneclick_material_quantity_one_filters
+        + oneclick_material_quantity_two_filters
+        + oneclick_material_quantity_one_other_filters
+        + oneclick_material_quantity_two_other_filters
+        + oneclick_material_quantity_two_unique_other_filters,
+        label_columns=["MQ_1", "MQ_2"],
+    )
 
-        main_map_mat_logger.info(
-            "Working on MQ_2 of %s to replace Other values", oneclick_file.name
-        )
-        # instantiate Material Mapper for Material Quantity Two using updated df
-        MaterialQuantityTwoFinalOtherMapper = OneClickMaterialQuantityMapper(
-            mq_one_two_and_other_one_two_updated_tally_df,
-        )
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        main_directory.joinpath("references/config_lca_results.yml"),
+        "oneclick_materials",
+        [current_file_path, batch_util, cache_util, artifacts, *cache_util.module_paths()],
+    )
 
-        for fil in oneclick_material_quantity_two_unique_other_filters:
-            MaterialQuantityTwoFinalOtherMapper.change_filter_type(fil)
-            MaterialQuantityTwoFinalOtherMapper.do_filtering()
-
-        # write to csv
-        MaterialQuantityTwoFinalOtherMapper.write_csv(
-            main_directory.joinpath(
-                f"data/lca_results/material_mapped/oneclick/{oneclick_file.stem}_MatMapped.csv"
-            )
-        )
-        # Mapper.write_pickle()
+    batch_util.map_files(
+        files=artifact_format.glob(ele_mapped_oneclick_directory),
+        map_df=lambda df: cache_util.map_with_cache(cache, df, classify),
+        write_directory=main_directory.joinpath("data/lca_results/material_mapped/oneclick"),
+        suffix="_MatMapped",
+        corpus_name="OneClick_Corpus_MatMapped",
+        batch=batch_util.configured_batch(main_directory),
+        logger=main_map_mat_logger,
+        artifact_format=artifact_format,
+        manifest=manifest,
+        jobs=file_io.configured_jobs(main_directory),
+    )
+    profiling.write_profile(profiler, main_directory, "oneclick_materials")
 
 
 if __name__ == "__main__":
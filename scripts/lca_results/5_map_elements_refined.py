@@ -6,9 +6,16 @@ from logging import getLogger
 from wblca_benchmark_v2_data_prep.lca_results.MappingImplementation import (
     TallyRefinedElementMapper,
     OneClickRefinedElementMapper,
+    configured_mapper_options,
 )
 import wblca_benchmark_v2_data_prep.lca_results.comb_refined_ele_filters as ref
-import wblca_benchmark_v2_data_prep.utils.general as gen
+import wblca_benchmark_v2_data_prep.lca_results.batch as batch_util
+import wblca_benchmark_v2_data_prep.lca_results.mapping_cache as cache_util
+import wblca_benchmark_v2_data_prep.lca_results.profiling as profiling
+import wblca_benchmark_v2_data_prep.lca_results.refined_mat_filters as ref_mat
+import wblca_benchmark_v2_data_prep.utils.artifacts as artifacts
+import wblca_benchmark_v2_data_prep.utils.file_io as file_io
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 
 
@@ -38,25 +45,49 @@ def map_tally_elements_refined():
     main_map_ele_ref_logger = getLogger("5_map_elements_refined_script")
     main_map_ele_ref_logger.info("Logger has been set up.")
 
-    for tally_file in mat_mapped_tally_directory.glob("*.csv"):
-        main_map_ele_ref_logger.info(
-            "Begin mapping elements in a refined method for %s", tally_file.name
-        )
-        # read combined tally files
-        tally_df = gen.read_csv(tally_file)
+    profiler = profiling.configured_profiler(main_directory)
+    mapper_options = configured_mapper_options(main_directory)
+    artifact_format = artifacts.configured_format(main_directory)
 
+    def classify(tally_df):
         # instantiate ElementMapper
         Mapper = TallyRefinedElementMapper(
-            tally_df, ref.RefinedElementFilter("CLF Omni")
+            tally_df,
+            ref.RefinedElementFilter("CLF Omni"),
+            profiler=profiler,
+            **mapper_options,
         )
         Mapper.do_filtering()
+        return Mapper.df
+
+    cache = cache_util.load_cache(
+        directory=cache_util.configured_cache_dir(main_directory),
+        stage="tally_elements_refined",
+        predicates=ref_mat.define_refined_filters(),
+        filters=[ref.RefinedElementFilter("CLF Omni")],
+        label_columns=["CLF Omni"],
+    )
 
-        Mapper.write_csv(
-            main_directory.joinpath(
-                f"data/lca_results/ref_ele_mapped/tally/{tally_file.stem}_RefMapped.csv"
-            )
-        )
-        # Mapper.write_pickle()
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        main_directory.joinpath("references/config_lca_results.yml"),
+        "tally_elements_refined",
+        [current_file_path, batch_util, cache_util, artifacts, *cache_util.module_paths()],
+    )
+
+    batch_util.map_files(
+        files=artifact_format.glob(mat_mapped_tally_directory),
+        map_df=lambda df: cache_util.map_with_cache(cache, df, classify),
+        write_directory=main_directory.joinpath("data/lca_results/ref_ele_mapped/tally"),
+        suffix="_RefMapped",
+        corpus_name="Tally_Corpus_RefMapped",
+        batch=batch_util.configured_batch(main_directory),
+        logger=main_map_ele_ref_logger,
+        artifact_format=artifact_format,
+        manifest=manifest,
+        jobs=file_io.configured_jobs(main_directory),
+    )
+    profiling.write_profile(profiler, main_directory, "tally_elements_refined")
 
 
 def map_oneclick_elements_refined():
@@ -85,23 +116,48 @@ def map_oneclick_elements_refined():
     main_map_ele_ref_logger = getLogger("5_map_elements_refined_script")
     main_map_ele_ref_logger.info("Logger has been set up.")
 
-    for oneclick_file in cleaned_oneclick_directory.glob("*.csv*"):
-        main_map_ele_ref_logger.info(
-            "Begin mapping elements in a refined method for %s", oneclick_file.name
-        )
-        oneclick_df = gen.read_csv(oneclick_file)
+    profiler = profiling.configured_profiler(main_directory)
+    mapper_options = configured_mapper_options(main_directory)
+    artifact_format = artifacts.configured_format(main_directory)
 
+    def classify(oneclick_df):
         Mapper = OneClickRefinedElementMapper(
-            oneclick_df, ref.RefinedElementFilter("CLF Omni")
+            oneclick_df,
+            ref.RefinedElementFilter("CLF Omni"),
+            profiler=profiler,
+            **mapper_options,
         )
         Mapper.do_filtering()
+        return Mapper.df
+
+    cache = cache_util.load_cache(
+        directory=cache_util.configured_cache_dir(main_directory),
+        stage="oneclick_elements_refined",
+        predicates=ref_mat.define_refined_filters(),
+        filters=[ref.RefinedElementFilter("CLF Omni")],
+        label_columns=["CLF Omni"],
+    )
 
-        Mapper.write_csv(
-            main_directory.joinpath(
-                f"data/lca_results/ref_ele_mapped/oneclick/{oneclick_file.stem}_EleMapped.csv"
-            )
-        )
-        # Mapper.write_pickle()
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        main_directory.joinpath("references/config_lca_results.yml"),
+        "oneclick_elements_refined",
+        [current_file_path, batch_util, cache_util, artifacts, *cache_util.module_paths()],
+    )
+
+    batch_util.map_files(
+        files=artifact_format.glob(cleaned_oneclick_directory),
+        map_df=lambda df: cache_util.map_with_cache(cache, df, classify),
+        write_directory=main_directory.joinpath("data/lca_results/ref_ele_mapped/oneclick"),
+        suffix="_EleMapped",
+        corpus_name="OneClick_Corpus_RefMapped",
+        batch=batch_util.configured_batch(main_directory),
+        logger=main_map_ele_ref_logger,
+        artifact_format=artifact_format,
+        manifest=manifest,
+        jobs=file_io.configured_jobs(main_directory),
+    )
+    profiling.write_profile(profiler, main_directory, "oneclick_elements_refined")
 
 
 if __name__ == "__main__":
@@ -3,25 +3,46 @@
 
 from pathlib import Path
 from logging import getLogger
-import pandas as pd
+from typing import Optional
+import wblca_benchmark_v2_data_prep.lca_results.combine as combine_util
+import wblca_benchmark_v2_data_prep.utils.artifacts as artifacts
+import wblca_benchmark_v2_data_prep.utils.general as gen
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 
 
-def combine(directory_to_read: Path, write_directory: Path) -> None:
+def combine(
+    directory_to_read: Path,
+    write_directory: Path,
+    file_name: str,
+    artifact_format: artifacts.ArtifactFormat = artifacts.CSV,
+    jobs: int = 1,
+    manifest: Optional[manifest_util.BuildManifest] = None,
+) -> None:
     """Combines all models in either tally or oneclick folders.
 
+    The models are appended to the combined file one at a time, so only one model
+    is held in memory per job. Nothing is combined if the manifest records the
+    combined file as built from the current models.
+
     Args:
         directory_to_read (Path): directory with all models
         write_directory (Path): location to save combined models
+        file_name (str): name of the combined file without suffix
+        artifact_format (artifacts.ArtifactFormat): format of the files read and written
+        jobs (int): number of models read at the same time
+        manifest (Optional[manifest_util.BuildManifest]): manifest of the combined
+            files, None to always combine
     """
-    df_list = []
-    for file in directory_to_read.glob("*.csv"):
-        temp_df = pd.read_csv(file)
-        df_list.append(temp_df)
-
-    if len(df_list) > 0:
-        final_df = pd.concat(df_list)
-        final_df.to_csv(write_directory, index=False)
+    manifest = manifest or manifest_util.BuildManifest()
+    files = artifact_format.glob(directory_to_read)
+    if manifest.is_current(file_name, files):
+        return
+    combined_file = combine_util.combine_files(
+        files, write_directory, file_name, artifact_format, jobs
+    )
+    if combined_file is not None:
+        manifest.record(file_name, files, [combined_file])
 
 
 if __name__ == "__main__":
@@ -30,15 +51,10 @@ if __name__ == "__main__":
     tally_directory_to_read = main_directory.joinpath(
         "data/lca_results/ref_ele_mapped/tally"
     )
-    tally_write_path = main_directory.joinpath(
-        "data/lca_results/combined/Tally_Model_Combined.csv"
-    )
     oneclick_directory_to_read = main_directory.joinpath(
         "data/lca_results/ref_ele_mapped/oneclick"
     )
-    oneclick_write_path = main_directory.joinpath(
-        "data/lca_results/combined/OneClick_Model_Combined.csv"
-    )
+    combined_directory = main_directory.joinpath("data/lca_results/combined")
     setup_logger(
         log_file_path=main_directory.joinpath(
             "data/logs/lca_results/combine_lca_results.log"
@@ -48,8 +64,32 @@ if __name__ == "__main__":
 
     main_combine_logger = getLogger("6_combine_script")
     main_combine_logger.info("Logger has been set up.")
+    configured_format = artifacts.configured_format(main_directory)
+    config = gen.read_yaml(main_directory.joinpath("references/config_lca_results.yml"))
+    jobs = (config.get("combine") or {}).get("jobs", 1)
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        main_directory.joinpath("references/config_lca_results.yml"),
+        "6_combine",
+        [current_file_path, combine_util, artifacts],
+    )
 
     main_combine_logger.info("Combine tally files.")
-    combine(tally_directory_to_read, tally_write_path)
+    combine(
+        tally_directory_to_read,
+        combined_directory,
+        "Tally_Model_Combined",
+        configured_format,
+        jobs,
+        manifest,
+    )
     main_combine_logger.info("Combine oneclick files.")
-    combine(oneclick_directory_to_read, oneclick_write_path)
+    combine(
+        oneclick_directory_to_read,
+        combined_directory,
+        "OneClick_Model_Combined",
+        configured_format,
+        jobs,
+        manifest,
+    )
+    manifest.save()
@@ -4,7 +4,10 @@
 from pathlib import Path
 from logging import getLogger
 import pandas as pd
+import wblca_benchmark_v2_data_prep.utils.artifacts as artifacts
+import wblca_benchmark_v2_data_prep.utils.dtypes as dtypes_util
 import wblca_benchmark_v2_data_prep.utils.general as utils
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 
 
@@ -19,7 +22,8 @@ def harmonize():
     - Replaces values based on config file.
     - Fills nulls for impacts and mass values.
     - Combines tally and oneclick files into one harmonized file.
-    Writes all to harmonized directory.
+    Writes all to harmonized directory. If incremental builds are enabled, nothing
+    is harmonized when the combined files are the ones harmonized before.
     """
     # set file path locations
     current_file_path = Path(__file__)
@@ -35,11 +39,13 @@ def harmonize():
     main_harmonize_logger.info("Logger has been set up.")
 
     main_harmonize_logger.info("Begin configuration.")
-    tally_combined_path = main_directory.joinpath(
-        "data/lca_results/combined/Tally_Model_Combined.csv"
+    artifact_format = artifacts.configured_format(main_directory)
+    combined_directory = main_directory.joinpath("data/lca_results/combined")
+    tally_combined_path = artifact_format.path(
+        combined_directory, "Tally_Model_Combined"
     )
-    oneclick_combined_path = main_directory.joinpath(
-        "data/lca_results/combined/OneClick_Model_Combined.csv"
+    oneclick_combined_path = artifact_format.path(
+        combined_directory, "OneClick_Model_Combined"
     )
     harmonized_write_path = main_directory.joinpath("data/lca_results/harmonized")
     data_record_write_path = main_directory.joinpath("data/data_record/raw")
@@ -80,6 +86,25 @@ could not be set"
     )
     main_harmonize_logger.info("End configuration.")
 
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        main_directory.joinpath("references/config_lca_results.yml"),
+        "7_harmonize",
+        [
+            current_file_path,
+            config_path,
+            main_directory.joinpath("references/lca_dtypes.yml"),
+            artifacts,
+            dtypes_util,
+        ],
+    )
+    combined_paths = [
+        path for path in (tally_combined_path, oneclick_combined_path) if path.exists()
+    ]
+    if manifest.is_current("harmonized", combined_paths):
+        return
+    harmonized_files = []
+
     # read combined files
     main_harmonize_logger.info("Read combined lca_results files.")
 
@@ -87,7 +112,7 @@ could not be set"
     combined_oneclick_adjusted = None
     # Combined Tally
     try:
-        combined_tally = utils.read_csv(tally_combined_path)
+        combined_tally = artifact_format.read(tally_combined_path)
         # get the combined sets of columns to drop
         tally_columns_to_drop = list(
             set(combined_tally.columns.to_list()) & set(column_removal_tally)
@@ -101,21 +126,23 @@ could not be set"
         for df_key, value_to_replace_dict in config.get(
             "column_value_replace_tally"
         ).items():
-            combined_tally_adjusted[df_key] = combined_tally_adjusted[df_key].replace(
-                value_to_replace_dict
+            combined_tally_adjusted[df_key] = dtypes_util.replace_values(
+                combined_tally_adjusted[df_key], value_to_replace_dict
             )
         for col_null_replace in column_null_replacement:
             combined_tally_adjusted[col_null_replace] = combined_tally_adjusted[
                 col_null_replace
             ].fillna(0)
-        utils.write_to_csv(
-            combined_tally_adjusted, harmonized_write_path, "tally_harmonized"
+        harmonized_files.append(
+            artifact_format.write(
+                combined_tally_adjusted, harmonized_write_path, "tally_harmonized"
+            )
         )
     except Exception as e:
         print(f"Unable to complete harmonization for tally files: {e}")
 
     try:
-        combined_oneclick = utils.read_csv(oneclick_combined_path)
+        combined_oneclick = artifact_format.read(oneclick_combined_path)
         oneclick_columns_to_drop = list(
             set(combined_oneclick.columns.to_list()) & set(column_removal_oneclick)
         )
@@ -127,15 +154,19 @@ could not be set"
         for df_key, value_to_replace_dict in config.get(
             "column_value_replace_oneclick"
         ).items():
-            combined_oneclick_adjusted[df_key] = combined_oneclick_adjusted[
-                df_key
-            ].replace(value_to_replace_dict)
+            combined_oneclick_adjusted[df_key] = dtypes_util.replace_values(
+                combined_oneclick_adjusted[df_key], value_to_replace_dict
+            )
         for col_null_replace in column_null_replacement:
             combined_oneclick_adjusted[col_null_replace] = combined_oneclick_adjusted[
                 col_null_replace
             ].fillna(0)
-        utils.write_to_csv(
-            combined_oneclick_adjusted, harmonized_write_path, "oneclick_harmonized"
+        harmonized_files.append(
+            artifact_format.write(
+                combined_oneclick_adjusted,
+                harmonized_write_path,
+                "oneclick_harmonized",
+            )
         )
     except Exception as e:
         print(f"Unable to complete harmonization for oneclick files: {e}")
@@ -161,17 +192,30 @@ could not be set"
             combined_raw_wblca_output = None
             print("No dataframes available to combine")
 
-        # write to csv
+        # write in the configured artifact format
         if combined_raw_wblca_output is not None:
-            utils.write_to_csv(
-                combined_raw_wblca_output, harmonized_write_path, "combined_harmonized"
+            harmonized_files.append(
+                artifact_format.write(
+                    combined_raw_wblca_output,
+                    harmonized_write_path,
+                    "combined_harmonized",
+                )
             )
-            utils.write_to_csv(
-                combined_raw_wblca_output, data_record_write_path, "combined_harmonized"
+            harmonized_files.append(
+                artifact_format.write(
+                    combined_raw_wblca_output,
+                    data_record_write_path,
+                    "combined_harmonized",
+                )
             )
     except Exception as e:
         print(f"unable to combined outputs for raw wblca output: {e}")
 
+    # only record complete runs, failed harmonizations are tried again
+    if combined_paths and len(harmonized_files) == len(combined_paths) + 2:
+        manifest.record("harmonized", combined_paths, harmonized_files)
+        manifest.save()
+
 
 if __name__ == "__main__":
     harmonize()
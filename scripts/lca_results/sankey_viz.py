@@ -5,6 +5,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from sankeyflow import Sankey
 from wblca_benchmark_v2_data_prep.lca_results.enums import MaterialQuantityOne
+import wblca_benchmark_v2_data_prep.utils.artifacts as artifacts
 
 
 def create_sankey_per_material():
@@ -13,16 +14,16 @@ def create_sankey_per_material():
     """
     current_file_path = Path(__file__)
     main_directory = current_file_path.parents[2]
-    combined_tally_path = main_directory.joinpath(
-        "data/lca_results/harmonized/tally_harmonized.csv"
-    )
-    combined_oneclick_path = main_directory.joinpath(
-        "data/lca_results/harmonized/oneclick_harmonized.csv"
+    artifact_format = artifacts.configured_format(main_directory)
+    harmonized_directory = main_directory.joinpath("data/lca_results/harmonized")
+    combined_tally_path = artifact_format.path(harmonized_directory, "tally_harmonized")
+    combined_oneclick_path = artifact_format.path(
+        harmonized_directory, "oneclick_harmonized"
     )
 
     dfs_dict = {
-        "tally": pd.read_csv(combined_tally_path),
-        "oneclick": pd.read_csv(combined_oneclick_path),
+        "tally": artifact_format.read(combined_tally_path),
+        "oneclick": artifact_format.read(combined_oneclick_path),
     }
 
     material_to_check_list = [str(mat.value) for mat in MaterialQuantityOne]
@@ -3,19 +3,79 @@
 
 from pathlib import Path
 from logging import getLogger
+from typing import Dict, Optional
+import pandas as pd
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 import wblca_benchmark_v2_data_prep.metadata.organize as o_utils
 import wblca_benchmark_v2_data_prep.metadata.general as utils
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 
 
-def organize_det(project_or_energy: str):
+def _manifest(
+    main_directory: Path, project_or_energy: str
+) -> manifest_util.BuildManifest:
+    """Manifest of the organized project or energy templates."""
+    current_file_path = Path(__file__)
+    config_path = main_directory.joinpath("references/config_metadata.yml")
+    config_dict = utils.read_yaml(config_path).get(current_file_path.stem)
+    col_name_replacements_path = main_directory.joinpath(
+        config_dict.get("col_name_replacements")
+    )
+    return manifest_util.configured_manifest(
+        main_directory,
+        config_path,
+        f"1_organize_{project_or_energy}",
+        [current_file_path, col_name_replacements_path, o_utils, utils],
+    )
+
+
+def read_dets() -> Dict[Path, Dict[str, pd.DataFrame]]:
+    """
+    Read the project and energy tabs of the raw data entry templates.
+
+    Each workbook is opened once for both tabs, in jobs worker processes, and
+    templates organized before for both tabs are skipped if incremental builds
+    are enabled.
+
+    Returns:
+        Dict[Path, Dict[str, pd.DataFrame]]: Sheets of each raw template by
+            sheet name
+    """
+    current_file_path = Path(__file__)
+    main_directory = current_file_path.parents[2]
+    config_path = main_directory.joinpath("references/config_metadata.yml")
+    config_dict = utils.read_yaml(config_path).get(current_file_path.stem)
+    assert config_dict is not None, "The config dictionary could not be set"
+
+    files = sorted(
+        main_directory.joinpath(config_dict.get("read_data_directory")).glob(
+            config_dict.get("read_data_filter")
+        )
+    )
+    manifests = [_manifest(main_directory, kind) for kind in ("project", "energy")]
+    files = [
+        file
+        for file in files
+        if not all(manifest.is_current(file.name, [file]) for manifest in manifests)
+    ]
+    sheet_names = [
+        config_dict.get(kind).get("sheet_name") for kind in ("project", "energy")
+    ]
+    return o_utils.read_workbooks(files, sheet_names, config_dict.get("jobs") or 1)
+
+
+def organize_det(
+    project_or_energy: str,
+    raw_dets: Optional[Dict[Path, Dict[str, pd.DataFrame]]] = None,
+):
     """
     Organize project and energy tabs from data entry templates.
 
     This function does the following:
 
     - Reads yaml files with column name replacements
-    - Reads raw data entry templates
+    - Reads raw data entry templates, skipping templates organized before if
+      incremental builds are enabled, unless they were read by read_dets
     - Tests column names
     - Replaces column names to ensure they are all correct
     - Transposes data
@@ -79,15 +139,22 @@ the original column list"
     )
     main_organize_logger.info("End configuration.")
 
+    manifest = _manifest(main_directory, project_or_energy)
+
     df_list = []
     # loop over each raw data entry template
     for file in read_data_directory_path:
+        if manifest.is_current(file.name, [file]):
+            continue
         main_organize_logger.info("Begin organizing data entry template %s", file.stem)
         # read excel tab
-        df = o_utils.read_excel(
-            file,
-            sheet_name,
-        )
+        if raw_dets is not None and file in raw_dets:
+            df = raw_dets[file][sheet_name]
+        else:
+            df = o_utils.read_excel(
+                file,
+                sheet_name,
+            )
 
         # test column names
         o_utils.column_name_test(df, original_column_list)
@@ -101,17 +168,23 @@ the original column list"
         # recheck column names
         o_utils.column_name_after_transpose_test(df1, original_column_list)
 
-        df_list.append(df1)
+        df_list.append((file, df1))
         main_organize_logger.info("End organizing data entry template %s", file.stem)
 
     # loop over each sheet that was read
-    for det_df in df_list:
+    for file, det_df in df_list:
         # write to csv
         utils.write_to_csv(
             det_df, write_data_directory_path, organized_file_suffix, module_description
         )
+        organized_file = write_data_directory_path.joinpath(
+            f"{det_df.attrs.get('name')}{organized_file_suffix}"
+        )
+        manifest.record(file.name, [file], [organized_file])
+    manifest.save()
 
 
 if __name__ == "__main__":
-    organize_det("project")
-    organize_det("energy")
+    dets = read_dets()
+    organize_det("project", dets)
+    organize_det("energy", dets)
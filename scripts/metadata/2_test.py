@@ -4,21 +4,22 @@
 from pathlib import Path
 import warnings
 from logging import getLogger
-import pandera as pa
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 import wblca_benchmark_v2_data_prep.metadata.general as utils
-from wblca_benchmark_v2_data_prep.metadata.det_schema import (
-    get_project_det_schema,
-    get_energy_det_schema,
-)
+import wblca_benchmark_v2_data_prep.metadata.det_schema as det_schema
+import wblca_benchmark_v2_data_prep.metadata.schema_cache as schema_cache
+import wblca_benchmark_v2_data_prep.metadata.validate as validate
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 
 
 def test_det(project_or_energy: str):
     """
     This function does the following:
 
-    - Tests values using pandera
+    - Tests values using pandera, skipping templates that passed before if
+      incremental builds are enabled, in jobs worker processes
     - Outputs key logging information
+    - Writes the failure cases of all templates to one table
 
     """
 
@@ -48,9 +49,12 @@ def test_det(project_or_energy: str):
 
     # set module level local variables from config
     read_data_directory = config_dict.get("read_data_directory")
+    jobs = config_dict.get("jobs") or 1
+    full_validation = config_dict.get("full_validation", False)
 
     # set project or energy level local variables from config
     read_data_filter = project_or_energy_flag.get("read_data_filter")
+    failure_cases_file = project_or_energy_flag.get("failure_cases_file")
 
     # set paths
     read_data_directory_path = main_directory.joinpath(read_data_directory).glob(
@@ -58,27 +62,52 @@ def test_det(project_or_energy: str):
     )
     main_test_logger.info("End configuration.")
 
-    if project_or_energy == "project":
-        schema = get_project_det_schema()
-    elif project_or_energy == "energy":
-        schema = get_energy_det_schema()
-    else:
+    if project_or_energy not in ("project", "energy"):
         main_test_logger.error(
             "project_or_energy can only have the inputs project or energy"
         )
         raise ValueError("project_or_energy can only have the inputs project or energy")
+    cache_directory = schema_cache.configured_directory(main_directory)
 
-    for file in read_data_directory_path:
-        # read organized csv
-        test_df = utils.read_csv(file)
-        # dropdown testing
-        try:
-            schema.validate(test_df, lazy=True)
-        except pa.errors.SchemaErrors as e:
-            for error in e.schema_errors:
-                main_test_logger.error(error)
-        main_test_logger.info(
-            "Finished testing schema for firm %s", test_df.attrs.get("name")
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        config_path,
+        f"2_test_{project_or_energy}",
+        [
+            current_file_path,
+            main_directory.joinpath("references/dropdowns.yml"),
+            det_schema,
+            schema_cache,
+            utils,
+            validate,
+        ],
+    )
+
+    files = [
+        file
+        for file in read_data_directory_path
+        if not manifest.is_current(file.name, [file])
+    ]
+    failure_tables = []
+    # dropdown testing
+    for file, validation in zip(
+        files,
+        validate.validate_files(
+            files, project_or_energy, cache_directory, jobs, full_validation
+        ),
+    ):
+        for error in validation.errors:
+            main_test_logger.error(error)
+        if validation.passed:
+            # only passing templates are skipped, errors are logged on every run
+            manifest.record(file.name, [file])
+        else:
+            failure_tables.append(validation.failure_cases)
+        main_test_logger.info("Finished testing schema for firm %s", validation.firm)
+    manifest.save()
+    if failure_cases_file:
+        validate.write_failure_cases(
+            failure_tables, main_directory.joinpath(failure_cases_file)
         )
     return None
 
@@ -6,6 +6,7 @@ from logging import getLogger
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 import wblca_benchmark_v2_data_prep.metadata.clean as cl_utils
 import wblca_benchmark_v2_data_prep.metadata.general as utils
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 
 
 def clean_det(project_or_energy: str):
@@ -18,7 +19,8 @@ def clean_det(project_or_energy: str):
     - Organize lists based on data type
     - Replaces incorrect dropdown values, where applicable
     - Replaces incorrect data types, where applicable
-    - Writes cleaned data entry templates in cleaned directory
+    - Writes cleaned data entry templates in cleaned directory, skipping templates
+      cleaned before if incremental builds are enabled
     """
     current_file_path = Path(__file__)
     main_directory = current_file_path.parents[2]
@@ -100,7 +102,23 @@ def clean_det(project_or_energy: str):
         float_list = [key for (key, value) in dtype_dict.items() if value == "Float64"]
     main_clean_logger.info("End configuration.")
 
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        config_path,
+        f"3_clean_{project_or_energy}",
+        [
+            current_file_path,
+            dropdown_cols_path,
+            dropdown_replacements_path,
+            col_dtypes_path,
+            cl_utils,
+            utils,
+        ],
+    )
+
     for file in read_data_directory_path:
+        if manifest.is_current(file.name, [file]):
+            continue
         main_clean_logger.info("Begin cleaning data entry template %s", file.stem)
         df = utils.read_csv(file)
         if replace_data:
@@ -114,6 +132,11 @@ def clean_det(project_or_energy: str):
         utils.write_to_csv(
             df, write_data_directory_path, cleaned_file_suffix, module_description
         )
+        cleaned_file = write_data_directory_path.joinpath(
+            f"{df.attrs.get('name')}{cleaned_file_suffix}"
+        )
+        manifest.record(file.name, [file], [cleaned_file])
+    manifest.save()
 
 
 if __name__ == "__main__":
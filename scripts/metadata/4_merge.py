@@ -3,10 +3,10 @@
 
 from pathlib import Path
 from logging import getLogger
-import pandas as pd
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 import wblca_benchmark_v2_data_prep.metadata.merge as m_utils
 import wblca_benchmark_v2_data_prep.metadata.general as utils
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 # pylint: disable=W0703, W0719
 
 
@@ -16,9 +16,10 @@ def merge_det():
 
     This function does the following:
 
+    - Finds the project and energy dets of each firm by file name
     - Reads the project and energy dets
-    - Finds the project and energy dets of the same project
-    - Merges them together
+    - Merges them together, skipping firms merged before if incremental builds
+      are enabled
     - Writes merged files to merged directory
     """
     current_file_path = Path(__file__)
@@ -45,29 +46,37 @@ def merge_det():
     )
     module_description = config.get(current_file_path.stem).get("module_description")
     merged_file_suffix = config.get(current_file_path.stem).get("merged_file_suffix")
+    cleaned_file_suffixes = {
+        tab: config.get("3_clean").get(tab).get("cleaned_file_suffix")
+        for tab in ("project", "energy")
+    }
 
     # set paths
     read_data_directory_path = main_directory.joinpath(read_data_directory).glob(
         read_data_filter
     )
-    read_data_directory_for_filtering = main_directory.joinpath(read_data_directory)
     write_data_directory_path = main_directory.joinpath(write_data_directory)
     main_merge_logger.info("End configuration.")
 
-    firm_list = []
     main_merge_logger.info("Collecting firm names.")
-    for file in read_data_directory_path:
-        df = utils.read_csv(file)
-        firm_list.append(df.attrs.get("name"))
+    firm_files = m_utils.index_firms(read_data_directory_path, cleaned_file_suffixes)
     main_merge_logger.info("Collected firm names.")
-    firm_names = pd.Series(firm_list).unique().tolist()
 
-    for firm in firm_names:
+    manifest = manifest_util.configured_manifest(
+        main_directory, config_path, "4_merge", [current_file_path, m_utils, utils]
+    )
+
+    for firm, tab_files in firm_files.items():
+        if set(tab_files) != set(cleaned_file_suffixes):
+            main_merge_logger.error(
+                "Firm %s only has a cleaned %s tab, not merged", firm, *tab_files
+            )
+            continue
+        energy_det = tab_files["energy"]
+        project_det = tab_files["project"]
+        if manifest.is_current(firm, [project_det, energy_det]):
+            continue
         main_merge_logger.info("Merging for firm %s", firm)
-        energy_det = list(read_data_directory_for_filtering.glob(f"*{firm}_energy*"))[0]
-        project_det = list(read_data_directory_for_filtering.glob(f"*{firm}_project*"))[
-            0
-        ]
 
         e_det_df = m_utils.read_energy_csv(energy_det)
 
@@ -87,7 +96,10 @@ def merge_det():
             merged_file_suffix,
             module_description,
         )
+        merged_file = write_data_directory_path.joinpath(f"{firm}{merged_file_suffix}")
+        manifest.record(firm, [project_det, energy_det], [merged_file])
         main_merge_logger.info("Finished merging for firm %s", firm)
+    manifest.save()
 
 
 if __name__ == "__main__":
@@ -7,12 +7,12 @@ from logging import getLogger
 import pandas as pd
 import pandera as pa
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
-from wblca_benchmark_v2_data_prep.metadata.det_schema import (
-    get_project_det_schema,
-    get_energy_det_schema,
-)
 import wblca_benchmark_v2_data_prep.metadata.general as utils
 import wblca_benchmark_v2_data_prep.metadata.combine as co_utils
+import wblca_benchmark_v2_data_prep.metadata.det_schema as det_schema
+import wblca_benchmark_v2_data_prep.metadata.schema_cache as schema_cache
+import wblca_benchmark_v2_data_prep.metadata.validate as validate
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 # pylint: disable=W0703, W0719
 
 
@@ -28,6 +28,9 @@ def combine_det():
     - Re-tests dropdown values
     - Writes combined data entry templates to combined directory
 
+    If incremental builds are enabled, nothing is combined when the merged data
+    entry templates are the ones combined before.
+
     """
     warnings.simplefilter(action="ignore", category=FutureWarning)
     current_file_path = Path(__file__)
@@ -57,10 +60,11 @@ def combine_det():
     dataframe_name = config_dict.get("dataframe_name")
     file_suffix = config_dict.get("file_suffix")
     schema_column_removal = config_dict.get("schema_column_removal")
+    full_validation = config_dict.get("full_validation", False)
 
     # set paths
-    read_data_directory_path = main_directory.joinpath(read_data_directory).glob(
-        read_data_filter
+    read_data_directory_path = list(
+        main_directory.joinpath(read_data_directory).glob(read_data_filter)
     )
     col_dtypes_path = main_directory.joinpath(col_dtypes_yaml)
     write_data_directory_path = main_directory.joinpath(write_data_directory)
@@ -69,6 +73,24 @@ def combine_det():
     col_dtypes = utils.read_yaml(col_dtypes_path)
     main_combine_logger.info("End configuration.")
 
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        config_path,
+        "5_combine",
+        [
+            current_file_path,
+            col_dtypes_path,
+            main_directory.joinpath("references/dropdowns.yml"),
+            co_utils,
+            det_schema,
+            schema_cache,
+            utils,
+            validate,
+        ],
+    )
+    if manifest.is_current(dataframe_name, read_data_directory_path):
+        return
+
     # read merged dets
     df_list = []
     main_combine_logger.info("Begin reading all merged data entry templates.")
@@ -90,14 +112,16 @@ def combine_det():
 
     # schema updates
     main_combine_logger.info("Create new schema for combined data entry templates.")
-    project_schema = get_project_det_schema()
-    energy_schema = get_energy_det_schema().remove_columns(schema_column_removal)
+    project_schema = schema_cache.configured_schema(main_directory, "project")
+    energy_schema = schema_cache.configured_schema(
+        main_directory, "energy"
+    ).remove_columns(schema_column_removal)
     schema = project_schema.add_columns(energy_schema.columns)
 
     # validate final det
     try:
         main_combine_logger.info("Validating final combined schema.")
-        schema.validate(final_df, lazy=True)
+        validate.validate_frame(schema, final_df, full_validation)
     except pa.errors.SchemaErrors as e:
         for error in e.schema_errors:
             main_combine_logger.warning(error)
@@ -107,6 +131,9 @@ def combine_det():
     utils.write_to_csv(
         final_df, write_data_directory_path, file_suffix, module_description
     )
+    combined_file = write_data_directory_path.joinpath(f"{dataframe_name}{file_suffix}")
+    manifest.record(dataframe_name, read_data_directory_path, [combined_file])
+    manifest.save()
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ from logging import getLogger
 from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
 import wblca_benchmark_v2_data_prep.metadata.general as utils
 import wblca_benchmark_v2_data_prep.metadata.finalize as fi_utils
+import wblca_benchmark_v2_data_prep.utils.manifest as manifest_util
 
 
 def finalize_det():
@@ -21,6 +22,9 @@ def finalize_det():
     - Creates new bins for analysis
     - Runs through another set of removing and renaming columns
     - writes file to finalized directory
+
+    If incremental builds are enabled, nothing is finalized when the combined data
+    entry template is the one finalized before.
     """
     current_file_path = Path(__file__)
     main_directory = current_file_path.parents[2]
@@ -72,6 +76,15 @@ the column removal list"
     )
     main_finalize_logger.info("End configuration.")
 
+    manifest = manifest_util.configured_manifest(
+        main_directory,
+        config_path,
+        "6_finalize",
+        [current_file_path, col_finalize_path, fi_utils, utils],
+    )
+    if manifest.is_current("Project_Data_Finalized", [read_data_file_path]):
+        return
+
     # read combined csv
     combined_det = utils.read_csv(read_data_file_path)
     combined_det.attrs = {"name": "Project_Data_Finalized"}
@@ -108,6 +121,15 @@ the column removal list"
     )
     main_finalize_logger.info("Writing csv to data record directory")
     utils.write_to_csv(combined_det, write_data_record_path, file_suffix, "finalized")
+    manifest.record(
+        "Project_Data_Finalized",
+        [read_data_file_path],
+        [
+            write_data_directory_path.joinpath(f"Project_Data_Finalized{file_suffix}"),
+            write_data_record_path.joinpath(f"Project_Data_Finalized{file_suffix}"),
+        ],
+    )
+    manifest.save()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+"""Tests of the compiled writes of filter classes."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from wblca_benchmark_v2_data_prep.lca_results.abstract_filters import AbstractFilter
+from wblca_benchmark_v2_data_prep.lca_results.decision_table import DecisionTable
+
+
+class _Filter(AbstractFilter):
+    """Writes "Other" to the entries of a mask with and_loc and "Wall" with or_loc."""
+
+    def __init__(self, and_mask: pd.Series, or_mask: pd.Series):
+        super().__init__("MQ_1")
+        self.and_mask = and_mask
+        self.or_mask = or_mask
+
+    def filtering(self, df, all_filters) -> None:
+        self.and_loc(df, "Other", [self.and_mask])
+        self.or_loc(df, "Wall", [self.or_mask])
+
+
+def _compiled_and_direct(values, and_mask, or_mask):
+    """Run _Filter on a DataFrame directly and through a DecisionTable."""
+    direct = pd.DataFrame({"MQ_1": values})
+    _Filter(pd.Series(and_mask), pd.Series(or_mask)).filtering(direct, {})
+    table = DecisionTable(pd.DataFrame({"MQ_1": values}))
+    _Filter(pd.Series(and_mask), pd.Series(or_mask)).filtering(table, {})
+    return table.apply(), direct
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.Series([np.nan, np.nan]),
+        pd.Series([1, 2]),
+        pd.Series(["Beam", "Slab"]),
+        pd.Series([], dtype="float64"),
+    ],
+)
+@pytest.mark.parametrize(
+    "and_mask, or_mask",
+    [
+        ([False, False], [False, False]),
+        ([True, False], [False, False]),
+        ([True, False], [True, True]),
+    ],
+)
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_compiled_writes_match_loc_writes(values, and_mask, or_mask):
+    and_mask, or_mask = and_mask[: len(values)], or_mask[: len(values)]
+
+    compiled, direct = _compiled_and_direct(values, and_mask, or_mask)
+
+    assert compiled["MQ_1"].dtype == direct["MQ_1"].dtype
+    pd.testing.assert_frame_equal(compiled, direct)
+
+
+def test_nan_filter_raises_on_both_paths():
+    mask = pd.Series([np.nan, np.nan], dtype=object)
+    direct = pd.DataFrame({"MQ_1": [np.nan, np.nan]})
+    with pytest.raises(ValueError):
+        _Filter(mask, pd.Series([False, False])).filtering(direct, {})
+    table = DecisionTable(pd.DataFrame({"MQ_1": [np.nan, np.nan]}))
+    _Filter(mask, pd.Series([False, False])).filtering(table, {})
+    with pytest.raises(ValueError):
+        table.apply()
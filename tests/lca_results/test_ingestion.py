@@ -0,0 +1,86 @@
+"""Tests of the ingestion of raw One Click LCA workbooks."""
+
+from pathlib import Path
+import pandas as pd
+import pytest
+import wblca_benchmark_v2_data_prep.lca_results.clean as clean_util
+import wblca_benchmark_v2_data_prep.lca_results.ingestion as ingestion_util
+import wblca_benchmark_v2_data_prep.lca_results.run as lca_run
+import wblca_benchmark_v2_data_prep.utils.artifacts as artifacts
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+MAIN_DIRECTORY = Path(__file__).parents[2]
+
+IMPACTS = [
+    "Acidification kg SO₂e",
+    "Eutrophication kg Ne",
+    "Ozone Depletion kg CFC11e",
+    "Formation of tropospheric ozone kg O3e",
+    "Depletion of nonrenewable energy MJ",
+    "Global warming kg CO₂e",
+    "Biogenic carbon storage kg CO₂e bio",
+    "Mass of raw materials kg",
+]
+
+
+def _write_workbook(file_path: Path) -> None:
+    """Write a merged One Click LCA export with two design options."""
+    workbook = pd.DataFrame(
+        {
+            "Section": ["Foundations", "Walls"],
+            "Resource type": ["Concrete", "Timber"],
+            "Name": ["Ready-mix concrete", "Glulam beam"],
+            "csiMasterformat": [3, 6],
+            "Comment": ["removed", "by harmonization"],
+            "file_name_before_merge": ["model_a.xlsx", "model_b.xlsx"],
+            "Design Name": ["Baseline", "Mass timber"],
+            **{impact: [1.0, 2.0] for impact in IMPACTS},
+        }
+    )
+    workbook.to_excel(file_path, index=False, engine="openpyxl")
+
+
+def test_skipped_columns_keep_the_columns_cleaning_reads(tmp_path):
+    config_harmonize = gen.read_yaml(MAIN_DIRECTORY.joinpath("references/config_harmonize.yml"))
+    ingestion = ingestion_util.ExcelIngestion(
+        skip_columns=frozenset(config_harmonize["column_removal_oneclick"]), engine="openpyxl"
+    )
+    workbook_path = tmp_path.joinpath("model.xlsx")
+    _write_workbook(workbook_path)
+
+    (cleaned_df,) = lca_run.clean_oneclick_files([workbook_path], ingestion)
+
+    assert "Comment" not in cleaned_df.columns
+    assert cleaned_df["file_name_before_merge"].to_list() == ["model_a.xlsx", "model_b.xlsx"]
+    assert cleaned_df["Design Name"].to_list() == ["Baseline", "Mass timber"]
+
+
+def test_cached_workbook_keeps_the_columns_cleaning_reads(tmp_path):
+    ingestion = ingestion_util.ExcelIngestion(
+        cache_directory=tmp_path.joinpath("cache"),
+        skip_columns=frozenset({"Comment", "file_name_before_merge", "Design Name"}),
+        engine="openpyxl",
+    )
+    workbook_path = tmp_path.joinpath("model.xlsx")
+    _write_workbook(workbook_path)
+
+    parsed_df = ingestion.read(workbook_path)
+    cached_df = ingestion.read(workbook_path)
+
+    pd.testing.assert_frame_equal(parsed_df, cached_df)
+    assert cached_df["Design Name"].to_list() == ["Baseline", "Mass timber"]
+
+
+def test_cleaned_workbook_matches_the_file_of_1_clean(tmp_path):
+    pytest.importorskip("pyarrow")
+    parquet = artifacts.ArtifactFormat("parquet")
+    ingestion = ingestion_util.ExcelIngestion(engine="openpyxl")
+    workbook_path = tmp_path.joinpath("model.xlsx")
+    _write_workbook(workbook_path)
+
+    (cleaned_df,) = lca_run.clean_oneclick_files([workbook_path], ingestion)
+    # 1_clean writes the cleaned DataFrame with its index, 3_map_elements reads it
+    script_df = clean_util.clean_oneclick_df(ingestion.read(workbook_path), workbook_path)
+    cleaned_file = parquet.write(script_df, tmp_path, workbook_path.stem)
+
+    pd.testing.assert_frame_equal(cleaned_df, parquet.read(cleaned_file))
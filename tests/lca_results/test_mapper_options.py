@@ -0,0 +1,31 @@
+"""Tests of the filter engine options of the mappers."""
+
+from pathlib import Path
+from wblca_benchmark_v2_data_prep.lca_results.MappingImplementation import (
+    configured_mapper_options,
+)
+
+MAIN_DIRECTORY = Path(__file__).parents[2]
+
+
+def test_shipped_config_maps_with_the_filters_as_written():
+    options = configured_mapper_options(MAIN_DIRECTORY)
+
+    assert options == {
+        "filter_options": {"single_pass": False, "factorize": False, "packed": False},
+        "compile_rules": False,
+    }
+
+
+def test_enabled_options_are_passed_on(tmp_path):
+    tmp_path.joinpath("references").mkdir()
+    tmp_path.joinpath("references/config_lca_results.yml").write_text(
+        "filter_engine:\n  factorize: true\n  compile_rules: true\n", encoding="utf-8"
+    )
+
+    options = configured_mapper_options(tmp_path)
+
+    assert options == {
+        "filter_options": {"single_pass": False, "factorize": True, "packed": False},
+        "compile_rules": True,
+    }
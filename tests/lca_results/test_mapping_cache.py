@@ -0,0 +1,57 @@
+"""Tests of the mapping cache shared by worker processes."""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import pandas as pd
+import pytest
+import wblca_benchmark_v2_data_prep.lca_results.mapping_cache as cache_util
+
+
+def _cache(path: Path) -> cache_util.MappingCache:
+    return cache_util.MappingCache(
+        path=path, key_columns=["Material Name"], label_columns=["MQ_1"], version="test"
+    )
+
+
+def _classify(df: pd.DataFrame) -> pd.DataFrame:
+    return df.assign(MQ_1=df["Material Name"].str.upper())
+
+
+def _map_materials(path: Path, worker: int) -> None:
+    """Map materials of one worker, saving after each model like the stages do."""
+    cache = _cache(path)
+    for model in range(5):
+        names = [f"material {worker}-{model}-{entry}" for entry in range(3)]
+        cache.map(pd.DataFrame({"Material Name": names}), _classify)
+
+
+def test_workers_keep_each_others_entries(tmp_path):
+    path = tmp_path.joinpath("oneclick_materials.pkl")
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_map_materials, [path] * 4, range(4)))
+
+    table = _cache(path).table
+    assert len(table) == 4 * 5 * 3
+    assert table["Material Name"].is_unique
+    assert (table["MQ_1 (mapped)"] == table["Material Name"].str.upper()).all()
+    assert not path.with_suffix(".lock").exists()
+
+
+def _classify_float(df: pd.DataFrame) -> pd.DataFrame:
+    """Write MQ_1 of concrete with loc, as the filter classes do."""
+    df = df.copy()
+    df.loc[df["Material Name"].str.contains("concrete"), "MQ_1"] = "Concrete"
+    return df
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_rerun_of_cached_entries_keeps_the_labels(tmp_path):
+    df = pd.DataFrame(
+        {"Material Name": ["concrete slab", "glulam beam"], "MQ_1": [float("nan")] * 2}
+    )
+
+    first = _cache(tmp_path.joinpath("materials.pkl")).map(df, _classify_float)
+    rerun = _cache(tmp_path.joinpath("materials.pkl")).map(df, _classify_float)
+
+    pd.testing.assert_frame_equal(first, _classify_float(df))
+    pd.testing.assert_frame_equal(rerun, _classify_float(df))
@@ -0,0 +1,123 @@
+"""Columnar cache of the harmonized lca results read by the data_record scripts.
+
+The data_record scripts each use a few columns of combined_harmonized, the
+largest file of the pipeline, which a csv artifact can only give by parsing all
+of it. HarmonizedCache parses it once into an uncompressed Arrow IPC file next to
+the other caches, keyed by the sha256 of the harmonized file, and reads the
+columns asked for from a memory map of that file, so only the pages of those
+columns are loaded. The cache keeps the dtypes the file is read with, including
+the categories of utils.dtypes, and is built again whenever the harmonized file
+or its declared dtypes change. Requires pyarrow.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from logging import getLogger
+from pathlib import Path
+from typing import Optional
+import pandas as pd
+import wblca_benchmark_v2_data_prep.utils.artifacts as artifacts
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+cache_logger = getLogger("data_record.harmonized_cache")
+
+
+@lru_cache(maxsize=4)
+def _open(cache_path: Path):
+    """Memory-map an Arrow IPC file, once per process."""
+    # pylint: disable=C0415
+    import pyarrow as pa
+    from pyarrow import ipc
+
+    with pa.memory_map(str(cache_path), "r") as source:
+        return ipc.open_file(source).read_all()
+
+
+@dataclass(frozen=True)
+class HarmonizedCache:
+    """Reads columns of the harmonized lca results through a memory-mapped copy.
+
+    Attributes:
+        directory (Optional[Path]): Directory of the cached copies, None to read
+            the harmonized file itself every time
+        artifact_format (artifacts.ArtifactFormat): Format of the harmonized file
+    """
+
+    directory: Optional[Path] = None
+    artifact_format: artifacts.ArtifactFormat = artifacts.CSV
+
+    def _key(self, file_path: Path) -> str:
+        """Hash of the file content and of the dtypes it is read with."""
+        # pylint: disable=C0415
+        import pyarrow as pa
+
+        digest = hashlib.sha256(gen.file_digest(file_path).encode())
+        dtypes = (self.artifact_format.dtypes or {}).get(file_path.stem, {})
+        digest.update(json.dumps(dtypes, sort_keys=True).encode())
+        digest.update(f"{pd.__version__};{pa.__version__}".encode())
+        return digest.hexdigest()[:32]
+
+    def _build(self, file_path: Path, cache_path: Path):
+        """Write the columnar copy of a harmonized file."""
+        # pylint: disable=C0415
+        import pyarrow as pa
+        from pyarrow import ipc
+
+        cache_logger.info("Caching %s", file_path.name)
+        table = artifacts.arrow_table(self.artifact_format.read(file_path))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for stale_path in self.directory.glob("*.arrow"):
+            if stale_path.name.rsplit(".", 2)[0] == file_path.stem:
+                stale_path.unlink()
+        temporary_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with pa.OSFile(str(temporary_path), "wb") as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(temporary_path, cache_path)
+
+    def read(self, file_path: Path, columns: Optional[list] = None) -> pd.DataFrame:
+        """Read columns of a harmonized file, caching it first if it changed.
+
+        Args:
+            file_path (Path): Path of the harmonized file
+            columns (Optional[list]): Only read these columns, in this order, all
+                columns if None. Columns not in the file are skipped.
+
+        Returns:
+            pd.DataFrame: Columns of the harmonized file
+        """
+        if self.directory is None:
+            if columns is not None:
+                present = set(self.artifact_format.read_columns(file_path))
+                columns = [column for column in columns if column in present]
+            return self.artifact_format.read(file_path, columns=columns)
+
+        cache_path = self.directory.joinpath(f"{file_path.stem}.{self._key(file_path)}.arrow")
+        if not cache_path.exists():
+            self._build(file_path, cache_path)
+        table = _open(cache_path)
+        if columns is not None:
+            table = table.select([column for column in columns if column in table.column_names])
+        cache_logger.info("Read %s columns of %s from cache", table.num_columns, file_path.name)
+        return table.to_pandas()
+
+
+def configured_cache(main_directory: Path) -> HarmonizedCache:
+    """Create the cache set in references/config_data_record.yml.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        HarmonizedCache: Cache of the harmonized lca results, reading the file in
+            the configured artifact format
+    """
+    config = gen.read_yaml(main_directory.joinpath("references/config_data_record.yml"))
+    cache_config = config.get("harmonized_cache") or {}
+    directory = None
+    if cache_config.get("enabled", False):
+        directory = main_directory.joinpath(cache_config["directory"])
+    return HarmonizedCache(directory, artifacts.configured_format(main_directory))
@@ -87,16 +87,18 @@ def clean_internal_data(
 
 def write_internal_data_to_excel(
     internal_data: pd.DataFrame, public_dataset_directory: Path
-) -> None:
+) -> Path:
     """Writes internal data to excel. Name of file is fixed to internal_data.xlsx.
 
     Args:
         internal_data (pd.DataFrame): Internal data to be written to excel.
         public_dataset_directory (Path): Target path of internal data.
+
+    Returns:
+        Path: Path of the written file.
     """
-    with pd.ExcelWriter(
-        public_dataset_directory.joinpath("internal_data.xlsx")
-    ) as writer:
+    file_path = public_dataset_directory.joinpath("internal_data.xlsx")
+    with pd.ExcelWriter(file_path) as writer:
         internal_data.to_excel(
             writer,
             sheet_name="project metadata",
@@ -107,3 +109,4 @@ def write_internal_data_to_excel(
         internal_data_logger.info(
             "Internal data has beeen saved to %s", public_dataset_directory
         )
+    return file_path
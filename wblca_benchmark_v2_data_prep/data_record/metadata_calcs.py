@@ -539,22 +539,27 @@ def missing_str_loc(project_metadata: pd.DataFrame, column_name: str) -> None:
 
 def write_buildings_metadata_to_excel(
     project_metadata: pd.DataFrame, public_dataset_directory: Path
-) -> None:
+) -> Path:
     """Writes buildings metadata to excel.
     Name of file is fixed to buildings_metadata_{Date}.xlsx.
 
     Args:
         project_metadata (pd.DataFrame): project metadata of the data record.
         public_dataset_directory (Path): Target path of buildings_metadata
+
+    Returns:
+        Path: Path of the written file.
     """
 
     date_suffix = datetime.today().strftime("%m-%d-%Y")
-    with pd.ExcelWriter(
-        public_dataset_directory.joinpath(f"buildings_metadata_{date_suffix}.xlsx")
-    ) as writer:
+    file_path = public_dataset_directory.joinpath(
+        f"buildings_metadata_{date_suffix}.xlsx"
+    )
+    with pd.ExcelWriter(file_path) as writer:
         project_metadata.to_excel(writer, sheet_name="project metadata", index=True)
 
         format_buildings_metadata(writer=writer)
         metadata_logger.info(
             "Buildings_metadata has beeen saved to %s", public_dataset_directory
         )
+    return file_path
@@ -89,13 +89,14 @@ def create_tool_specific_columns(
     lca_full_results_logger.info(
         "Create tool specific columns based on Cat_Ele_2 and Cat_Mat_2."
     )
+    # labels may be read as categories, which take no "NA" or "NULL" not read
+    cat_ele_2 = original_wblca_output["Cat_Ele_2"].astype(object)
+    cat_mat_2 = original_wblca_output["Cat_Mat_2"].astype(object)
     output_w_new_cols = (
-        merged_wblca_output.assign(
-            tally_revit_building_element=original_wblca_output["Cat_Ele_2"]
-        )
-        .assign(tally_material_group=original_wblca_output["Cat_Mat_2"])
-        .assign(oneclick_omniclass=original_wblca_output["Cat_Ele_2"])
-        .assign(oneclick_resource_type=original_wblca_output["Cat_Mat_2"])
+        merged_wblca_output.assign(tally_revit_building_element=cat_ele_2)
+        .assign(tally_material_group=cat_mat_2)
+        .assign(oneclick_omniclass=cat_ele_2)
+        .assign(oneclick_resource_type=cat_mat_2)
     )
 
     # Creates NA values based on tool column in lca_results.
@@ -132,7 +133,9 @@ def handle_nulls(output_w_new_cols: pd.DataFrame) -> pd.DataFrame:
         "Stored Biogenic Carbon"
     ].fillna(0)
 
-    output_w_new_cols["Cat_Mat_1"] = output_w_new_cols["Cat_Mat_1"].fillna("NULL")
+    output_w_new_cols["Cat_Mat_1"] = (
+        output_w_new_cols["Cat_Mat_1"].astype(object).fillna("NULL")
+    )
 
     output_w_new_cols["tally_revit_building_element"] = output_w_new_cols[
         "tally_revit_building_element"
@@ -189,23 +192,27 @@ def create_mui(output_w_new_cols: pd.DataFrame) -> pd.DataFrame:
 
 def write_full_lca_results_to_excel(
     final_output: pd.DataFrame, public_dataset_directory: Path
-) -> None:
+) -> Path:
     """Writes full_lca_results to excel.
     Name of file is fixed to full_lca_results_{Date}.xlsx.
 
     Args:
         output_w_intensity_cols (pd.DataFrame): full_lca_results of data record
         public_dataset_directory (Path): Target path of full_lca_results.
+
+    Returns:
+        Path: Path of the written file.
     """
 
     date_suffix = datetime.today().strftime("%m-%d-%Y")
-    with pd.ExcelWriter(
-        public_dataset_directory.joinpath(f"full_lca_results_{date_suffix}.xlsx"),
-        engine="xlsxwriter",
-    ) as writer:
+    file_path = public_dataset_directory.joinpath(
+        f"full_lca_results_{date_suffix}.xlsx"
+    )
+    with pd.ExcelWriter(file_path, engine="xlsxwriter") as writer:
         final_output.to_excel(writer, sheet_name="lca_full_results", index=False)
 
         format_lca_full_results(writer=writer)
         lca_full_results_logger.info(
             "lca_full_results has beeen saved to %s", public_dataset_directory
         )
+    return file_path
@@ -0,0 +1,156 @@
+"""Data record pipeline on DataFrames in memory, see scripts/data_record.
+
+The functions compute the files of the data record from the finalized project
+data and the harmonized lca results passed in memory instead of reading the files
+written by the metadata and lca_results scripts. The finalized project data and
+the internal data are passed on the way the scripts read them from their csv and
+excel files, the harmonized lca results the way a parquet artifact reads, with
+its CLF Model ID index as a column.
+"""
+
+from io import BytesIO, StringIO
+from pathlib import Path
+from logging import getLogger
+import pandas as pd
+import wblca_benchmark_v2_data_prep.data_record.internal_data_calcs as internal_calc
+import wblca_benchmark_v2_data_prep.data_record.metadata_calcs as meta
+import wblca_benchmark_v2_data_prep.data_record.results_calcs as results_calc
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+run_logger = getLogger("data_record.run")
+
+
+def _config(main_directory: Path) -> dict:
+    """Read references/config_data_record.yml."""
+    config = gen.read_yaml(main_directory.joinpath("references/config_data_record.yml"))
+    assert config is not None, "The config dictionary could not be set"
+    return config
+
+
+def as_read_internal_data(internal_data: pd.DataFrame) -> pd.DataFrame:
+    """Internal data as pd.read_excel reads internal_data.xlsx.
+
+    Args:
+        internal_data (pd.DataFrame): Internal data from create_internal_data
+
+    Returns:
+        pd.DataFrame: Internal data with project_index as first column
+    """
+    buffer = BytesIO()
+    with pd.ExcelWriter(buffer) as writer:
+        internal_data.to_excel(
+            writer, sheet_name="project metadata", index_label="project_index"
+        )
+    buffer.seek(0)
+    return pd.read_excel(buffer, index_col=False)
+
+
+def create_internal_data(main_directory: Path, finalized_det: pd.DataFrame) -> pd.DataFrame:
+    """Create the internal data from the finalized project data.
+
+    See scripts/data_record/1_internal_data.py.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+        finalized_det (pd.DataFrame): Finalized project data from metadata
+
+    Returns:
+        pd.DataFrame: Internal data of the data record
+    """
+    config = _config(main_directory)
+    dets = pd.read_csv(StringIO(finalized_det.to_csv()), index_col=False)
+    internal_data = internal_calc.create_internal_data(
+        accepted_design_phases=config.get("design_phases"), dets=dets
+    )
+    return internal_calc.clean_internal_data(
+        internal_data=internal_data,
+        column_value_replace=config.get("column_value_replace"),
+        public_dataset_column_renaming=config.get("public_dataset_column_renaming"),
+        metadata_col_order=config.get("internal_data_col_order"),
+    )
+
+
+def create_buildings_metadata(
+    main_directory: Path, wblca_output: pd.DataFrame, internal_data: pd.DataFrame
+) -> pd.DataFrame:
+    """Create the buildings metadata from the lca results and internal data.
+
+    See scripts/data_record/2_buildings_metadata.py.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+        wblca_output (pd.DataFrame): Harmonized lca results with a CLF Model ID column
+        internal_data (pd.DataFrame): Internal data as read by as_read_internal_data
+
+    Returns:
+        pd.DataFrame: Buildings metadata of the data record
+    """
+    config = _config(main_directory)
+    scope_type = config.get("scope_type")
+    internal_data = internal_data.set_index("project_index")
+
+    excluding_d_wblca_output = wblca_output.loc[
+        wblca_output["Life Cycle Stage"].str.contains("A|B|C")
+    ].loc[wblca_output["Cat_Ele_1"].isin(scope_type)]
+    project_metadata = meta.create_total_impact_columns(
+        excluding_d_wblca_output=excluding_d_wblca_output,
+        impact_type_list=config.get("impact_type"),
+        internal_data=internal_data,
+    )
+    project_metadata = meta.round_bldg_areas(project_metadata=project_metadata)
+    project_metadata = meta.create_intensity_columns(project_metadata=project_metadata)
+
+    project_metadata = (
+        project_metadata.merge(
+            internal_data.reset_index()[["project_index", "clf_model_id"]],
+            right_on="clf_model_id",
+            left_on="clf_model_id",
+        )
+        .set_index("project_index")
+        .sort_index()
+        .drop(columns=["clf_proj_id", "clf_model_id", "clf_firm_id"])
+        .rename(columns=config.get("buildings_metadata_impact_renaming"))
+    )
+    return meta.null_override_project_metadata(project_metadata)
+
+
+def create_lca_full_results(
+    main_directory: Path, wblca_output: pd.DataFrame, internal_data: pd.DataFrame
+) -> pd.DataFrame:
+    """Create the full lca results from the lca results and internal data.
+
+    See scripts/data_record/3_lca_full_results.py.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+        wblca_output (pd.DataFrame): Harmonized lca results with a CLF Model ID column
+        internal_data (pd.DataFrame): Internal data as read by as_read_internal_data
+
+    Returns:
+        pd.DataFrame: Full lca results of the data record
+    """
+    config = _config(main_directory)
+    internal_data_for_area = results_calc.prep_internal_data_for_area_calcs(internal_data)
+    prepped_wblca_output = results_calc.prep_internal_wblca_output(
+        internal_data_for_area=internal_data_for_area,
+        wblca_output=wblca_output,
+        scope_type=config.get("scope_type"),
+    )
+    merged_wblca_output = prepped_wblca_output.merge(
+        internal_data_for_area, left_on="CLF Model ID", right_index=True
+    )
+    output_w_new_cols = results_calc.create_tool_specific_columns(
+        original_wblca_output=wblca_output, merged_wblca_output=merged_wblca_output
+    )
+    output_w_new_cols = meta.round_bldg_areas(project_metadata=output_w_new_cols)
+    output_w_new_cols = results_calc.handle_nulls(output_w_new_cols=output_w_new_cols)
+    output_w_mui = results_calc.create_mui(output_w_new_cols=output_w_new_cols)
+
+    final_output = output_w_mui.rename(columns=config.get("full_results_column_renaming"))[
+        config.get("full_results_column_list")
+    ]
+    run_logger.info("Created lca_full_results.")
+    return final_output.sort_values(
+        ["project_index", "omniclass_element", "life_cycle_stage", "service_life"],
+        ascending=[True, False, True, True],
+    )
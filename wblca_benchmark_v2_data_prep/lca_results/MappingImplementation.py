@@ -3,13 +3,21 @@
 
 from abc import abstractmethod
 from pathlib import Path
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from logging import getLogger
+from typing import Optional
 import pandas as pd
 from wblca_benchmark_v2_data_prep.lca_results.abstract_filters import AbstractFilter
+from wblca_benchmark_v2_data_prep.lca_results.decision_table import DecisionTable
+from wblca_benchmark_v2_data_prep.lca_results.profiling import FilterProfiler
 import wblca_benchmark_v2_data_prep.lca_results.all_ele_filters as ele
 import wblca_benchmark_v2_data_prep.lca_results.all_mat_filters as mat
 import wblca_benchmark_v2_data_prep.lca_results.refined_mat_filters as ref
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+# options of the filter_engine section passed on to the FilterRegistry
+FILTER_OPTIONS = ("single_pass", "factorize", "packed")
 
 
 @dataclass
@@ -19,12 +27,26 @@ class Mapper:
     Attributes:
         df (pd.DataFrame): DataFrame of raw WBLCA entries
         _filter_type(AbstractFilter): Filter class
-        _all_info (dict): Dictionary of all possible filters for raw WBLCA entries
+        _all_info (Mapping): All possible filters for raw WBLCA entries, usually a
+            FilterRegistry that only evaluates the filters requested by _filter_type
+        filter_options (dict): Options passed on to the FilterRegistry, e.g.
+            {"single_pass": True} to scan each column once for all its string filters
+            or {"factorize": True} to evaluate string filters on distinct values only
+            or {"packed": True} to keep boolean filters as packed bits
+        compile_rules (bool): Record the writes of each filter class in a DecisionTable
+            and apply them in one vectorized assignment instead of one loc per rule
+        profiler (Optional[FilterProfiler]): Records the time and rows of every
+            filter class and filter, None to run without profiling
+        _changed_columns (set): Columns written since the filters were last refreshed
     """
 
     df: pd.DataFrame = field(repr=False)
     _filter_type: AbstractFilter = None
-    _all_info: dict = field(default_factory=dict, repr=False)
+    _all_info: Mapping = field(default_factory=dict, repr=False)
+    filter_options: dict = field(default_factory=dict, repr=False)
+    compile_rules: bool = False
+    profiler: Optional[FilterProfiler] = field(default=None, repr=False)
+    _changed_columns: set = field(default_factory=set, init=False, repr=False)
 
     @abstractmethod
     def __post_init__(self):
@@ -44,7 +66,44 @@ class Mapper:
             "Filtering using the following class: %s",
             self._filter_type.__class__.__name__,
         )
-        self.df = self._filter_type.filtering(self.df, self._all_info)
+        if self.profiler is not None:
+            self.df = self.profiler.profile(
+                self._filter_type, self.df, self._all_info, self._run_filter
+            )
+        else:
+            self.df = self._run_filter(self._all_info)
+        self._changed_columns.add(self._filter_type.column_name_to_change)
+
+    def _run_filter(self, all_filters: Mapping) -> pd.DataFrame:
+        """Run the filter class with the filters provided.
+
+        Args:
+            all_filters (Mapping): Filters available to the filter class
+
+        Returns:
+            pd.DataFrame: Filtered DataFrame
+        """
+        if self.compile_rules:
+            table = DecisionTable(self.df)
+            self._filter_type.filtering(table, all_filters)
+            return table.apply()
+        return self._filter_type.filtering(self.df, all_filters)
+
+    def refresh_filters(self) -> None:
+        """Start a new mapping pass on the current DataFrame.
+
+        Filters keep describing the DataFrame as it was when the mapper was created
+        or last refreshed. Refreshing only recomputes the filters on columns written
+        since, e.g. MQ_1 and MQ_2 between the chained material quantity passes,
+        instead of creating a new mapper that rebuilds every filter.
+        """
+        discarded = self._all_info.refresh(self.df, self._changed_columns)
+        self.logger.info(
+            "Refreshed filters on %s, %s filters to recompute.",
+            sorted(self._changed_columns),
+            len(discarded),
+        )
+        self._changed_columns.clear()
 
     def write_csv(self, write_csv_path: Path):
         """Write csv of DataFrame of raw WBLCA entries.
@@ -83,7 +142,7 @@ class TallyElementMapper(Mapper):
 
     def __post_init__(self):
         super().__post_init__()
-        self._all_info = ele.create_all_tally_filters(self.df)
+        self._all_info = ele.create_all_tally_filters(self.df, **self.filter_options)
         self.logger.info("%s class created for mapping.", self.__class__.__name__)
 
 
@@ -92,7 +151,7 @@ class OneClickElementMapper(Mapper):
 
     def __post_init__(self):
         super().__post_init__()
-        self._all_info = ele.create_all_oneclick_filters(self.df)
+        self._all_info = ele.create_all_oneclick_filters(self.df, **self.filter_options)
         self.logger.info("%s class created for mapping.", self.__class__.__name__)
 
 
@@ -101,7 +160,7 @@ class TallyMaterialQuantityMapper(Mapper):
 
     def __post_init__(self):
         super().__post_init__()
-        self._all_info = mat.create_all_tally_filters(self.df)
+        self._all_info = mat.create_all_tally_filters(self.df, **self.filter_options)
         self.logger.info("%s class created for mapping.", self.__class__.__name__)
 
 
@@ -110,7 +169,7 @@ class OneClickMaterialQuantityMapper(Mapper):
 
     def __post_init__(self):
         super().__post_init__()
-        self._all_info = mat.create_all_oneclick_filters(self.df)
+        self._all_info = mat.create_all_oneclick_filters(self.df, **self.filter_options)
         self.logger.info("%s class created for mapping.", self.__class__.__name__)
 
 
@@ -119,7 +178,7 @@ class TallyRefinedElementMapper(Mapper):
 
     def __post_init__(self):
         super().__post_init__()
-        self._all_info = ref.create_all_refined_filters(self.df)
+        self._all_info = ref.create_all_refined_filters(self.df, **self.filter_options)
         self.logger.info("%s class created for mapping.", self.__class__.__name__)
 
 
@@ -128,5 +187,25 @@ class OneClickRefinedElementMapper(Mapper):
 
     def __post_init__(self):
         super().__post_init__()
-        self._all_info = ref.create_all_refined_filters(self.df)
+        self._all_info = ref.create_all_refined_filters(self.df, **self.filter_options)
         self.logger.info("%s class created for mapping.", self.__class__.__name__)
+
+
+def configured_mapper_options(main_directory: Path) -> dict:
+    """Get the filter engine of the mappers set in references/config_lca_results.yml.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        dict: filter_options and compile_rules arguments of Mapper, every option
+            disabled unless enabled in the filter_engine section
+    """
+    config = gen.read_yaml(main_directory.joinpath("references/config_lca_results.yml"))
+    engine_config = config.get("filter_engine") or {}
+    return {
+        "filter_options": {
+            option: bool(engine_config.get(option, False)) for option in FILTER_OPTIONS
+        },
+        "compile_rules": bool(engine_config.get("compile_rules", False)),
+    }
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from typing import Dict, List
 from functools import reduce
 import pandas as pd
+from wblca_benchmark_v2_data_prep.lca_results.decision_table import DecisionTable
+from wblca_benchmark_v2_data_prep.lca_results.packed_mask import PackedMask
 
 
 class AbstractFilter(ABC):
@@ -44,12 +46,7 @@ class AbstractFilter(ABC):
         and_filters_reduced = reduce(
             lambda series_one, series_two: series_one & series_two, and_filters
         )
-        # change columns to object if the column type is float
-        if df[self.column_name_to_change].dtype == "float64":
-            df[self.column_name_to_change] = df[self.column_name_to_change].astype(
-                object
-            )
-        df.loc[and_filters_reduced, self.column_name_to_change] = result
+        self._assign(df, result, and_filters_reduced, as_object=True)
 
     def or_loc(
         self, df: pd.DataFrame, result: str, or_filters: List[pd.Series]
@@ -72,7 +69,7 @@ class AbstractFilter(ABC):
             lambda series_one, series_two: series_one | series_two, or_filters
         )
 
-        df.loc[or_filters_reduced, self.column_name_to_change] = result
+        self._assign(df, result, or_filters_reduced)
 
     def and_or_loc(
         self,
@@ -113,4 +110,27 @@ class AbstractFilter(ABC):
 
         and_or_filters = and_filters_reduced & or_filters_reduced
 
-        df.loc[and_or_filters, self.column_name_to_change] = result
+        self._assign(df, result, and_or_filters)
+
+    def _assign(
+        self, df: pd.DataFrame, result: str, mask: pd.Series, as_object: bool = False
+    ) -> None:
+        """Write result to the column to change, or record it if df is a DecisionTable.
+
+        Args:
+            df (pd.DataFrame): DataFrame of One Click entries or a DecisionTable
+            result (str): Value to be applied to CLF Omni column
+            mask (pd.Series): Combined filter selecting the entries to change
+            as_object (bool): Change float columns to object before writing
+        """
+        if isinstance(df, DecisionTable):
+            df.add_rule(self.column_name_to_change, mask, result, as_object)
+            return
+        if isinstance(mask, PackedMask):
+            mask = mask.to_series()
+        # change columns to object if the column type is float
+        if as_object and df[self.column_name_to_change].dtype == "float64":
+            df[self.column_name_to_change] = df[self.column_name_to_change].astype(
+                object
+            )
+        df.loc[mask, self.column_name_to_change] = result
@@ -0,0 +1,200 @@
+"""Maps the models of a mapping stage together instead of file by file.
+
+Every model file is read into one corpus keyed by CLF Model ID, so each mapper
+runs once over all models instead of once per file. The mapped corpus is written
+as a single file or split back into the per-file outputs of the file by file run.
+"""
+
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+import pandas as pd
+from wblca_benchmark_v2_data_prep.utils.artifacts import CSV, ArtifactFormat
+from wblca_benchmark_v2_data_prep.utils.file_io import WriteBehind, read_ahead
+from wblca_benchmark_v2_data_prep.utils.manifest import BuildManifest
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+batch_logger = getLogger("lca_results.batch")
+
+
+@dataclass
+class ModelFile:
+    """Model file read into a corpus.
+
+    Attributes:
+        stem (str): Name of the file without suffix
+        columns (list): Columns of the file in order
+        dtypes (pd.Series): Data types of the columns as read from the file
+    """
+
+    stem: str
+    columns: list
+    dtypes: pd.Series
+
+
+def configured_batch(main_directory: Path) -> dict:
+    """Get the batch mapping settings of references/config_lca_results.yml.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        dict: Settings with keys enabled and per_file_outputs
+    """
+    config = gen.read_yaml(main_directory.joinpath("references/config_lca_results.yml"))
+    batch_config = config.get("batch_mapping") or {}
+    return {
+        "enabled": batch_config.get("enabled", False),
+        "per_file_outputs": batch_config.get("per_file_outputs", True),
+    }
+
+
+def read_corpus(
+    files: Iterable[Path], artifact_format: ArtifactFormat = CSV, jobs: int = 1
+) -> tuple:
+    """Read model files into one DataFrame.
+
+    Args:
+        files (Iterable[Path]): Files of models, each with a CLF Model ID column
+        artifact_format (ArtifactFormat): Format of the files
+        jobs (int): Files read at the same time
+
+    Raises:
+        ValueError: Raised if a CLF Model ID is found in more than one file
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, ModelFile]]: Corpus of all entries and the
+            file each CLF Model ID was read from
+    """
+    dfs = []
+    model_files: Dict[str, ModelFile] = {}
+    files = list(files)
+    for file, df in zip(files, read_ahead(artifact_format.read, files, jobs)):
+        model_file = ModelFile(file.stem, list(df.columns), df.dtypes)
+        for model_id in df["CLF Model ID"].unique():
+            if model_id in model_files:
+                raise ValueError(
+                    f"CLF Model ID {model_id} found in {model_files[model_id].stem} "
+                    f"and {file.stem}"
+                )
+            model_files[model_id] = model_file
+        dfs.append(df)
+    if not dfs:
+        return pd.DataFrame(), model_files
+    batch_logger.info("Read %s models from %s files", len(model_files), len(dfs))
+    return pd.concat(dfs, ignore_index=True), model_files
+
+
+def split_corpus(
+    mapped: pd.DataFrame, read_dtypes: pd.Series, model_files: Dict[str, ModelFile]
+) -> Dict[str, pd.DataFrame]:
+    """Split a mapped corpus back into the files its models were read from.
+
+    Columns missing from a file are dropped and columns that were only widened by
+    combining the files, e.g. integers next to missing values, get back their dtype.
+
+    Args:
+        mapped (pd.DataFrame): Corpus after mapping
+        read_dtypes (pd.Series): Data types of the corpus before mapping
+        model_files (Dict[str, ModelFile]): File of each CLF Model ID
+
+    Returns:
+        Dict[str, pd.DataFrame]: Mapped entries by file stem, in the order read
+    """
+    stems = mapped["CLF Model ID"].map({k: v.stem for k, v in model_files.items()})
+    files = {model_file.stem: model_file for model_file in model_files.values()}
+    split = {}
+    for stem, file_df in mapped.groupby(stems.to_numpy(), sort=False):
+        model_file = files[stem]
+        file_df = file_df[model_file.columns].reset_index(drop=True)
+        for column, dtype in model_file.dtypes.items():
+            if read_dtypes[column] != dtype and mapped[column].dtype == read_dtypes[column]:
+                file_df[column] = file_df[column].astype(dtype)
+        split[stem] = file_df
+    return split
+
+
+def map_files(
+    files: Iterable[Path],
+    map_df: Callable[[pd.DataFrame], pd.DataFrame],
+    write_directory: Path,
+    suffix: str,
+    corpus_name: str,
+    batch: Optional[dict] = None,
+    logger=batch_logger,
+    artifact_format: ArtifactFormat = CSV,
+    manifest: Optional[BuildManifest] = None,
+    jobs: int = 1,
+) -> None:
+    """Map model files and write the mapped files, per file or as one corpus.
+
+    With an enabled manifest only the files whose mapped file is out of date are
+    mapped, or every file if any is when they are written as one corpus.
+
+    Args:
+        files (Iterable[Path]): Files of models
+        map_df (Callable[[pd.DataFrame], pd.DataFrame]): Maps a DataFrame of models
+        write_directory (Path): Directory the mapped files are written to
+        suffix (str): Appended to the file name of each mapped file, e.g. "_EleMapped"
+        corpus_name (str): Name of the single file written without per_file_outputs
+        batch (Optional[dict]): Settings of configured_batch, None maps file by file
+        logger (Logger): Logger of the calling script
+        artifact_format (ArtifactFormat): Format of the files read and written
+        manifest (Optional[BuildManifest]): Manifest of the mapped files, None maps
+            every file
+        jobs (int): Files read ahead and written behind the mapping at the same time
+    """
+    manifest = manifest or BuildManifest()
+    files = list(files)
+    corpus_output = bool(batch and batch["enabled"] and not batch["per_file_outputs"])
+    if corpus_output:
+        if manifest.is_current(corpus_name, files):
+            return
+    else:
+        files = [file for file in files if not manifest.is_current(f"{file.stem}{suffix}", [file])]
+
+    def record(key: str, inputs: list):
+        return lambda output: manifest.record(key, inputs, [output])
+
+    if not batch or not batch["enabled"]:
+        with WriteBehind(jobs) as writer:
+            for file, df in zip(files, read_ahead(artifact_format.read, files, jobs)):
+                logger.info("Begin mapping %s", file.name)
+                mapped_df = map_df(df)
+                writer.submit(
+                    artifact_format.write,
+                    mapped_df,
+                    write_directory,
+                    f"{file.stem}{suffix}",
+                    index=False,
+                    done=record(f"{file.stem}{suffix}", [file]),
+                )
+                logger.info("Mapped %s", file.name)
+        manifest.save()
+        return
+
+    corpus, model_files = read_corpus(files, artifact_format, jobs)
+    if corpus.empty:
+        return
+    logger.info("Begin mapping %s models together", len(model_files))
+    # mappers may change the corpus in place
+    read_dtypes = corpus.dtypes
+    mapped = map_df(corpus)
+    if corpus_output:
+        output = artifact_format.write(mapped, write_directory, corpus_name, index=False)
+        manifest.record(corpus_name, files, [output])
+    else:
+        files_by_stem = {file.stem: file for file in files}
+        with WriteBehind(jobs) as writer:
+            for stem, file_df in split_corpus(mapped, read_dtypes, model_files).items():
+                writer.submit(
+                    artifact_format.write,
+                    file_df,
+                    write_directory,
+                    f"{stem}{suffix}",
+                    index=False,
+                    done=record(f"{stem}{suffix}", [files_by_stem[stem]]),
+                )
+    manifest.save()
+    logger.info("Mapped %s models", len(model_files))
@@ -2,12 +2,29 @@
 
 from pathlib import Path
 from logging import getLogger
+from typing import Collection, Optional
 import pandas as pd
 from wblca_benchmark_v2_data_prep.lca_results.enums import RevitBuildingCategory
 # pylint: disable=E1130, W0718, C0103, W0719
 
 clean_logger = getLogger("lca_results.clean")
 
+# columns clean_oneclick_df reads, or fills with a default when they are missing,
+# which are read from the workbooks even if harmonization removes them later
+ONECLICK_CLEANED_COLUMNS = frozenset(
+    {
+        "Section",
+        "CLF Omni",
+        "Omniclass",
+        "csiMasterformat",
+        "Question",
+        "Resource type",
+        "Name",
+        "file_name_before_merge",
+        "Design Name",
+    }
+)
+
 
 def clean_tally_df(tally_df: pd.DataFrame, tally_file: Path) -> pd.DataFrame:
     """Clean all the column information from the raw WBLCA output for Tally models.
@@ -253,11 +270,18 @@ def adjust_oneclick_csi_division(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def read_excel(file_path: Path) -> pd.DataFrame:
-    """Read csv files for general use.
+def read_excel(
+    file_path: Path,
+    skip_columns: Optional[Collection[str]] = None,
+    engine: Optional[str] = None,
+) -> pd.DataFrame:
+    """Read excel files for general use.
 
     Args:
-        file_path (Path): file path of csv to read
+        file_path (Path): file path of excel to read
+        skip_columns (Optional[Collection[str]]): columns not to read, all columns
+            are read if None
+        engine (Optional[str]): excel engine of pd.read_excel, default if None
 
     Raises:
         PermissionError: Raised if function does not have permission to access file
@@ -265,13 +289,17 @@ def read_excel(file_path: Path) -> pd.DataFrame:
         Exception: General exception just in case
 
     Returns:
-        pd.DataFrame: DataFrame of read csv file
+        pd.DataFrame: DataFrame of read excel file
     """
+    usecols = None
+    if skip_columns:
+
+        def usecols(column: str) -> bool:
+            return column not in skip_columns
+
     try:
         clean_logger.info("Reading %s", file_path.stem)
-        df = pd.read_excel(
-            file_path,
-        )
+        df = pd.read_excel(file_path, usecols=usecols, engine=engine)
     except PermissionError as pe:
         clean_logger.exception("Permission Error probably caused by having file open")
         raise PermissionError("Try closing out the file you are trying to read") from pe
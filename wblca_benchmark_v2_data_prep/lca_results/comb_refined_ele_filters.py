@@ -13,23 +13,35 @@ class RefinedElementFilter(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("acous_ceilings_mq_one"), self.column_name_to_change] = (
-            OmniClassLevelOne.INTERIOR_FINISHES.value
+        self._assign(
+            df=df,
+            result=OmniClassLevelOne.INTERIOR_FINISHES.value,
+            mask=all_filters.get("acous_ceilings_mq_one"),
         )
-        df.loc[all_filters.get("vapor_barrier_mq_one"), self.column_name_to_change] = (
-            OmniClassLevelOne.ENCLOSURE.value
+        self._assign(
+            df=df,
+            result=OmniClassLevelOne.ENCLOSURE.value,
+            mask=all_filters.get("vapor_barrier_mq_one"),
         )
-        df.loc[all_filters.get("cladding_mq_one"), self.column_name_to_change] = (
-            OmniClassLevelOne.ENCLOSURE.value
+        self._assign(
+            df=df,
+            result=OmniClassLevelOne.ENCLOSURE.value,
+            mask=all_filters.get("cladding_mq_one"),
         )
-        df.loc[all_filters.get("floor_tile_mq_one"), self.column_name_to_change] = (
-            OmniClassLevelOne.INTERIOR_FINISHES.value
+        self._assign(
+            df=df,
+            result=OmniClassLevelOne.INTERIOR_FINISHES.value,
+            mask=all_filters.get("floor_tile_mq_one"),
         )
-        df.loc[all_filters.get("raised_access_mq_two"), self.column_name_to_change] = (
-            OmniClassLevelOne.INTERIOR_CONSTRUCTION.value
+        self._assign(
+            df=df,
+            result=OmniClassLevelOne.INTERIOR_CONSTRUCTION.value,
+            mask=all_filters.get("raised_access_mq_two"),
         )
-        df.loc[all_filters.get("insulation_mq_one"), self.column_name_to_change] = (
-            OmniClassLevelOne.ENCLOSURE.value
+        self._assign(
+            df=df,
+            result=OmniClassLevelOne.ENCLOSURE.value,
+            mask=all_filters.get("insulation_mq_one"),
         )
         self.or_loc(
             df=df,
@@ -51,8 +63,10 @@ class RefinedElementFilter(AbstractFilter):
                 all_filters.get("heavy_timber_mq_two"),
             ],
         )
-        df.loc[all_filters.get("ready_mix_lw_mq_two"), self.column_name_to_change] = (
-            OmniClassLevelOne.SUPERSTRUCTURE.value
+        self._assign(
+            df=df,
+            result=OmniClassLevelOne.SUPERSTRUCTURE.value,
+            mask=all_filters.get("ready_mix_lw_mq_two"),
         )
         self.and_or_loc(
             df=df,
@@ -0,0 +1,139 @@
+"""Combines the model files of a tool into one file without holding them all.
+
+The columns of the combined file are the union of the file headers, in order of
+first appearance, the same as pd.concat. Files are then read one at a time and
+appended to the combined file, so peak memory is the largest model file instead
+of every model plus the concatenated copy. With jobs > 1 the next files are read
+by a pool of threads while the current one is written, at most jobs files ahead.
+
+The combined file holds the same entries as the concatenation of the files. Csv
+files are written file by file, so an integer column of a file is written as
+integers even where pd.concat would have turned it into floats because another
+file lacks the column; both read back as the same floats. Parquet and feather
+files get one schema for all files, columns whose type differs between files are
+stored as floats if all types are numeric and as strings otherwise.
+"""
+
+from logging import getLogger
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
+from wblca_benchmark_v2_data_prep.utils.artifacts import CSV, ArtifactFormat
+from wblca_benchmark_v2_data_prep.utils.file_io import read_ahead
+
+combine_logger = getLogger("lca_results.combine")
+
+
+def union_columns(files: Iterable[Path], artifact_format: ArtifactFormat = CSV) -> List[str]:
+    """Union of the columns of files, read from their headers only.
+
+    Args:
+        files (Iterable[Path]): Files to combine
+        artifact_format (ArtifactFormat): Format of the files
+
+    Returns:
+        List[str]: Columns in order of first appearance
+    """
+    columns = {}
+    for file in files:
+        columns.update(dict.fromkeys(artifact_format.read_columns(file)))
+    return list(columns)
+
+
+def _combine_csv(files: Sequence[Path], file_path: Path, jobs: int) -> None:
+    """Append every file to one csv with the union of their columns."""
+    columns = union_columns(files, CSV)
+    with open(file_path, "w", encoding="utf-8", newline="") as combined:
+        for position, df in enumerate(read_ahead(CSV.read, files, jobs)):
+            df.reindex(columns=columns).to_csv(combined, index=False, header=position == 0)
+
+
+def _common_type(types: list):
+    """Type of a column in the combined file from its types in each file."""
+    # pylint: disable=C0415
+    import pyarrow as pa
+
+    types = [arrow_type for arrow_type in types if not pa.types.is_null(arrow_type)]
+    if not types:
+        return pa.null()
+    if all(arrow_type.equals(types[0]) for arrow_type in types):
+        return types[0]
+    if all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in types):
+        return pa.float64()
+    return pa.string()
+
+
+def _combine_arrow(
+    files: Sequence[Path], file_path: Path, artifact_format: ArtifactFormat, jobs: int
+) -> None:
+    """Append every file to one parquet or feather file with a common schema."""
+    # pylint: disable=C0415
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from pyarrow import feather, ipc
+
+    if artifact_format.name == "parquet":
+        schemas = [pq.read_schema(file) for file in files]
+        read_table = pq.read_table
+    else:
+        schemas = []
+        for file in files:
+            with ipc.open_file(file) as reader:
+                schemas.append(reader.schema)
+        read_table = feather.read_table
+
+    types = {}
+    for file_schema in schemas:
+        for arrow_field in file_schema:
+            types.setdefault(arrow_field.name, []).append(arrow_field.type)
+    schema = pa.schema(
+        [(name, _common_type(column_types)) for name, column_types in types.items()]
+    )
+
+    def read(file: Path):
+        table = read_table(file)
+        arrays = []
+        for arrow_field in schema:
+            if arrow_field.name in table.column_names:
+                arrays.append(table.column(arrow_field.name).cast(arrow_field.type))
+            else:
+                arrays.append(pa.nulls(table.num_rows, arrow_field.type))
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    if artifact_format.name == "parquet":
+        writer = pq.ParquetWriter(file_path, schema)
+    else:
+        writer = ipc.new_file(file_path, schema)
+    with writer:
+        for table in read_ahead(read, files, jobs):
+            writer.write_table(table)
+
+
+def combine_files(
+    files: Iterable[Path],
+    write_directory: Path,
+    file_name: str,
+    artifact_format: ArtifactFormat = CSV,
+    jobs: int = 1,
+) -> Optional[Path]:
+    """Combine files into one file, reading one file at a time.
+
+    Args:
+        files (Iterable[Path]): Files to combine, in the order of their entries
+        write_directory (Path): Directory of the combined file
+        file_name (str): Name of the combined file without suffix
+        artifact_format (ArtifactFormat): Format of the files read and written
+        jobs (int): Files read at the same time
+
+    Returns:
+        Optional[Path]: Path of the combined file, None if there are no files
+    """
+    files = list(files)
+    if not files:
+        return None
+    file_path = artifact_format.path(write_directory, file_name)
+    if artifact_format.name == "csv":
+        _combine_csv(files, file_path, jobs)
+    else:
+        _combine_arrow(files, file_path, artifact_format, jobs)
+    combine_logger.info("Combined %s files into %s", len(files), file_path.name)
+    return file_path
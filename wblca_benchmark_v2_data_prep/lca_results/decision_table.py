@@ -0,0 +1,120 @@
+"""Compiles the writes of filter classes into a single vectorized assignment."""
+
+import warnings
+from typing import Any, Dict, List, Tuple
+import numpy as np
+import pandas as pd
+from wblca_benchmark_v2_data_prep.lca_results.packed_mask import PackedMask
+
+# dtype a column is left with by a loc write, by dtype, result, as_object and emptiness
+_WRITTEN_DTYPES: Dict[Tuple[Any, Any, bool, bool], Any] = {}
+
+
+def _written_dtype(column: pd.Series, result: Any, as_object: bool = False) -> Any:
+    """Get the dtype an and_loc, or_loc or and_or_loc write leaves a column with.
+
+    pandas upcasts a column to hold the value written whether or not the filter
+    selects any entry, e.g. a float column written a string becomes object, so the
+    dtype only depends on the dtype of the column and the value.
+
+    Args:
+        column (pd.Series): Column before the write
+        result (Any): Value written to the column
+        as_object (bool): Convert a float column to object first, as and_loc does
+
+    Returns:
+        Any: dtype of the column after the write
+    """
+    key = (column.dtype, result, as_object, column.empty)
+    if key not in _WRITTEN_DTYPES:
+        probe = column.iloc[:1].to_frame()
+        if as_object and probe.iloc[:, 0].dtype == "float64":
+            probe = probe.astype(object)
+        with warnings.catch_warnings():
+            # the FutureWarning of setting an incompatible dtype, as the loc write gives
+            warnings.simplefilter("ignore", FutureWarning)
+            probe.loc[np.zeros(len(probe), dtype=bool), probe.columns[0]] = result
+        _WRITTEN_DTYPES[key] = probe.iloc[:, 0].dtype
+    return _WRITTEN_DTYPES[key]
+
+
+class DecisionTable:
+    """Rule table standing in for the DataFrame passed to AbstractFilter.filtering.
+
+    The and_loc, or_loc and and_or_loc calls of a filter class are recorded as rules
+    of (column, filter, result) instead of being written one at a time. apply()
+    writes every column once with np.select, where the last matching rule wins, the
+    same as the sequence of df.loc writes it replaces, and leaves it with the dtype
+    those writes would, including for rules selecting no entry.
+
+    Attributes:
+        df (pd.DataFrame): DataFrame of WBLCA entries the rules are applied to
+        rules (List[Tuple[str, pd.Series, Any, bool]]): Recorded rules of column,
+            filter, result and whether the column is converted to object first
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.rules: List[Tuple[str, pd.Series, Any, bool]] = []
+
+    def add_rule(
+        self, column: str, mask: pd.Series, result: Any, as_object: bool = False
+    ) -> None:
+        """Record a write of result to column for the entries selected by mask.
+
+        Args:
+            column (str): Column to change
+            mask (pd.Series): Boolean filter selecting the entries to change
+            result (Any): Value to be applied to the column
+            as_object (bool): Convert a float column to object, as and_loc does
+        """
+        self.rules.append((column, mask, result, as_object))
+
+    def _condition(self, mask: pd.Series) -> np.ndarray:
+        """Convert a filter to a boolean array aligned with the DataFrame.
+
+        Raises:
+            ValueError: Raised for filters pandas would refuse as loc indexer
+        """
+        if isinstance(mask, PackedMask):
+            if mask.nulls is None and mask.index.equals(self.df.index):
+                return mask.to_numpy()
+            mask = mask.to_series()
+        if isinstance(mask, pd.Series) and not mask.index.equals(self.df.index):
+            mask = mask.reindex(self.df.index)
+            if mask.isna().any():
+                raise ValueError("Unalignable boolean Series provided as indexer")
+        if pd.isna(mask).any():
+            raise ValueError(
+                "Cannot mask with non-boolean array containing NA / NaN values"
+            )
+        return np.asarray(mask, dtype=bool)
+
+    def apply(self) -> pd.DataFrame:
+        """Write the recorded rules to the DataFrame, one assignment per column.
+
+        Returns:
+            pd.DataFrame: DataFrame with the rules applied
+        """
+        for column in dict.fromkeys(rule[0] for rule in self.rules):
+            rules = [rule for rule in self.rules if rule[0] == column]
+            current = self.df[column]
+            conditions = [self._condition(mask) for _, mask, _, _ in rules]
+            # the writes only ever widen the dtype, a row of the column is enough to follow it
+            probe = current.iloc[:1]
+            for _, _, result, as_object in rules:
+                probe = probe.astype(_written_dtype(probe, result, as_object))
+            dtype = probe.dtype
+            if not any(condition.any() for condition in conditions):
+                if dtype != current.dtype:
+                    self.df[column] = current.astype(dtype)
+                continue
+            # np.select picks the first match, reverse so the last rule wins
+            selected = np.select(
+                conditions[::-1],
+                [np.array(result, dtype=object) for _, _, result, _ in rules[::-1]],
+                default=current.to_numpy(dtype=object),
+            )
+            self.df[column] = pd.Series(selected, index=self.df.index).astype(dtype)
+        self.rules = []
+        return self.df
@@ -0,0 +1,256 @@
+"""Lazily evaluated registry of filters used by the mappers."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+import numpy as np
+import pandas as pd
+from wblca_benchmark_v2_data_prep.lca_results import multi_pattern
+from wblca_benchmark_v2_data_prep.lca_results.packed_mask import PackedMask
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """Definition of a filter on a single column of WBLCA entries.
+
+    Attributes:
+        column (str): Column the filter is evaluated on
+        method (str): One of "contains", "match", "fullmatch", "eq" or "isna"
+        pattern (Any): Pattern for the string methods or value compared for "eq"
+        kwargs (dict): Keyword arguments passed on to the pandas string method
+    """
+
+    column: str
+    method: str
+    pattern: Any = None
+    kwargs: Dict[str, Any] = field(default_factory=dict, hash=False)
+
+    def evaluate(self, df: pd.DataFrame) -> pd.Series:
+        """Evaluate the filter against the column of the provided DataFrame.
+
+        Args:
+            df (pd.DataFrame): DataFrame of WBLCA entries
+
+        Returns:
+            pd.Series: Result of the filter for every entry
+        """
+        return self.apply(df[self.column])
+
+    def apply(self, series: pd.Series) -> pd.Series:
+        """Evaluate the filter against a column.
+
+        Args:
+            series (pd.Series): Column of WBLCA entries
+
+        Returns:
+            pd.Series: Result of the filter for every entry
+        """
+        if self.method == "isna":
+            return pd.isna(series)
+        if self.method == "eq":
+            return series == self.pattern
+        return getattr(series.str, self.method)(self.pattern, **self.kwargs)
+
+
+def contains(column: str, pattern: str, **kwargs) -> Predicate:
+    """Filter for entries of column containing pattern (pandas str.contains)."""
+    return Predicate(column, "contains", pattern, kwargs)
+
+
+def match(column: str, pattern: str, **kwargs) -> Predicate:
+    """Filter for entries of column starting with pattern (pandas str.match)."""
+    return Predicate(column, "match", pattern, kwargs)
+
+
+def fullmatch(column: str, pattern: str, **kwargs) -> Predicate:
+    """Filter for entries of column entirely matching pattern (pandas str.fullmatch)."""
+    return Predicate(column, "fullmatch", pattern, kwargs)
+
+
+def equals(column: str, value: Any) -> Predicate:
+    """Filter for entries of column equal to value."""
+    return Predicate(column, "eq", value)
+
+
+def isna(column: str) -> Predicate:
+    """Filter for null entries of column."""
+    return Predicate(column, "isna")
+
+
+_STRING_METHODS = ("contains", "match", "fullmatch")
+
+
+def _broadcast(
+    result: pd.Series, codes: np.ndarray, series: pd.Series, na: Any
+) -> pd.Series:
+    """Expand a filter evaluated on the unique values of a column to every entry.
+
+    Args:
+        result (pd.Series): Result of the filter for each unique value
+        codes (np.ndarray): Position of each entry in the unique values, -1 if null
+        series (pd.Series): Column the unique values were taken from
+        na (Any): Value the filter returns for null entries, NaN keeps the null
+
+    Returns:
+        pd.Series: Result identical to evaluating the filter on the whole column
+    """
+    values = result.to_numpy()
+    null = codes == -1
+    if not null.any():
+        expanded = values[codes]
+    else:
+        expanded = np.empty(len(codes), dtype=object)
+        expanded[~null] = values[codes[~null]]
+        if na is np.nan or na is None:
+            # pandas keeps the original null value for null entries
+            expanded[null] = series.to_numpy()[null]
+        else:
+            expanded[null] = na
+            if isinstance(na, bool) and result.dtype == bool:
+                expanded = expanded.astype(bool)
+    return pd.Series(expanded, index=series.index, name=series.name)
+
+
+class FilterRegistry(Mapping):
+    """Read-only mapping of filter names to filters evaluated on first access.
+
+    The columns used by the filters are copied when the registry is created, so
+    filters evaluated later still describe the DataFrame as it was at creation,
+    the same as when every filter was built up front.
+
+    With single_pass, the first request for a string filter evaluates every pending
+    string filter on the same column in one scan of that column (see multi_pattern).
+
+    With factorize, string filters on text columns are evaluated once per distinct
+    value of the column and the results are broadcast back to every entry through
+    the codes of the column, which gives the same result in O(distinct values).
+
+    With packed, boolean results are kept as PackedMask, one bit per entry sharing
+    the index of the registry, instead of a boolean Series with its own index.
+
+    Attributes:
+        predicates (Dict[str, Predicate]): Definitions of all available filters
+        single_pass (bool): Evaluate string filters on a column together
+        factorize (bool): Evaluate string filters on distinct values only
+        packed (bool): Store boolean results as packed bits
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        predicates: Dict[str, Predicate],
+        single_pass: bool = False,
+        factorize: bool = False,
+        packed: bool = False,
+    ):
+        self.predicates = predicates
+        self.single_pass = single_pass
+        self.factorize = factorize
+        self.packed = packed
+        columns = list(dict.fromkeys(pred.column for pred in predicates.values()))
+        self._data = df[columns].copy()
+        self._evaluated: Dict[str, Union[pd.Series, PackedMask]] = {}
+        self._factorized: Dict[str, Tuple[np.ndarray, pd.Series]] = {}
+
+    def __getitem__(self, key: str) -> Union[pd.Series, PackedMask]:
+        if key not in self._evaluated:
+            predicate = self.predicates[key]
+            series = self._data[predicate.column]
+            if series.dtype != object or predicate.method not in _STRING_METHODS:
+                self._store({key: predicate.apply(series)})
+            elif self.single_pass and multi_pattern.is_scannable(predicate):
+                pending = {
+                    name: pred
+                    for name, pred in self.predicates.items()
+                    if pred.column == predicate.column
+                    and name not in self._evaluated
+                    and multi_pattern.is_scannable(pred)
+                }
+                self._store(self._evaluate_strings(series, pending, True))
+            else:
+                self._store(self._evaluate_strings(series, {key: predicate}, False))
+        return self._evaluated[key]
+
+    def _store(self, results: Dict[str, pd.Series]) -> None:
+        """Keep evaluated filters, packed if the registry is packed."""
+        if self.packed:
+            index = self._data.index
+            results = {
+                name: PackedMask.from_series(result, index)
+                for name, result in results.items()
+            }
+        self._evaluated.update(results)
+
+    def _evaluate_strings(
+        self, series: pd.Series, predicates: Dict[str, Predicate], scan: bool
+    ) -> Dict[str, pd.Series]:
+        """Evaluate string filters on a text column, on distinct values if factorize.
+
+        Args:
+            series (pd.Series): Text column all predicates are evaluated on
+            predicates (Dict[str, Predicate]): String filters to evaluate
+            scan (bool): Evaluate the filters in a single scan of the column
+
+        Returns:
+            Dict[str, pd.Series]: Result of every filter by filter name
+        """
+        target = series
+        if self.factorize:
+            if series.name not in self._factorized:
+                # raises for columns pandas refuses to treat as strings
+                _ = series.str
+                codes, uniques = pd.factorize(series)
+                self._factorized[series.name] = (
+                    codes,
+                    pd.Series(uniques, dtype=object, name=series.name),
+                )
+            codes, target = self._factorized[series.name]
+
+        if scan:
+            results = multi_pattern.scan_column(target, predicates)
+        else:
+            results = {name: pred.apply(target) for name, pred in predicates.items()}
+
+        if self.factorize:
+            results = {
+                name: _broadcast(
+                    result, codes, series, predicates[name].kwargs.get("na", np.nan)
+                )
+                for name, result in results.items()
+            }
+        return results
+
+    def refresh(self, df: pd.DataFrame, columns: Iterable[str]) -> List[str]:
+        """Take the current values of columns from df and discard filters using them.
+
+        Filters on other columns keep their results, so a registry can be reused
+        across chained mapping passes that only change a few columns.
+
+        Args:
+            df (pd.DataFrame): DataFrame of WBLCA entries with the same index
+            columns (Iterable[str]): Columns changed since the registry was created
+
+        Returns:
+            List[str]: Names of the filters whose results were discarded
+        """
+        columns = [column for column in columns if column in self._data.columns]
+        for column in columns:
+            self._data[column] = df[column].copy()
+            self._factorized.pop(column, None)
+        discarded = [
+            name for name in self._evaluated if self.predicates[name].column in columns
+        ]
+        for name in discarded:
+            del self._evaluated[name]
+        return discarded
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.predicates)
+
+    def __len__(self) -> int:
+        return len(self.predicates)
+
+    @property
+    def evaluated(self) -> list:
+        """Names of the filters that have been evaluated so far."""
+        return list(self._evaluated)
@@ -0,0 +1,132 @@
+"""Reading of raw One Click LCA workbooks with a cache keyed by their content.
+
+Parsing a large One Click LCA export takes far longer than everything done with
+it afterwards, so ExcelIngestion makes the parse as cheap as possible:
+
+- workbooks are read with the calamine engine if python-calamine is installed,
+  and with the read-only openpyxl engine of pandas otherwise
+- columns that harmonization removes (column_removal_oneclick in
+  references/config_harmonize.yml) are not read at all, except the ones cleaning
+  reads, e.g. "Design Name", so the intermediate files keep their values
+- the read DataFrame is cached under the sha256 of the workbook and the read
+  options, so a workbook that has not changed is never parsed again
+
+The cache holds the DataFrame exactly as pd.read_excel returned it, including
+object columns that mix numbers and text (e.g. a service life of 60 or "As
+building"), which a parquet copy could not keep. Entries of earlier versions of a
+workbook are removed when it is cached again.
+"""
+
+import hashlib
+import importlib.util
+import os
+from dataclasses import dataclass, field
+from logging import getLogger
+from pathlib import Path
+from typing import FrozenSet, Optional
+import pandas as pd
+import wblca_benchmark_v2_data_prep.lca_results.clean as clean_util
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+ingestion_logger = getLogger("lca_results.ingestion")
+
+
+def excel_engine() -> str:
+    """Fastest installed engine of pd.read_excel for xlsx files.
+
+    Returns:
+        str: "calamine" if python-calamine is installed, "openpyxl" otherwise
+    """
+    if importlib.util.find_spec("python_calamine") is not None:
+        return "calamine"
+    return "openpyxl"
+
+
+@dataclass(frozen=True)
+class ExcelIngestion:
+    """Reads One Click LCA workbooks, skipping columns and cached parses.
+
+    Attributes:
+        cache_directory (Optional[Path]): Directory of the cached DataFrames, None
+            to parse every workbook
+        skip_columns (FrozenSet[str]): Columns not read from the workbooks, the
+            columns in clean.ONECLICK_CLEANED_COLUMNS are always read
+        engine (str): Engine of pd.read_excel
+    """
+
+    cache_directory: Optional[Path] = None
+    skip_columns: FrozenSet[str] = frozenset()
+    engine: str = field(default_factory=excel_engine)
+
+    def __post_init__(self):
+        skip_columns = frozenset(self.skip_columns) - clean_util.ONECLICK_CLEANED_COLUMNS
+        object.__setattr__(self, "skip_columns", skip_columns)
+
+    def _key(self, file_path: Path) -> str:
+        """Hash of the workbook content and of the options it is read with."""
+        digest = hashlib.sha256(gen.file_digest(file_path).encode())
+        digest.update(self.engine.encode())
+        digest.update(pd.__version__.encode())
+        for column in sorted(self.skip_columns):
+            digest.update(f"{column};".encode())
+        return digest.hexdigest()[:32]
+
+    def read(self, file_path: Path) -> pd.DataFrame:
+        """Read the first sheet of a workbook, from the cache if it is unchanged.
+
+        Args:
+            file_path (Path): Path of the workbook
+
+        Returns:
+            pd.DataFrame: DataFrame of the workbook without the skipped columns
+        """
+        if self.cache_directory is None:
+            return clean_util.read_excel(file_path, self.skip_columns, self.engine)
+
+        cache_path = self.cache_directory.joinpath(f"{file_path.stem}.{self._key(file_path)}.pkl")
+        if cache_path.exists():
+            try:
+                df = pd.read_pickle(cache_path)
+            except Exception:  # pylint: disable=W0718
+                ingestion_logger.warning("Unable to read %s, parsing again", cache_path)
+            else:
+                ingestion_logger.info("Read %s from cache", file_path.name)
+                return df
+
+        df = clean_util.read_excel(file_path, self.skip_columns, self.engine)
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        for stale_path in self.cache_directory.glob("*.pkl"):
+            if stale_path.name.rsplit(".", 2)[0] == file_path.stem:
+                stale_path.unlink()
+        temporary_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        df.to_pickle(temporary_path)
+        os.replace(temporary_path, cache_path)
+        return df
+
+
+def configured_ingestion(main_directory: Path) -> ExcelIngestion:
+    """Create the ingestion set in references/config_lca_results.yml.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        ExcelIngestion: Ingestion of the raw One Click LCA workbooks
+    """
+    config = gen.read_yaml(main_directory.joinpath("references/config_lca_results.yml"))
+    ingestion_config = config.get("excel_ingestion") or {}
+
+    cache_directory = None
+    cache_config = ingestion_config.get("cache") or {}
+    if cache_config.get("enabled", False):
+        cache_directory = main_directory.joinpath(cache_config["directory"])
+
+    skip_columns = frozenset()
+    if ingestion_config.get("skip_removed_columns", False):
+        config_harmonize = gen.read_yaml(
+            main_directory.joinpath("references/config_harmonize.yml")
+        )
+        skip_columns = frozenset(config_harmonize.get("column_removal_oneclick") or ())
+
+    engine = ingestion_config.get("engine") or excel_engine()
+    return ExcelIngestion(cache_directory, skip_columns, engine)
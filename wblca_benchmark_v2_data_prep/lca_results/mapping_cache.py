@@ -0,0 +1,316 @@
+"""On-disk cache of mapped labels by distinct values of the classifying columns.
+
+The labels a mapping stage writes (CLF Omni, MQ_1, MQ_2) only depend on the
+columns its filters read, e.g. Revit category, Revit family name, Material Name
+and the Tally Entry fields for Tally. A MappingCache stores the final labels of
+every distinct tuple of those columns it has classified, so mapping a new model
+only runs the filters on tuples that have not been seen before.
+
+The cache of a stage is discarded when the source of the filter modules or enums
+or the sequence of filter classes run by the stage changes.
+
+Worker processes mapping models at the same time share the cache file of a stage.
+Saving holds a lock file next to it, merges the entries other processes saved
+since it was read and replaces the file in one step, so no entries are lost.
+"""
+
+import hashlib
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from logging import getLogger
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+from wblca_benchmark_v2_data_prep.lca_results.abstract_filters import AbstractFilter
+from wblca_benchmark_v2_data_prep.lca_results.filter_registry import Predicate
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+cache_logger = getLogger("lca_results.mapping_cache")
+
+# modules whose source determines the labels written by the mappers
+MAPPING_MODULES = (
+    "abstract_filters",
+    "all_ele_filters",
+    "all_mat_filters",
+    "refined_mat_filters",
+    "tally_ele_filters",
+    "oneclick_ele_filters",
+    "tally_mat_filters",
+    "oneclick_mat_filters",
+    "comb_refined_ele_filters",
+    "enums",
+    "filter_registry",
+    "packed_mask",
+    "multi_pattern",
+    "decision_table",
+    "MappingImplementation",
+)
+
+
+def module_paths() -> List[Path]:
+    """Source files of the mapping modules.
+
+    Returns:
+        List[Path]: Path of every module in MAPPING_MODULES
+    """
+    module_directory = Path(__file__).parent
+    return [module_directory.joinpath(f"{module}.py") for module in MAPPING_MODULES]
+
+
+def code_version(filters: Sequence[AbstractFilter] = ()) -> str:
+    """Hash the mapping modules and the sequence of filter classes of a stage.
+
+    Args:
+        filters (Sequence[AbstractFilter]): Filter classes in the order they are run
+
+    Returns:
+        str: Hex digest identifying the mapping code
+    """
+    digest = hashlib.sha256()
+    for module_path in module_paths():
+        digest.update(module_path.read_bytes())
+    for fil in filters:
+        digest.update(
+            f"{type(fil).__module__}.{type(fil).__qualname__}"
+            f":{fil.column_name_to_change};".encode()
+        )
+    return digest.hexdigest()
+
+
+# a lock file older than this was left by a process killed while saving
+STALE_LOCK_SECONDS = 60.0
+
+
+@contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Hold the lock file of path while the block runs, waiting for other processes."""
+    lock_path = path.with_suffix(".lock")
+    while True:
+        try:
+            descriptor = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > STALE_LOCK_SECONDS:
+                    cache_logger.warning("Removing stale lock %s", lock_path)
+                    lock_path.unlink(missing_ok=True)
+                    continue
+            except FileNotFoundError:
+                continue
+            time.sleep(0.01)
+    try:
+        yield
+    finally:
+        os.close(descriptor)
+        lock_path.unlink(missing_ok=True)
+
+
+def _normalize(keys: pd.DataFrame) -> pd.DataFrame:
+    """Convert key columns to object with None for every null value."""
+    keys = keys.astype(object)
+    return keys.where(keys.notna(), None)
+
+
+@dataclass
+class MappingCache:
+    """Labels of a mapping stage by distinct tuple of classifying columns.
+
+    Attributes:
+        path (Path): Pickle file the cache is stored in
+        key_columns (List[str]): Columns read by the filters of the stage
+        label_columns (List[str]): Columns written by the filters of the stage
+        version (str): Hash of the mapping code the labels were produced with
+        table (pd.DataFrame): One row of keys and labels per classified tuple
+    """
+
+    path: Path
+    key_columns: List[str]
+    label_columns: List[str]
+    version: str
+    table: pd.DataFrame = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.table = self._read_stored()
+        if self.table is None:
+            self.table = pd.DataFrame(columns=self.key_columns + self._stored_labels, dtype=object)
+
+    def _read_stored(self) -> Optional[pd.DataFrame]:
+        """Table of the cache file, None if it is missing or of other mapping code."""
+        if not self.path.exists():
+            return None
+        try:
+            stored = pd.read_pickle(self.path)
+        except Exception:  # pylint: disable=W0718
+            cache_logger.warning("Unable to read %s, starting over", self.path)
+            return None
+        if (
+            stored["version"] == self.version
+            and stored["key_columns"] == self.key_columns
+            and stored["label_columns"] == self.label_columns
+        ):
+            return stored["table"]
+        cache_logger.info("Mapping code changed, discarding %s", self.path)
+        return None
+
+    @property
+    def _stored_labels(self) -> List[str]:
+        # label columns are usually key columns as well
+        return [f"{column} (mapped)" for column in self.label_columns]
+
+    def map(
+        self, df: pd.DataFrame, classify: Callable[[pd.DataFrame], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Map df, running classify only on tuples missing from the cache.
+
+        Args:
+            df (pd.DataFrame): DataFrame of WBLCA entries
+            classify (Callable[[pd.DataFrame], pd.DataFrame]): Runs the filters of
+                the stage on a DataFrame and returns the mapped DataFrame
+
+        Returns:
+            pd.DataFrame: df with the label columns mapped
+        """
+        if df.empty:
+            return classify(df)
+        keys = _normalize(df[self.key_columns])
+        codes = keys.groupby(self.key_columns, dropna=False, sort=False).ngroup()
+        codes = codes.to_numpy()
+        first = np.unique(codes, return_index=True)[1]
+        distinct = keys.iloc[first].reset_index(drop=True)
+        found = distinct.merge(self.table, on=self.key_columns, how="left", indicator=True)
+        missing = (found["_merge"] == "left_only").to_numpy()
+        cache_logger.info(
+            "%s of %s distinct entries found in %s",
+            len(distinct) - missing.sum(),
+            len(distinct),
+            self.path.name,
+        )
+
+        # classifying the missing rows also gives the label dtypes of a full run, if
+        # none is missing one row is classified, pandas keeps the dtype of an empty
+        # column whatever is written to it
+        rows = first[missing] if missing.any() else first[:1]
+        classified = classify(df.iloc[rows].reset_index(drop=True))
+        labels = {}
+        for column, stored in zip(self.label_columns, self._stored_labels):
+            values = found[stored].to_numpy(dtype=object)
+            values[missing] = classified[column].to_numpy(dtype=object)[: missing.sum()]
+            labels[column] = (values[codes], classified[column].dtype)
+
+        if missing.any():
+            new_entries = distinct[missing].reset_index(drop=True)
+            for column, stored in zip(self.label_columns, self._stored_labels):
+                new_entries[stored] = classified[column].to_numpy(dtype=object)
+            self.table = pd.concat([self.table, _normalize(new_entries)], ignore_index=True)
+            self.save()
+
+        mapped = df.copy()
+        for column, (values, dtype) in labels.items():
+            mapped[column] = pd.Series(values, index=df.index, dtype=object)
+            if dtype == object:
+                continue
+            try:
+                mapped[column] = mapped[column].astype(dtype)
+            except (TypeError, ValueError):
+                # labels the dtype cannot hold, e.g. strings of a float column, stay object
+                cache_logger.warning("Keeping %s as object, not %s", column, dtype)
+        return mapped
+
+    def save(self) -> None:
+        """Write the cache with the entries saved by other processes since it was read.
+
+        The file is replaced in one step while holding its lock file, so processes
+        saving at the same time keep each other's entries.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with _locked(self.path):
+            stored = self._read_stored()
+            if stored is not None and not stored.empty:
+                self.table = pd.concat([stored, self.table], ignore_index=True)
+                self.table = self.table.drop_duplicates(
+                    subset=self.key_columns, ignore_index=True
+                )
+            temporary_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            pd.to_pickle(
+                {
+                    "version": self.version,
+                    "key_columns": self.key_columns,
+                    "label_columns": self.label_columns,
+                    "table": self.table,
+                },
+                temporary_path,
+            )
+            os.replace(temporary_path, self.path)
+
+
+def configured_cache_dir(main_directory: Path) -> Optional[Path]:
+    """Get the cache directory set in references/config_lca_results.yml.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        Optional[Path]: Directory of the mapping caches, None if caching is disabled
+    """
+    config = gen.read_yaml(main_directory.joinpath("references/config_lca_results.yml"))
+    cache_config = config.get("mapping_cache") or {}
+    if not cache_config.get("enabled", False):
+        return None
+    return main_directory.joinpath(cache_config["directory"])
+
+
+def load_cache(
+    directory: Optional[Path],
+    stage: str,
+    predicates: Dict[str, Predicate],
+    filters: Sequence[AbstractFilter],
+    label_columns: List[str],
+) -> Optional[MappingCache]:
+    """Load the cache of a mapping stage, keyed by every column its filters read.
+
+    Args:
+        directory (Optional[Path]): Directory the caches are stored in, None to
+            disable caching
+        stage (str): Name of the stage, e.g. "tally_elements"
+        predicates (Dict[str, Predicate]): Filter definitions used by the stage
+        filters (Sequence[AbstractFilter]): Filter classes in the order they are run
+        label_columns (List[str]): Columns written by the stage
+
+    Returns:
+        Optional[MappingCache]: Cache of the stage, None without directory
+    """
+    if directory is None:
+        return None
+    key_columns = list(
+        dict.fromkeys([pred.column for pred in predicates.values()] + label_columns)
+    )
+    return MappingCache(
+        path=Path(directory).joinpath(f"{stage}.pkl"),
+        key_columns=key_columns,
+        label_columns=label_columns,
+        version=code_version(filters),
+    )
+
+
+def map_with_cache(
+    cache: Optional[MappingCache],
+    df: pd.DataFrame,
+    classify: Callable[[pd.DataFrame], pd.DataFrame],
+) -> pd.DataFrame:
+    """Map df through the cache if there is one, otherwise classify every entry.
+
+    Args:
+        cache (Optional[MappingCache]): Cache of the stage, None to disable caching
+        df (pd.DataFrame): DataFrame of WBLCA entries
+        classify (Callable[[pd.DataFrame], pd.DataFrame]): Runs the filters of
+            the stage on a DataFrame and returns the mapped DataFrame
+
+    Returns:
+        pd.DataFrame: Mapped DataFrame
+    """
+    if cache is None:
+        return classify(df)
+    return cache.map(df, classify)
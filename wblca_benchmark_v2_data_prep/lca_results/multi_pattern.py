@@ -0,0 +1,155 @@
+"""Matches every string filter targeting a column in a single scan of the column.
+
+Nearly all string filters are alternations of plain words ("carpet|Carpet|CARPET").
+All words of all filters on a column are compiled into one alternation that is
+tried at every position of an entry, which finds every word present in the entry
+in a single pass. The filters matching the entry follow from the words found.
+"""
+
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from wblca_benchmark_v2_data_prep.lca_results.filter_registry import Predicate
+
+_SCAN_METHODS = ("contains", "match", "fullmatch")
+_REGEX_SPECIAL = set(".^$*+?{}[]()|\\")
+
+
+def literal_alternatives(predicate: "Predicate") -> Optional[List[str]]:
+    """Split the pattern of a filter into the plain words it is an alternation of.
+
+    Args:
+        predicate (Predicate): Filter definition
+
+    Returns:
+        Optional[List[str]]: Words of the pattern, None if it uses other regex syntax
+    """
+    if not predicate.kwargs.get("regex", True):
+        return [predicate.pattern]
+    words, word, chars = [], [], iter(predicate.pattern)
+    for char in chars:
+        if char == "\\":
+            escaped = next(chars, "")
+            if escaped.isalnum() or escaped == "" or escaped == "_":
+                return None
+            word.append(escaped)
+        elif char == "|":
+            words.append("".join(word))
+            word = []
+        elif char in _REGEX_SPECIAL:
+            return None
+        else:
+            word.append(char)
+    words.append("".join(word))
+    if "" in words:
+        return None
+    return words
+
+
+def is_scannable(predicate: "Predicate") -> bool:
+    """Check if a filter can be evaluated as part of a combined scan.
+
+    Filters using flags, case insensitive matching or regex syntax other than
+    alternation are left to pandas.
+
+    Args:
+        predicate (Predicate): Filter definition
+
+    Returns:
+        bool: True if the filter can be combined with the others on its column
+    """
+    if predicate.method not in _SCAN_METHODS or not isinstance(predicate.pattern, str):
+        return False
+    options = {"regex", "na"} if predicate.method == "contains" else {"na"}
+    return (
+        set(predicate.kwargs) <= options and literal_alternatives(predicate) is not None
+    )
+
+
+def _find_words(values: np.ndarray, rows: np.ndarray, words: List[str]):
+    """Find every word contained in the entries of rows.
+
+    Words are tried longest first at each position, so the word reported at a
+    position contains every other word starting there. Adding the words contained
+    in each reported word therefore gives all words present, overlapping or not.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Pairs of row and index of word found in it
+    """
+    order = sorted(range(len(words)), key=lambda i: -len(words[i]))
+    finder = re.compile(
+        "(?=(" + "|".join(re.escape(words[i]) for i in order) + "))", re.DOTALL
+    )
+    index = {word: i for i, word in enumerate(words)}
+    contained = [
+        [j for j, other in enumerate(words) if other in word] for word in words
+    ]
+    found_rows, found_words = [], []
+    for row in rows:
+        present = set()
+        for found in finder.finditer(values[row]):
+            present.update(contained[index[found.group(1)]])
+        found_rows.extend([row] * len(present))
+        found_words.extend(present)
+    return np.array(found_rows, dtype=np.int64), np.array(found_words, dtype=np.int64)
+
+
+def scan_column(
+    series: pd.Series, predicates: Dict[str, "Predicate"]
+) -> Dict[str, pd.Series]:
+    """Evaluate all filters on a column of strings while scanning it once.
+
+    Results are identical to calling the pandas string method of every filter,
+    including the handling of null and non string entries.
+
+    Args:
+        series (pd.Series): Column of WBLCA entries, must have object dtype
+        predicates (Dict[str, Predicate]): Scannable filters on this column
+
+    Returns:
+        Dict[str, pd.Series]: Boolean result of every filter by filter name
+    """
+    # raises for columns pandas refuses to treat as strings
+    _ = series.str
+    values = series.to_numpy(dtype=object)
+    null = pd.isna(values)
+    text = np.fromiter((isinstance(value, str) for value in values), bool, len(values))
+    rows = np.flatnonzero(text)
+
+    alternatives = {
+        name: literal_alternatives(pred) for name, pred in predicates.items()
+    }
+    words = list(dict.fromkeys(w for alts in alternatives.values() for w in alts))
+    index = {word: i for i, word in enumerate(words)}
+    found_rows, found_words = _find_words(values, rows, words)
+
+    results = {}
+    for name, pred in predicates.items():
+        alts = alternatives[name]
+        if pred.method == "contains":
+            ids = [index[word] for word in alts]
+            result = np.zeros(len(values), dtype=bool)
+            result[found_rows[np.isin(found_words, ids)]] = True
+        elif pred.method == "match":
+            prefixes = tuple(alts)
+            result = text.copy()
+            result[rows] = [values[row].startswith(prefixes) for row in rows]
+        else:
+            exact = set(alts)
+            result = text.copy()
+            result[rows] = [values[row] in exact for row in rows]
+
+        na = pred.kwargs.get("na", np.nan)
+        if not text.all():
+            result = result.astype(object)
+            result[~text] = na
+            if na is np.nan or na is None:
+                # pandas keeps the original null value for null entries
+                result[null] = values[null]
+            elif isinstance(na, bool):
+                result = result.astype(bool)
+        results[name] = pd.Series(result, index=series.index, name=series.name)
+    return results
@@ -16,8 +16,10 @@ class ConcreteMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("conc_cat_mat_one"), self.column_name_to_change] = (
-            MaterialQuantityOne.CONCRETE.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.CONCRETE.value,
+            mask=all_filters.get("conc_cat_mat_one"),
         )
         self.and_loc(
             df=df,
@@ -78,8 +80,10 @@ class SteelMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("metals_cat_mat_one"), self.column_name_to_change] = (
-            MaterialQuantityOne.STEEL.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.STEEL.value,
+            mask=all_filters.get("metals_cat_mat_one"),
         )
         self.and_or_loc(
             df=df,
@@ -117,9 +121,11 @@ class MasonryMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[
-            all_filters.get("stone_cladding_cat_mat_three"), self.column_name_to_change
-        ] = MaterialQuantityOne.MASONRY.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.MASONRY.value,
+            mask=all_filters.get("stone_cladding_cat_mat_three"),
+        )
         self.and_or_loc(
             df=df,
             result=MaterialQuantityOne.MASONRY.value,
@@ -393,8 +399,10 @@ class GypsumMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("gypsum_cat_mat_two"), self.column_name_to_change] = (
-            MaterialQuantityOne.GYPSUM.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.GYPSUM.value,
+            mask=all_filters.get("gypsum_cat_mat_two"),
         )
         self.and_loc(
             df=df,
@@ -421,9 +429,11 @@ class InsulationMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[
-            all_filters.get("insulation_cat_mat_two"), self.column_name_to_change
-        ] = MaterialQuantityOne.INSULATION.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.INSULATION.value,
+            mask=all_filters.get("insulation_cat_mat_two"),
+        )
         self.and_loc(
             df=df,
             result=MaterialQuantityOne.OTHER.value,
@@ -458,8 +468,10 @@ class FireproofMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("fireproof_cat_mat_two"), self.column_name_to_change] = (
-            MaterialQuantityOne.FIREPROOF.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.FIREPROOF.value,
+            mask=all_filters.get("fireproof_cat_mat_two"),
         )
         self.or_loc(
             df=df,
@@ -853,8 +865,10 @@ class ConcreteMaterialQuantityTwo(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("conc_mq_one"), self.column_name_to_change] = (
-            MaterialQuantityTwo.READY_MIX_OTHER.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityTwo.READY_MIX_OTHER.value,
+            mask=all_filters.get("conc_mq_one"),
         )
         self.and_or_loc(
             df=df,
@@ -1210,8 +1224,10 @@ class GypsumMaterialQuantityTwo(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("gypsum_mq_one"), self.column_name_to_change] = (
-            MaterialQuantityTwo.INT_GYPSUM.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityTwo.INT_GYPSUM.value,
+            mask=all_filters.get("gypsum_mq_one"),
         )
         self.and_loc(
             df=df,
@@ -0,0 +1,119 @@
+"""Boolean filters stored as packed bit arrays sharing the index of the entries."""
+
+from typing import Optional, Union
+import numpy as np
+import pandas as pd
+
+
+class PackedMask:
+    """Result of a filter stored as one bit per entry instead of a boolean Series.
+
+    Masks created by a FilterRegistry share its index, so a filter takes an eighth
+    of the memory of a boolean Series and no copy of the index. The &, | and ~
+    operators work on the packed bits and give the same result as the pandas
+    operators on the Series the masks were created from, including entries where a
+    string filter returned a null value:
+
+    - a null on either side of & is False
+    - a null on the left of | makes the result False, a null on the right is False
+    - ~ is only defined for masks without nulls, pandas raises for them as well
+
+    Attributes:
+        bits (np.ndarray): Packed result of the filter, False for null entries
+        index (pd.Index): Index of the entries, shared by the masks of a registry
+        nulls (Optional[np.ndarray]): Packed null entries, None if there are none
+    """
+
+    __slots__ = ("bits", "index", "nulls")
+    # makes pandas defer "series & mask" to __rand__ instead of treating it as scalar
+    __pandas_priority__ = 4000
+
+    def __init__(self, bits: np.ndarray, index: pd.Index, nulls: Optional[np.ndarray] = None):
+        self.bits = bits
+        self.index = index
+        self.nulls = nulls
+
+    @classmethod
+    def from_series(
+        cls, series: pd.Series, index: Optional[pd.Index] = None
+    ) -> Union["PackedMask", pd.Series]:
+        """Pack the result of a filter.
+
+        Args:
+            series (pd.Series): Result of a filter
+            index (Optional[pd.Index]): Index equal to the index of series to share
+                between masks, the index of series if None
+
+        Returns:
+            Union[PackedMask, pd.Series]: Packed mask, or series itself if it holds
+                anything but booleans and nulls
+        """
+        index = series.index if index is None else index
+        values = series.to_numpy()
+        if series.dtype == bool:
+            return cls(np.packbits(values), index)
+        if series.dtype != object:
+            return series
+        null = pd.isna(values)
+        if not null.any() or not all(isinstance(value, bool) for value in values[~null]):
+            # booleans stored as object behave differently with ~, keep them as is
+            return series
+        result = np.zeros(len(values), dtype=bool)
+        result[~null] = values[~null].astype(bool)
+        return cls(np.packbits(result), index, np.packbits(null))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def to_numpy(self) -> np.ndarray:
+        """Unpack the mask, null entries are False.
+
+        Returns:
+            np.ndarray: Boolean value of every entry
+        """
+        return np.unpackbits(self.bits, count=len(self)).view(bool)
+
+    def to_series(self) -> pd.Series:
+        """Unpack the mask into the Series it was created from.
+
+        Returns:
+            pd.Series: Boolean Series, object with NaN for null entries if any
+        """
+        if self.nulls is None:
+            return pd.Series(self.to_numpy(), index=self.index)
+        values = self.to_numpy().astype(object)
+        values[np.unpackbits(self.nulls, count=len(self)).view(bool)] = np.nan
+        return pd.Series(values, index=self.index)
+
+    def _aligned(self, other) -> bool:
+        return isinstance(other, PackedMask) and (
+            other.index is self.index or other.index.equals(self.index)
+        )
+
+    def __and__(self, other):
+        if not self._aligned(other):
+            return self.to_series() & other
+        return PackedMask(self.bits & other.bits, self.index)
+
+    def __or__(self, other):
+        if not self._aligned(other):
+            return self.to_series() | other
+        bits = self.bits | other.bits
+        if self.nulls is not None:
+            bits &= ~self.nulls
+        return PackedMask(bits, self.index)
+
+    def __rand__(self, other):
+        return other & self.to_series()
+
+    def __ror__(self, other):
+        return other | self.to_series()
+
+    def __invert__(self) -> "PackedMask":
+        if self.nulls is not None:
+            raise TypeError("bad operand type for unary ~: 'float'")
+        # the padding bits of the last byte are never unpacked
+        return PackedMask(~self.bits, self.index)
+
+    def __repr__(self) -> str:
+        return f"PackedMask({len(self)} entries, {int(self.to_numpy().sum())} selected)"
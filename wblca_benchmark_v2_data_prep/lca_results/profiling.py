@@ -0,0 +1,241 @@
+"""Opt-in timing of the filter classes and filters run by the mappers.
+
+A FilterProfiler shared by the mappers of a run records, for every filter class,
+the wall time of its filtering and the entries whose value it changed, and for
+every filter it requested, the wall time of the requests, the entries the filter
+matched and how many of those the filter class changed. Filters of a
+FilterRegistry are evaluated on their first request, so that request carries the
+evaluation time.
+
+Counts are summed over every use, e.g. a filter requested by three filter classes
+on a file of 100 entries adds three uses and 300 entries.
+"""
+
+import json
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from logging import getLogger
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional
+import numpy as np
+import pandas as pd
+from wblca_benchmark_v2_data_prep.lca_results.abstract_filters import AbstractFilter
+from wblca_benchmark_v2_data_prep.lca_results.packed_mask import PackedMask
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+profiling_logger = getLogger("lca_results.profiling")
+
+FILTER_CLASS_COLUMNS = ["filter_class", "column", "uses", "seconds", "entries", "rows_changed"]
+FILTER_COLUMNS = [
+    "filter",
+    "uses",
+    "seconds",
+    "entries",
+    "rows_matched",
+    "rows_changed",
+    "filter_classes",
+]
+
+
+def _selected(mask) -> np.ndarray:
+    """Convert a filter to a boolean array, null results are not selected."""
+    if isinstance(mask, PackedMask):
+        return mask.to_numpy()
+    return pd.Series(mask).eq(True).to_numpy()
+
+
+def _changed(before: pd.Series, after: pd.Series) -> np.ndarray:
+    """Entries whose value differs, nulls are equal to each other."""
+    before = before.to_numpy(dtype=object)
+    after = after.to_numpy(dtype=object)
+    return ~((before == after) | (pd.isna(before) & pd.isna(after)))
+
+
+class _RecordingFilters(Mapping):
+    """Filters of a mapper that record the time and result of every request."""
+
+    def __init__(self, filters: Mapping):
+        self.filters = filters
+        self.requests: Dict[str, list] = {}
+
+    def __getitem__(self, key: str):
+        start = time.perf_counter()
+        result = self.filters[key]
+        self.requests.setdefault(key, []).append((time.perf_counter() - start, result))
+        return result
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.filters)
+
+    def __len__(self) -> int:
+        return len(self.filters)
+
+
+@dataclass
+class FilterProfiler:
+    """Totals of the filter classes and filters run by the mappers sharing it.
+
+    Attributes:
+        filter_classes (Dict[str, dict]): Totals by filter class name
+        filters (Dict[str, dict]): Totals by filter name
+    """
+
+    filter_classes: Dict[str, dict] = field(default_factory=dict)
+    filters: Dict[str, dict] = field(default_factory=dict)
+
+    def profile(
+        self,
+        filter_type: AbstractFilter,
+        df: pd.DataFrame,
+        all_filters: Mapping,
+        run: Callable[[Mapping], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """Run a filter class and record its totals and those of its filters.
+
+        Args:
+            filter_type (AbstractFilter): Filter class to run
+            df (pd.DataFrame): DataFrame of WBLCA entries before filtering
+            all_filters (Mapping): Filters available to the filter class
+            run (Callable[[Mapping], pd.DataFrame]): Runs the filter class with the
+                filters provided and returns the filtered DataFrame
+
+        Returns:
+            pd.DataFrame: Filtered DataFrame returned by run
+        """
+        column = filter_type.column_name_to_change
+        # filter classes change df in place
+        before = df[column].copy() if column in df.columns else None
+        recording = _RecordingFilters(all_filters)
+        start = time.perf_counter()
+        df = run(recording)
+        seconds = time.perf_counter() - start
+
+        if before is None:
+            changed = np.ones(len(df), dtype=bool)
+        else:
+            changed = _changed(before, df[column])
+        name = filter_type.__class__.__name__
+        totals = self.filter_classes.setdefault(
+            name,
+            {"column": column, "uses": 0, "seconds": 0.0, "entries": 0, "rows_changed": 0},
+        )
+        totals["uses"] += 1
+        totals["seconds"] += seconds
+        totals["entries"] += len(df)
+        totals["rows_changed"] += int(changed.sum())
+
+        for key, requests in recording.requests.items():
+            totals = self.filters.setdefault(
+                key,
+                {
+                    "uses": 0,
+                    "seconds": 0.0,
+                    "entries": 0,
+                    "rows_matched": 0,
+                    "rows_changed": 0,
+                    "filter_classes": [],
+                },
+            )
+            for request_seconds, result in requests:
+                selected = _selected(result)
+                totals["uses"] += 1
+                totals["seconds"] += request_seconds
+                totals["entries"] += len(selected)
+                totals["rows_matched"] += int(selected.sum())
+                totals["rows_changed"] += int((selected & changed).sum())
+            if name not in totals["filter_classes"]:
+                totals["filter_classes"].append(name)
+        return df
+
+    def filter_class_report(self) -> pd.DataFrame:
+        """Totals of every filter class, slowest first.
+
+        Returns:
+            pd.DataFrame: One row per filter class
+        """
+        report = pd.DataFrame(
+            [{"filter_class": name, **totals} for name, totals in self.filter_classes.items()],
+            columns=FILTER_CLASS_COLUMNS,
+        )
+        return report.sort_values("seconds", ascending=False, ignore_index=True)
+
+    def filter_report(self) -> pd.DataFrame:
+        """Totals of every filter requested by a filter class, slowest first.
+
+        Returns:
+            pd.DataFrame: One row per filter, filter classes separated by ";"
+        """
+        report = pd.DataFrame(
+            [
+                {"filter": name, **totals, "filter_classes": ";".join(totals["filter_classes"])}
+                for name, totals in self.filters.items()
+            ],
+            columns=FILTER_COLUMNS,
+        )
+        return report.sort_values("seconds", ascending=False, ignore_index=True)
+
+    def write(self, write_directory: Path, name: str) -> None:
+        """Write the totals as <name>_profile.json and one csv per report.
+
+        Args:
+            write_directory (Path): Directory the reports are written to
+            name (str): Name of the run, e.g. "tally_materials"
+        """
+        write_directory.mkdir(parents=True, exist_ok=True)
+        filter_classes = self.filter_class_report()
+        filters = self.filter_report()
+        gen.write_to_csv(filter_classes, write_directory, f"{name}_filter_classes", index=False)
+        gen.write_to_csv(filters, write_directory, f"{name}_filters", index=False)
+        with open(write_directory.joinpath(f"{name}_profile.json"), "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "filter_classes": filter_classes.to_dict(orient="records"),
+                    "filters": filters.to_dict(orient="records"),
+                },
+                file,
+                indent=2,
+            )
+        profiling_logger.info("Profile of %s written to %s", name, write_directory)
+
+
+def configured_profiler(main_directory: Path) -> Optional[FilterProfiler]:
+    """Create a profiler if profiling is enabled in references/config_lca_results.yml.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        Optional[FilterProfiler]: New profiler, None if profiling is disabled
+    """
+    config = gen.read_yaml(main_directory.joinpath("references/config_lca_results.yml"))
+    if not (config.get("profiling") or {}).get("enabled", False):
+        return None
+    return FilterProfiler()
+
+
+def configured_profile_dir(main_directory: Path) -> Path:
+    """Get the directory profiles are written to from references/config_lca_results.yml.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        Path: Directory of the profiles
+    """
+    config = gen.read_yaml(main_directory.joinpath("references/config_lca_results.yml"))
+    profiling_config = config.get("profiling") or {}
+    return main_directory.joinpath(profiling_config.get("directory", "data/lca_results/profiling"))
+
+
+def write_profile(profiler: Optional[FilterProfiler], main_directory: Path, name: str) -> None:
+    """Write the reports of a profiler, if profiling is enabled.
+
+    Args:
+        profiler (Optional[FilterProfiler]): Profiler of the run, None if disabled
+        main_directory (Path): Root directory of the repository
+        name (str): Name of the run, e.g. "tally_materials"
+    """
+    if profiler is None:
+        return
+    profiler.write(configured_profile_dir(main_directory), name)
@@ -1,15 +1,30 @@
 #!/usr/bin/env python
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-import os
+import math
 import pandas as pd
 import wblca_benchmark_v2_data_prep.lca_results.clean as clean_util
+import wblca_benchmark_v2_data_prep.lca_results.ingestion as ingestion_util
+import wblca_benchmark_v2_data_prep.lca_results.mapping_cache as cache_util
+import wblca_benchmark_v2_data_prep.lca_results.stored_carbon as stored_carbon_util
 import wblca_benchmark_v2_data_prep.utils.general as general_util
 from wblca_benchmark_v2_data_prep.lca_results.MappingImplementation import (
+    OneClickElementMapper,
+    OneClickMaterialQuantityMapper,
+    OneClickRefinedElementMapper,
     TallyElementMapper,
     TallyRefinedElementMapper,
     TallyMaterialQuantityMapper,
+    configured_mapper_options,
 )
+import wblca_benchmark_v2_data_prep.lca_results.all_ele_filters as ele
+import wblca_benchmark_v2_data_prep.lca_results.all_mat_filters as mat
 import wblca_benchmark_v2_data_prep.lca_results.comb_refined_ele_filters as ref
+import wblca_benchmark_v2_data_prep.lca_results.oneclick_ele_filters as oc_efi
+import wblca_benchmark_v2_data_prep.lca_results.oneclick_mat_filters as oc_mfi
+import wblca_benchmark_v2_data_prep.lca_results.refined_mat_filters as ref_mat
 import wblca_benchmark_v2_data_prep.lca_results.tally_ele_filters as t_efi
 import wblca_benchmark_v2_data_prep.lca_results.tally_mat_filters as t_mfi
 
@@ -22,8 +37,13 @@ def clean_raw_tally_files(tally_dir):
     - adjusts the csi division of tally walls
     - returns cleaned tally dataframes
     """
+    return clean_tally_files(tally_dir.glob("*.csv"))
+
+
+def clean_tally_files(tally_files):
+    """Clean the provided raw tally files, see clean_raw_tally_files."""
     cleaned_dfs = []
-    for tally_file in tally_dir.glob("*.csv"):
+    for tally_file in tally_files:
         # read tally files
         tally_df = general_util.read_csv(tally_file)
         tally_df = clean_util.clean_tally_df(tally_df=tally_df, tally_file=tally_file)
@@ -42,47 +62,46 @@ def clean_raw_oneclick_files(oneclick_dir):
     - Cleans oneclick files
     - writes oneclick files to cleaned directory
     """
+    return clean_oneclick_files(oneclick_dir.glob("*.xlsx"))
+
+
+def clean_oneclick_files(oneclick_files, ingestion=None):
+    """Clean the provided raw One Click LCA files, see clean_raw_oneclick_files.
+
+    Args:
+        oneclick_files (List[Path]): Raw One Click LCA files
+        ingestion (ExcelIngestion): Reads the workbooks, every column without a
+            cache if None
+    """
+    if ingestion is None:
+        ingestion = ingestion_util.ExcelIngestion()
     cleaned_dfs = []
-    for oneclick_file in oneclick_dir.glob("*.xlsx"):
+    for oneclick_file in oneclick_files:
         # read oneclick files
-        oneclick_df = clean_util.read_excel(oneclick_file)
+        oneclick_df = ingestion.read(oneclick_file)
         oneclick_df = clean_util.clean_oneclick_df(
             oneclick_df=oneclick_df, oneclick_file=oneclick_file
         )
-        cleaned_dfs.append(oneclick_df)
+        # CLF Model ID is a column, as in the files 1_clean writes, harmonize sets the index
+        cleaned_dfs.append(oneclick_df.reset_index())
 
     return cleaned_dfs
 
 
-def add_stored_carbon_to_tally_dfs(tally_dfs):
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    reference_dir = os.path.join(base_dir, "../../references/stored_carbon_database.xlsx")
-    stored_bio_database_path = Path(reference_dir)
-    full_stored_bio_database = pd.read_excel(stored_bio_database_path, sheet_name="csc")
-    stored_bio_data_short = full_stored_bio_database[
-        ["Name_Tally Material", "Stored Carbon (C02eq/kg)"]
-    ]
-    merged_dfs = []
-    for tally_df in tally_dfs:
-        merged_tally_df = tally_df.merge(
-            right=stored_bio_data_short,
-            left_on="Material Name",
-            right_on="Name_Tally Material",
-            how="left",
-        )
-        merged_tally_df["Stored Biogenic Carbon"] = 0.0
-        merged_tally_df.loc[
-            (merged_tally_df["Life Cycle Stage"] == "[A1-A3] Product")
-            | (merged_tally_df["Life Cycle Stage"] == "Product"),
-            "Stored Biogenic Carbon",
-        ] = (
-            merged_tally_df["Mass Total (kg)"] * merged_tally_df["Stored Carbon (C02eq/kg)"]
-        )
-        merged_dfs.append(merged_tally_df)
-    return merged_dfs
+def add_stored_carbon_to_tally_dfs(tally_dfs, lookup=None):
+    """Add stored carbon to cleaned Tally models.
+
+    Args:
+        tally_dfs (List[pd.DataFrame]): Cleaned Tally models
+        lookup (StoredCarbonLookup): Stored carbon factors by material name, the
+            configured lookup of references/stored_carbon_database.xlsx if None
+    """
+    if lookup is None:
+        lookup = stored_carbon_util.configured_lookup(Path(__file__).parents[2])
+    return [lookup.add_stored_carbon(tally_df) for tally_df in tally_dfs]
 
 
-def map_tally_elements(tally_dfs):
+def map_tally_elements(tally_dfs, cache_dir=None, mapper_options=None):
     """Maps Tally elements.
 
     This function does the following:
@@ -91,7 +110,14 @@ def map_tally_elements(tally_dfs):
     - Instantiates a mapper object
     - Loops through the filters and applies them to the tally dataframe
     - Returns the element mapped df
+
+    With cache_dir, only entries missing from the mapping cache are classified.
+
+    mapper_options are the filter engine arguments of the mappers, those set in
+    references/config_lca_results.yml if None.
     """
+    if mapper_options is None:
+        mapper_options = configured_mapper_options(Path(__file__).parents[2])
     tally_filters = [
         t_efi.CurtainWallPanels("CLF Omni"),
         t_efi.CurtainWallMullions("CLF Omni"),
@@ -108,19 +134,32 @@ def map_tally_elements(tally_dfs):
         t_efi.Windows("CLF Omni"),
     ]
 
-    element_mapped_dfs = []
-    for tally_df in tally_dfs:
-        Mapper = TallyElementMapper(tally_df, t_efi.Ceilings("CLF Omni"))
+    def classify(tally_df):
+        Mapper = TallyElementMapper(tally_df, t_efi.Ceilings("CLF Omni"), **mapper_options)
         Mapper.do_filtering()
 
         for fil in tally_filters:
             Mapper.change_filter_type(fil)
             Mapper.do_filtering()
-        element_mapped_dfs.append(Mapper.df)
+        return Mapper.df
+
+    cache = cache_util.load_cache(
+        directory=cache_dir,
+        stage="tally_elements",
+        predicates=ele.define_tally_filters(),
+        filters=[t_efi.Ceilings("CLF Omni")] + tally_filters,
+        label_columns=["CLF Omni"],
+    )
+
+    element_mapped_dfs = []
+    for tally_df in tally_dfs:
+        element_mapped_dfs.append(cache_util.map_with_cache(cache, tally_df, classify))
     return element_mapped_dfs
 
 
-def map_tally_materials(tally_dfs):
+def map_tally_materials(tally_dfs, cache_dir=None, mapper_options=None):
+    if mapper_options is None:
+        mapper_options = configured_mapper_options(Path(__file__).parents[2])
     tally_material_quantity_one_filters = [
         t_mfi.ConcreteMaterialQuantityOne("MQ_1"),
         t_mfi.SteelMaterialQuantityOne("MQ_1"),
@@ -174,81 +213,390 @@ def map_tally_materials(tally_dfs):
         t_mfi.FinalOtherMaterialQuantityTwoOther("MQ_2")
     ]
 
+    def classify(tally_df):
+        MaterialQuantityMapper = TallyMaterialQuantityMapper(tally_df, **mapper_options)
+
+        for fil in tally_material_quantity_one_filters:
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
+
+        # recompute only the filters on columns written so far
+        MaterialQuantityMapper.refresh_filters()
+        for fil in tally_material_quantity_two_filters:
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
+
+        MaterialQuantityMapper.refresh_filters()
+        for fil in tally_material_quantity_one_other_filters:
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
+
+        MaterialQuantityMapper.refresh_filters()
+        for fil in tally_material_quantity_two_other_filters:
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
+
+        MaterialQuantityMapper.refresh_filters()
+        for fil in tally_material_quantity_two_unique_other_filters:
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
+
+        return MaterialQuantityMapper.df
+
+    cache = cache_util.load_cache(
+        directory=cache_dir,
+        stage="tally_materials",
+        predicates=mat.define_tally_filters(),
+        filters=tally_material_quantity_one_filters
+        + tally_material_quantity_two_filters
+        + tally_material_quantity_one_other_filters
+        + tally_material_quantity_two_other_filters
+        + tally_material_quantity_two_unique_other_filters,
+        label_columns=["MQ_1", "MQ_2"],
+    )
+
     mq_tally_dfs = []
     for tally_df in tally_dfs:
-        MaterialQuantityOneMapper = TallyMaterialQuantityMapper(
-            tally_df,
-        )
+        mq_tally_dfs.append(cache_util.map_with_cache(cache, tally_df, classify))
+    return mq_tally_dfs
 
-        for fil in tally_material_quantity_one_filters:
-            MaterialQuantityOneMapper.change_filter_type(fil)
-            MaterialQuantityOneMapper.do_filtering()
 
-        material_quantity_one_updated_tally_df = MaterialQuantityOneMapper.df
+def map_tally_elements_refined(tally_dfs, cache_dir=None, mapper_options=None):
+    """
+    Maps Tally elements a second time.
 
-        # instantiate Material Mapper for Material Quantity Two using updated df
-        MaterialQuantityTwoMapper = TallyMaterialQuantityMapper(
-            material_quantity_one_updated_tally_df,
-        )
+    This script does the following:
 
-        for fil in tally_material_quantity_two_filters:
-            MaterialQuantityTwoMapper.change_filter_type(fil)
-            MaterialQuantityTwoMapper.do_filtering()
+    - Instatiates the refined element mapper.
+    - filters the tally file based on material mapping that has occured.
+    - Returns the ref_ele_mapped data frames
 
-        mq_one_and_two_updated_tally_df = MaterialQuantityTwoMapper.df
+    mapper_options are the filter engine arguments of the mappers, those set in
+    references/config_lca_results.yml if None.
+    """
+    if mapper_options is None:
+        mapper_options = configured_mapper_options(Path(__file__).parents[2])
 
-        # instantiate Material Mapper for Material Quantity one of other materials using updated df
-        MaterialQuantityOneOtherMapper = TallyMaterialQuantityMapper(
-            mq_one_and_two_updated_tally_df,
+    def classify(tally_df):
+        # instantiate ElementMapper
+        Mapper = TallyRefinedElementMapper(
+            tally_df, ref.RefinedElementFilter("CLF Omni"), **mapper_options
         )
+        Mapper.do_filtering()
+        return Mapper.df
 
-        for fil in tally_material_quantity_one_other_filters:
-            MaterialQuantityOneOtherMapper.change_filter_type(fil)
-            MaterialQuantityOneOtherMapper.do_filtering()
+    cache = cache_util.load_cache(
+        directory=cache_dir,
+        stage="tally_elements_refined",
+        predicates=ref_mat.define_refined_filters(),
+        filters=[ref.RefinedElementFilter("CLF Omni")],
+        label_columns=["CLF Omni"],
+    )
 
-        mq_one_two_and_other_one_updated_tally_df = MaterialQuantityOneOtherMapper.df
+    refined_tally_dfs = []
+    for tally_df in tally_dfs:
+        refined_tally_dfs.append(cache_util.map_with_cache(cache, tally_df, classify))
+    return refined_tally_dfs
 
-        # instantiate Material Mapper for Material Quantity Two using updated df
-        MaterialQuantityTwoOtherMapper = TallyMaterialQuantityMapper(
-            mq_one_two_and_other_one_updated_tally_df,
-        )
 
-        for fil in tally_material_quantity_two_other_filters:
-            MaterialQuantityTwoOtherMapper.change_filter_type(fil)
-            MaterialQuantityTwoOtherMapper.do_filtering()
+def map_oneclick_elements(oneclick_dfs, cache_dir=None, mapper_options=None):
+    """Maps One Click elements.
+
+    This function does the following:
+
+    - Instantiates filters created in oneclick_ele_filters
+    - Instantiates a mapper object
+    - Loops through the filters and applies them to the oneclick dataframe
+    - Returns the element mapped df
 
-        mq_one_two_and_other_one_two_updated_tally_df = MaterialQuantityTwoOtherMapper.df
+    With cache_dir, only entries missing from the mapping cache are classified.
 
-        # instantiate Material Mapper for Material Quantity Two using updated df
-        MaterialQuantityTwoFinalOtherMapper = TallyMaterialQuantityMapper(
-            mq_one_two_and_other_one_two_updated_tally_df,
+    mapper_options are the filter engine arguments of the mappers, those set in
+    references/config_lca_results.yml if None.
+    """
+    if mapper_options is None:
+        mapper_options = configured_mapper_options(Path(__file__).parents[2])
+    oneclick_filters = [
+        oc_efi.OmniClassShellSuperstructure("CLF Omni"),
+        oc_efi.OmniClassShellEnclosure("CLF Omni"),
+        oc_efi.OmniClassInteriorConstruction("CLF Omni"),
+        oc_efi.OmniClassInteriorFinishes("CLF Omni"),
+        oc_efi.OmniClassMEP("CLF Omni"),
+        oc_efi.OmniClassNotDefined("CLF Omni"),
+        oc_efi.CSIDivision("CLF Omni"),
+    ]
+
+    def classify(oneclick_df):
+        Mapper = OneClickElementMapper(
+            oneclick_df, oc_efi.OmniClassSubstructure("CLF Omni"), **mapper_options
         )
+        Mapper.do_filtering()
 
-        for fil in tally_material_quantity_two_unique_other_filters:
-            MaterialQuantityTwoFinalOtherMapper.change_filter_type(fil)
-            MaterialQuantityTwoFinalOtherMapper.do_filtering()
+        for fil in oneclick_filters:
+            Mapper.change_filter_type(fil)
+            Mapper.do_filtering()
+        return Mapper.df
 
-        mq_tally_dfs.append(MaterialQuantityTwoFinalOtherMapper.df)
-    return mq_tally_dfs
+    cache = cache_util.load_cache(
+        directory=cache_dir,
+        stage="oneclick_elements",
+        predicates=ele.define_oneclick_filters(),
+        filters=[oc_efi.OmniClassSubstructure("CLF Omni")] + oneclick_filters,
+        label_columns=["CLF Omni"],
+    )
+
+    element_mapped_dfs = []
+    for oneclick_df in oneclick_dfs:
+        element_mapped_dfs.append(cache_util.map_with_cache(cache, oneclick_df, classify))
+    return element_mapped_dfs
 
 
-def map_tally_elements_refined(tally_dfs):
+def map_oneclick_materials(oneclick_dfs, cache_dir=None, mapper_options=None):
+    if mapper_options is None:
+        mapper_options = configured_mapper_options(Path(__file__).parents[2])
+    oneclick_material_quantity_one_filters = [
+        oc_mfi.ConcreteMaterialQuantityOne("MQ_1"),
+        oc_mfi.SteelMaterialQuantityOne("MQ_1"),
+        oc_mfi.MasonryMaterialQuantityOne("MQ_1"),
+        oc_mfi.AluminumMaterialQuantityOne("MQ_1"),
+        oc_mfi.WoodMaterialQuantityOne("MQ_1"),
+        oc_mfi.GlazingMaterialQuantityOne("MQ_1"),
+        oc_mfi.RoofMaterialQuantityOne("MQ_1"),
+        oc_mfi.InsulationMaterialQuantityOne("MQ_1"),
+        oc_mfi.GypsumMaterialQuantityOne("MQ_1"),
+        oc_mfi.FireproofMaterialQuantityOne("MQ_1"),
+    ]
+    oneclick_material_quantity_two_filters = [
+        oc_mfi.ConcreteMaterialQuantityTwo("MQ_2"),
+        oc_mfi.SteelMaterialQuantityTwo("MQ_2"),
+        oc_mfi.MasonryMaterialQuantityTwo("MQ_2"),
+        oc_mfi.AluminumMaterialQuantityTwo("MQ_2"),
+        oc_mfi.WoodMaterialQuantityTwo("MQ_2"),
+        oc_mfi.GlazingMaterialQuantityTwo("MQ_2"),
+        oc_mfi.RoofMaterialQuantityTwo("MQ_2"),
+        oc_mfi.InsulationMaterialQuantityTwo("MQ_2"),
+        oc_mfi.GypsumMaterialQuantityTwo("MQ_2"),
+        oc_mfi.FireproofMaterialQuantityTwo("MQ_2"),
+    ]
+    oneclick_material_quantity_one_other_filters = [
+        oc_mfi.DoorFrameMaterialQuantityOneOther("MQ_1"),
+        oc_mfi.WindowFrameMaterialQuantityOneOther("MQ_1"),
+        oc_mfi.AcousticCeilingsMaterialQuantityOneOther("MQ_1"),
+        oc_mfi.SyntheticCompositesMaterialQuantityOneOther("MQ_1"),
+        oc_mfi.CladdingMaterialQuantityOneOther("MQ_1"),
+        oc_mfi.AdhesivesMaterialQuantityOneOther("MQ_1"),
+        oc_mfi.AirVaporMaterialQuantityOneOther("MQ_1"),
+        oc_mfi.CoatingsMaterialQuantityOneOther("MQ_1"),
+        oc_mfi.FloorTileMaterialQuantityOneOther("MQ_1"),
+        oc_mfi.OtherMetalsMaterialQuantityOneOther("MQ_1"),
+        oc_mfi.WallCoveringsMaterialQuantityOneOther("MQ_1"),
+    ]
+    oneclick_material_quantity_two_other_filters = [
+        oc_mfi.DoorFrameMaterialQuantityTwoOther("MQ_2"),
+        oc_mfi.WindowFrameMaterialQuantityTwoOther("MQ_2"),
+        oc_mfi.AcousticCeilingsMaterialQuantityTwoOther("MQ_2"),
+        oc_mfi.SyntheticCompositesMaterialQuantityTwoOther("MQ_2"),
+        oc_mfi.CladdingMaterialQuantityTwoOther("MQ_2"),
+        oc_mfi.AdhesivesMaterialQuantityTwoOther("MQ_2"),
+        oc_mfi.AirVaporMaterialQuantityTwoOther("MQ_2"),
+        oc_mfi.CoatingsMaterialQuantityTwoOther("MQ_2"),
+        oc_mfi.FloorTileMaterialQuantityTwoOther("MQ_2"),
+        oc_mfi.OtherMetalsMaterialQuantityTwoOther("MQ_2"),
+        oc_mfi.ConcreteReadyMixMaterialQuantityTwo("MQ_2"),
+    ]
+    oneclick_material_quantity_two_unique_other_filters = [
+        oc_mfi.FinalOtherMaterialQuantityTwoOther("MQ_2")
+    ]
+
+    def classify(oneclick_df):
+        MaterialQuantityMapper = OneClickMaterialQuantityMapper(oneclick_df, **mapper_options)
+
+        for fil in oneclick_material_quantity_one_filters:
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
+
+        # recompute only the filters on columns written so far
+        MaterialQuantityMapper.refresh_filters()
+        for fil in oneclick_material_quantity_two_filters:
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
+
+        MaterialQuantityMapper.refresh_filters()
+        for fil in oneclick_material_quantity_one_other_filters:
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
+
+        MaterialQuantityMapper.refresh_filters()
+        for fil in oneclick_material_quantity_two_other_filters:
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
+
+        MaterialQuantityMapper.refresh_filters()
+        for fil in oneclick_material_quantity_two_unique_other_filters:
+            MaterialQuantityMapper.change_filter_type(fil)
+            MaterialQuantityMapper.do_filtering()
+
+        return MaterialQuantityMapper.df
+
+    cache = cache_util.load_cache(
+        directory=cache_dir,
+        stage="oneclick_materials",
+        predicates=mat.define_oneclick_filters(),
+        filters=oneclick_material_quantity_one_filters
+        + oneclick_material_quantity_two_filters
+        + oneclick_material_quantity_one_other_filters
+        + oneclick_material_quantity_two_other_filters
+        + oneclick_material_quantity_two_unique_other_filters,
+        label_columns=["MQ_1", "MQ_2"],
+    )
+
+    mq_oneclick_dfs = []
+    for oneclick_df in oneclick_dfs:
+        mq_oneclick_dfs.append(cache_util.map_with_cache(cache, oneclick_df, classify))
+    return mq_oneclick_dfs
+
+
+def map_oneclick_elements_refined(oneclick_dfs, cache_dir=None, mapper_options=None):
     """
-    Maps Tally elements a second time.
+    Maps One Click elements a second time.
 
     This script does the following:
 
     - Instatiates the refined element mapper.
-    - filters the tally file based on material mapping that has occured.
+    - filters the oneclick file based on material mapping that has occured.
     - Returns the ref_ele_mapped data frames
+
+    mapper_options are the filter engine arguments of the mappers, those set in
+    references/config_lca_results.yml if None.
     """
-    refined_tally_dfs = []
-    for tally_df in tally_dfs:
-        # instantiate ElementMapper
-        Mapper = TallyRefinedElementMapper(tally_df, ref.RefinedElementFilter("CLF Omni"))
+    if mapper_options is None:
+        mapper_options = configured_mapper_options(Path(__file__).parents[2])
+
+    def classify(oneclick_df):
+        Mapper = OneClickRefinedElementMapper(
+            oneclick_df, ref.RefinedElementFilter("CLF Omni"), **mapper_options
+        )
         Mapper.do_filtering()
-        refined_tally_dfs.append(Mapper.df)
-    return refined_tally_dfs
+        return Mapper.df
+
+    cache = cache_util.load_cache(
+        directory=cache_dir,
+        stage="oneclick_elements_refined",
+        predicates=ref_mat.define_refined_filters(),
+        filters=[ref.RefinedElementFilter("CLF Omni")],
+        label_columns=["CLF Omni"],
+    )
+
+    refined_oneclick_dfs = []
+    for oneclick_df in oneclick_dfs:
+        refined_oneclick_dfs.append(cache_util.map_with_cache(cache, oneclick_df, classify))
+    return refined_oneclick_dfs
+
+
+def process_tally_files(tally_files, cache_dir=None):
+    """Clean, add stored carbon to and map the provided raw tally files.
+
+    Args:
+        tally_files (List[Path]): Raw tally files
+        cache_dir (str): Directory of the mapping caches, None to classify every entry
+
+    Returns:
+        List[pd.DataFrame]: Refined element mapped dataframes in the order of the files
+    """
+    cleaned_tally_dfs = clean_tally_files(tally_files)
+    sc_tally_dfs = add_stored_carbon_to_tally_dfs(cleaned_tally_dfs)
+    element_mapped_dfs = map_tally_elements(sc_tally_dfs, cache_dir)
+    material_mapped_dfs = map_tally_materials(element_mapped_dfs, cache_dir)
+    return map_tally_elements_refined(material_mapped_dfs, cache_dir)
+
+
+def process_oneclick_files(oneclick_files, cache_dir=None, ingestion=None):
+    """Clean and map the provided raw One Click LCA files.
+
+    Args:
+        oneclick_files (List[Path]): Raw One Click LCA files
+        cache_dir (str): Directory of the mapping caches, None to classify every entry
+        ingestion (ExcelIngestion): Reads the workbooks, see clean_oneclick_files
+
+    Returns:
+        List[pd.DataFrame]: Refined element mapped dataframes in the order of the files
+    """
+    cleaned_oneclick_dfs = clean_oneclick_files(oneclick_files, ingestion)
+    element_mapped_dfs = map_oneclick_elements(cleaned_oneclick_dfs, cache_dir)
+    material_mapped_dfs = map_oneclick_materials(element_mapped_dfs, cache_dir)
+    return map_oneclick_elements_refined(material_mapped_dfs, cache_dir)
+
+
+def process_in_parallel(process_files, files, cache_dir=None, jobs=1):
+    """Run process_files over chunks of files in a pool of worker processes.
+
+    Each worker runs the whole chain on its chunk of models. Results are returned
+    in the order of files regardless of which worker finishes first.
+
+    Args:
+        process_files (Callable): process_tally_files or process_oneclick_files
+        files (List[Path]): Raw files to process
+        cache_dir (str): Directory of the mapping caches, None to classify every entry
+        jobs (int): Number of worker processes, 1 processes the files in this process
+
+    Returns:
+        List[pd.DataFrame]: Processed dataframes in the order of files
+    """
+    if jobs <= 1 or len(files) <= 1:
+        return process_files(files, cache_dir)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return _collect(_submit_chunks(executor, process_files, files, cache_dir, jobs))
+
+
+def _submit_chunks(executor, process_files, files, cache_dir, jobs):
+    """Submit process_files on chunks of files, returning the futures in order."""
+    if not files:
+        return []
+    # a few chunks per worker balance the load while reading the caches once a chunk
+    chunk_size = math.ceil(len(files) / (jobs * 4))
+    chunks = [files[i : i + chunk_size] for i in range(0, len(files), chunk_size)]
+    return [executor.submit(process_files, chunk, cache_dir) for chunk in chunks]
+
+
+def _collect(futures):
+    """Processed dataframes of the chunks, in the order they were submitted."""
+    processed_dfs = []
+    for future in futures:
+        processed_dfs.extend(future.result())
+    return processed_dfs
+
+
+def process_all_files(tally_files, oneclick_files, cache_dir=None, jobs=1, ingestion=None):
+    """Process Tally and One Click LCA files, the two tools at the same time.
+
+    With jobs > 1 the chunks of both tools are submitted to one pool of worker
+    processes, so the workers are never idle while one of the tools has models
+    left, and neither tool gets a pool of its own competing for the cores.
+
+    Args:
+        tally_files (List[Path]): Raw tally files
+        oneclick_files (List[Path]): Raw One Click LCA files
+        cache_dir (str): Directory of the mapping caches, None to classify every entry
+        jobs (int): Number of worker processes, 1 processes the files in this process
+        ingestion (ExcelIngestion): Reads the workbooks, see clean_oneclick_files
+
+    Returns:
+        Tuple[List[pd.DataFrame], List[pd.DataFrame]]: Processed Tally and One Click
+            dataframes, each in the order of its files
+    """
+    process_oneclick = partial(process_oneclick_files, ingestion=ingestion)
+    if jobs <= 1:
+        return (
+            process_tally_files(tally_files, cache_dir),
+            process_oneclick(oneclick_files, cache_dir),
+        )
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        tally_futures = _submit_chunks(executor, process_tally_files, tally_files, cache_dir, jobs)
+        oneclick_futures = _submit_chunks(
+            executor, process_oneclick, oneclick_files, cache_dir, jobs
+        )
+        return _collect(tally_futures), _collect(oneclick_futures)
 
 
 def harmonize(combined_tally_df=None, oneclick_df=None):
@@ -301,6 +649,47 @@ def harmonize(combined_tally_df=None, oneclick_df=None):
         except Exception as e:
             print(f"Unable to complete harmonization for tally files: {e}")
 
+    if oneclick_df is not None:
+        column_removal_oneclick = config.get("column_removal_oneclick")
+        assert (
+            column_removal_oneclick is not None
+        ), "The list for column removal for One Click \
+    could not be set"
+
+        column_rename_oneclick = config.get("column_rename_oneclick")
+        assert (
+            column_rename_oneclick is not None
+        ), "The dict for column renaming for One Click \
+    could not be set"
+
+        column_null_replacement = config.get("column_null_replacement")
+        assert (
+            column_null_replacement is not None
+        ), "The list for column null replacement \
+    could not be set"
+
+        try:
+            oneclick_columns_to_drop = list(
+                set(oneclick_df.columns.to_list()) & set(column_removal_oneclick)
+            )
+            combined_oneclick_adjusted = (
+                oneclick_df.rename(columns=column_rename_oneclick)
+                .drop(columns=oneclick_columns_to_drop)
+                .set_index("CLF Model ID")
+            )
+            for df_key, value_to_replace_dict in config.get(
+                "column_value_replace_oneclick"
+            ).items():
+                combined_oneclick_adjusted[df_key] = combined_oneclick_adjusted[df_key].replace(
+                    value_to_replace_dict
+                )
+            for col_null_replace in column_null_replacement:
+                combined_oneclick_adjusted[col_null_replace] = combined_oneclick_adjusted[
+                    col_null_replace
+                ].fillna(0)
+        except Exception as e:
+            print(f"Unable to complete harmonization for oneclick files: {e}")
+
     combined_lca_output = None
     try:
         if combined_tally_adjusted is not None and combined_oneclick_adjusted is not None:
@@ -325,16 +714,89 @@ def harmonize(combined_tally_df=None, oneclick_df=None):
     return combined_lca_output
 
 
-def run_tally(tally_dir: str):
+def run_tally(tally_dir: str, cache_dir: str = None, jobs: int = 1):
+    """Clean, map and harmonize Tally files.
+
+    Args:
+        tally_dir (str): Directory of raw Tally files
+        cache_dir (str): Directory of the mapping caches, None to classify every entry
+        jobs (int): Number of worker processes mapping the models
+    """
     input_path = Path(tally_dir)
     main_directory = input_path.parents[2]
     output_path = main_directory.joinpath("lca_results/harmonized/")
-    cleaned_tally_dfs = clean_raw_tally_files(input_path)
-    sc_tally_dfs = add_stored_carbon_to_tally_dfs(cleaned_tally_dfs)
-    element_mapped_dfs = map_tally_elements(sc_tally_dfs)
-    material_mapped_dfs = map_tally_materials(element_mapped_dfs)
-    refined_element_dfs = map_tally_elements_refined(material_mapped_dfs)
+    tally_files = sorted(input_path.glob("*.csv"))
+    refined_element_dfs = process_in_parallel(process_tally_files, tally_files, cache_dir, jobs)
     combined_dfs = pd.concat(refined_element_dfs)
     combined_output = harmonize(combined_dfs)
     if combined_output is not None:
         combined_output.to_csv(output_path.joinpath("combined_harmonized_fn.csv"))
+
+
+def run_oneclick(oneclick_dir: str, cache_dir: str = None, jobs: int = 1):
+    """Clean, map and harmonize One Click LCA files.
+
+    Args:
+        oneclick_dir (str): Directory of raw One Click LCA files
+        cache_dir (str): Directory of the mapping caches, None to classify every entry
+        jobs (int): Number of worker processes mapping the models
+    """
+    input_path = Path(oneclick_dir)
+    main_directory = input_path.parents[2]
+    output_path = main_directory.joinpath("lca_results/harmonized/")
+    oneclick_files = sorted(input_path.glob("*.xlsx"))
+    ingestion = ingestion_util.configured_ingestion(Path(__file__).parents[2])
+    refined_element_dfs = process_in_parallel(
+        partial(process_oneclick_files, ingestion=ingestion), oneclick_files, cache_dir, jobs
+    )
+    combined_dfs = pd.concat(refined_element_dfs)
+    combined_output = harmonize(oneclick_df=combined_dfs)
+    if combined_output is not None:
+        combined_output.to_csv(output_path.joinpath("oneclick_harmonized_fn.csv"))
+
+
+def run_all(raw_dir: str, cache_dir: str = None, jobs: int = 1):
+    """Clean and map Tally and One Click LCA files together and harmonize both.
+
+    Args:
+        raw_dir (str): Directory with the tally and oneclick directories of raw files
+        cache_dir (str): Directory of the mapping caches, None to classify every entry
+        jobs (int): Number of worker processes mapping the models of both tools
+    """
+    input_path = Path(raw_dir)
+    main_directory = input_path.parents[1]
+    output_path = main_directory.joinpath("lca_results/harmonized/")
+    tally_files = sorted(input_path.joinpath("tally").glob("*.csv"))
+    oneclick_files = sorted(input_path.joinpath("oneclick").glob("*.xlsx"))
+    ingestion = ingestion_util.configured_ingestion(Path(__file__).parents[2])
+    tally_dfs, oneclick_dfs = process_all_files(
+        tally_files, oneclick_files, cache_dir, jobs, ingestion
+    )
+    combined_output = harmonize(
+        pd.concat(tally_dfs) if tally_dfs else None,
+        pd.concat(oneclick_dfs) if oneclick_dfs else None,
+    )
+    if combined_output is not None:
+        combined_output.to_csv(output_path.joinpath("combined_harmonized_fn.csv"))
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Clean, map and harmonize WBLCA model files.")
+    parser.add_argument(
+        "tool", choices=["tally", "oneclick", "all"], help="Tool of the models, all for both"
+    )
+    parser.add_argument(
+        "input_dir",
+        help="Directory of raw model files, with the tally and oneclick directories for all",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Number of worker processes mapping the models"
+    )
+    parser.add_argument("--cache-dir", default=None, help="Directory of the mapping caches")
+    args = parser.parse_args()
+    if args.tool == "tally":
+        run_tally(args.input_dir, cache_dir=args.cache_dir, jobs=args.jobs)
+    elif args.tool == "all":
+        run_all(args.input_dir, cache_dir=args.cache_dir, jobs=args.jobs)
+    else:
+        run_oneclick(args.input_dir, cache_dir=args.cache_dir, jobs=args.jobs)
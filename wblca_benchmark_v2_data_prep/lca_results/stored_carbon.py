@@ -0,0 +1,158 @@
+"""Lookup of the stored carbon factors of Tally materials by material name.
+
+references/stored_carbon_database.xlsx lists the stored carbon of biogenic
+materials by their Tally material name. StoredCarbonLookup compiles the database
+into a hash index of unique names and an array of their factors, so adding the
+stored carbon to a model factorizes its material names and looks each distinct
+name up once, instead of merging the database into the model. A name listed more
+than once keeps its first factor rather than repeating the rows of the model.
+
+The compiled lookup is cached under the sha256 of the workbook, so the workbook
+is only read again once it changes.
+"""
+
+import os
+import pickle
+from dataclasses import dataclass
+from functools import lru_cache
+from logging import getLogger
+from pathlib import Path
+from typing import Optional
+import numpy as np
+import pandas as pd
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+stored_carbon_logger = getLogger("lca_results.stored_carbon")
+
+NAME_COLUMN = "Name_Tally Material"
+FACTOR_COLUMN = "Stored Carbon (C02eq/kg)"
+
+# life cycle stages of the Tally rows whose mass stores carbon
+PRODUCT_STAGES = ("[A1-A3] Product", "Product")
+
+
+@dataclass(frozen=True)
+class StoredCarbonLookup:
+    """Stored carbon factors of Tally materials by unique material name.
+
+    Attributes:
+        names (pd.Index): Unique material names of the database
+        factors (np.ndarray): Stored carbon factor of each name, in order
+    """
+
+    names: pd.Index
+    factors: np.ndarray
+
+    def add_stored_carbon(self, tally_df: pd.DataFrame) -> pd.DataFrame:
+        """Add the stored carbon factor and stored biogenic carbon to a Tally model.
+
+        Adds the columns a left merge of the database on "Material Name" added:
+        the matched name and its factor, NaN for materials not in the database.
+        "Stored Biogenic Carbon" is the mass times the factor for the A1-A3 rows
+        and 0 for the others.
+
+        Args:
+            tally_df (pd.DataFrame): Cleaned Tally model
+
+        Returns:
+            pd.DataFrame: Copy of the model with the stored carbon columns
+        """
+        codes, material_names = pd.factorize(tally_df["Material Name"])
+        # position -1, of names not listed and of rows without a name, picks the NaN
+        positions = np.append(self.names.get_indexer(material_names), -1)[codes]
+        names = np.append(self.names.to_numpy(dtype=object), np.nan)[positions]
+        factors = np.append(self.factors, np.nan)[positions]
+
+        sc_tally_df = tally_df.assign(**{NAME_COLUMN: names, FACTOR_COLUMN: factors})
+        sc_tally_df["Stored Biogenic Carbon"] = 0.0
+        product = sc_tally_df["Life Cycle Stage"].isin(PRODUCT_STAGES)
+        sc_tally_df.loc[product, "Stored Biogenic Carbon"] = (
+            sc_tally_df["Mass Total (kg)"] * sc_tally_df[FACTOR_COLUMN]
+        )
+        return sc_tally_df
+
+
+def compile_lookup(database: pd.DataFrame) -> StoredCarbonLookup:
+    """Compile the stored carbon database into a lookup.
+
+    Args:
+        database (pd.DataFrame): "csc" sheet of the stored carbon database
+
+    Returns:
+        StoredCarbonLookup: Factor of every named material, the first one for
+            names listed more than once
+    """
+    database = database[[NAME_COLUMN, FACTOR_COLUMN]].dropna(subset=[NAME_COLUMN])
+    repeated = database[database[NAME_COLUMN].duplicated(keep=False)]
+    conflicting = repeated.groupby(NAME_COLUMN)[FACTOR_COLUMN].nunique(dropna=False) > 1
+    if conflicting.any():
+        stored_carbon_logger.warning(
+            "Materials listed with different stored carbon, using the first: %s",
+            conflicting.index[conflicting].to_list(),
+        )
+    database = database.drop_duplicates(subset=[NAME_COLUMN])
+    return StoredCarbonLookup(
+        pd.Index(database[NAME_COLUMN].to_numpy(dtype=object)),
+        database[FACTOR_COLUMN].to_numpy(dtype=float),
+    )
+
+
+@lru_cache(maxsize=2)
+def _load(database_path: Path, digest: str, cache_directory: Optional[Path]):
+    """Compile or unpickle the lookup of a version of the database."""
+    cache_path = None
+    if cache_directory is not None:
+        cache_path = cache_directory.joinpath(f"stored_carbon.{digest[:32]}.pkl")
+        if cache_path.exists():
+            try:
+                with open(cache_path, "rb") as file:
+                    return pickle.load(file)
+            except Exception:  # pylint: disable=W0718
+                stored_carbon_logger.warning("Unable to read %s, compiling again", cache_path)
+
+    stored_carbon_logger.info("Compile stored carbon lookup from %s", database_path.name)
+    lookup = compile_lookup(pd.read_excel(database_path, sheet_name="csc"))
+    if cache_path is not None:
+        cache_directory.mkdir(parents=True, exist_ok=True)
+        for stale_path in cache_directory.glob("stored_carbon.*.pkl"):
+            stale_path.unlink()
+        temporary_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary_path, "wb") as file:
+            pickle.dump(lookup, file)
+        os.replace(temporary_path, cache_path)
+    return lookup
+
+
+def load_lookup(
+    database_path: Path, cache_directory: Optional[Path] = None
+) -> StoredCarbonLookup:
+    """Load the lookup of the current version of the stored carbon database.
+
+    Args:
+        database_path (Path): Path of the stored carbon database workbook
+        cache_directory (Optional[Path]): Directory of the compiled lookup, None to
+            compile it once per process
+
+    Returns:
+        StoredCarbonLookup: Lookup of the database
+    """
+    return _load(database_path, gen.file_digest(database_path), cache_directory)
+
+
+def configured_lookup(main_directory: Path) -> StoredCarbonLookup:
+    """Load the lookup with the cache set in references/config_lca_results.yml.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        StoredCarbonLookup: Lookup of references/stored_carbon_database.xlsx
+    """
+    config = gen.read_yaml(main_directory.joinpath("references/config_lca_results.yml"))
+    cache_config = config.get("stored_carbon_cache") or {}
+    cache_directory = None
+    if cache_config.get("enabled", False):
+        cache_directory = main_directory.joinpath(cache_config["directory"])
+    return load_lookup(
+        main_directory.joinpath("references/stored_carbon_database.xlsx"), cache_directory
+    )
@@ -137,8 +137,10 @@ class MasonryMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("stone_cat_mat_two"), self.column_name_to_change] = (
-            MaterialQuantityOne.MASONRY.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.MASONRY.value,
+            mask=all_filters.get("stone_cat_mat_two"),
         )
         self.and_or_loc(
             df=df,
@@ -168,9 +170,11 @@ class AluminumMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[
-            all_filters.get("aluminum_cat_mat_three"), self.column_name_to_change
-        ] = MaterialQuantityOne.ALUMINUM.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.ALUMINUM.value,
+            mask=all_filters.get("aluminum_cat_mat_three"),
+        )
         self.and_or_loc(
             df=df,
             result=MaterialQuantityOne.OTHER.value,
@@ -214,9 +218,11 @@ class AluminumMaterialQuantityOne(AbstractFilter):
                 all_filters.get("extru_cat_mat_three"),
             ],
         )
-        df.loc[
-            all_filters.get("alum_mull_sys_cat_mat_five"), self.column_name_to_change
-        ] = MaterialQuantityOne.OTHER.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.OTHER.value,
+            mask=all_filters.get("alum_mull_sys_cat_mat_five"),
+        )
         return df
 
 
@@ -226,8 +232,10 @@ class WoodMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("wood_cat_mat_two"), self.column_name_to_change] = (
-            MaterialQuantityOne.WOOD.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.WOOD.value,
+            mask=all_filters.get("wood_cat_mat_two"),
         )
         return df
 
@@ -238,8 +246,10 @@ class GlazingMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("glazing_cat_mat_two"), self.column_name_to_change] = (
-            MaterialQuantityOne.GLAZING.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.GLAZING.value,
+            mask=all_filters.get("glazing_cat_mat_two"),
         )
         self.and_loc(
             df=df,
@@ -266,8 +276,10 @@ class RoofMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("roof_mem_cat_mat_two"), self.column_name_to_change] = (
-            MaterialQuantityOne.ROOF.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.ROOF.value,
+            mask=all_filters.get("roof_mem_cat_mat_two"),
         )
         self.or_loc(
             df=df,
@@ -362,9 +374,11 @@ class InsulationMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[
-            all_filters.get("insulation_cat_mat_two"), self.column_name_to_change
-        ] = MaterialQuantityOne.INSULATION.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.INSULATION.value,
+            mask=all_filters.get("insulation_cat_mat_two"),
+        )
         self.and_or_loc(
             df=df,
             result=MaterialQuantityOne.OTHER.value,
@@ -385,8 +399,10 @@ class GypsumMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("plaster_cat_mat_two"), self.column_name_to_change] = (
-            MaterialQuantityOne.GYPSUM.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.GYPSUM.value,
+            mask=all_filters.get("plaster_cat_mat_two"),
         )
         self.and_loc(
             df=df,
@@ -406,8 +422,10 @@ class FireproofMaterialQuantityOne(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("fireproof_cat_mat_two"), self.column_name_to_change] = (
-            MaterialQuantityOne.FIREPROOF.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.FIREPROOF.value,
+            mask=all_filters.get("fireproof_cat_mat_two"),
         )
         return df
 
@@ -432,8 +450,10 @@ class DoorFrameMaterialQuantityOneOther(AbstractFilter):
                 all_filters.get("opening_hardware_cat_mat_two"),
             ],
         )
-        df.loc[all_filters.get("door_cat_ele_four"), self.column_name_to_change] = (
-            MaterialQuantityOne.DOOR_FRAME.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityOne.DOOR_FRAME.value,
+            mask=all_filters.get("door_cat_ele_four"),
         )
         return df
 
@@ -1267,8 +1287,10 @@ class GypsumMaterialQuantityTwo(AbstractFilter):
     def filtering(
         self, df: pd.DataFrame, all_filters: Dict[str, pd.Series]
     ) -> pd.DataFrame:
-        df.loc[all_filters.get("gypsum_mq_one"), self.column_name_to_change] = (
-            MaterialQuantityTwo.INT_GYPSUM.value
+        self._assign(
+            df=df,
+            result=MaterialQuantityTwo.INT_GYPSUM.value,
+            mask=all_filters.get("gypsum_mq_one"),
         )
         self.and_loc(
             df=df,
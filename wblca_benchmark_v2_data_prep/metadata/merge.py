@@ -2,6 +2,7 @@
 
 from pathlib import Path
 from logging import getLogger
+from typing import Dict, Iterable
 import pandas as pd
 from wblca_benchmark_v2_data_prep.metadata.general import read_csv
 # pylint: disable=W0703
@@ -28,3 +29,32 @@ def read_energy_csv(file_path: Path) -> pd.DataFrame:
 
     merge_logger.info("Read %s and removed project and firm ids", file_path.stem)
     return df
+
+
+def index_firms(
+    files: Iterable[Path], suffixes: Dict[str, str]
+) -> Dict[str, Dict[str, Path]]:
+    """Find the cleaned project and energy tab csv files of every firm by file name.
+
+    The cleaned tabs of a firm are written to "{firm}{suffix}", so the firm and
+    the tab of a file are known from its name without reading it.
+
+    Args:
+        files (Iterable[Path]): file paths of cleaned csvs
+        suffixes (Dict[str, str]): file suffix of each tab, e.g.
+            {"project": "_project_det_cleaned.csv"}
+
+    Returns:
+        Dict[str, Dict[str, Path]]: file path of each tab by firm, firms in order of
+            their names
+    """
+    firm_files = {}
+    for file in sorted(files):
+        for tab, suffix in suffixes.items():
+            if file.name.endswith(suffix):
+                firm = file.name[: -len(suffix)]
+                firm_files.setdefault(firm, {})[tab] = file
+                break
+        else:
+            merge_logger.warning("%s is not a cleaned project or energy tab", file.name)
+    return firm_files
@@ -1,6 +1,9 @@
 """Utility functions of src.data.organize."""
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Dict, List, Sequence
 import logging
 import pandas as pd
 # pylint: disable=W0703, W0719
@@ -23,9 +26,29 @@ def read_excel(file_path: Path, sheet_name: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame of Excel sheet
     """
+    return read_excel_sheets(file_path, [sheet_name])[sheet_name]
+
+
+def read_excel_sheets(
+    file_path: Path, sheet_names: List[str]
+) -> Dict[str, pd.DataFrame]:
+    """Read several sheets of a raw Data Entry Template, opening the workbook once.
+
+    Args:
+        file_path (Path): file path of raw data entry template
+        sheet_names (List[str]): Excel sheet names to read
+
+    Raises:
+        PermissionError: Raised if function does not have permission to access file
+        IOError: Raised if file cannot be read
+        Exception: General exception just in case
+
+    Returns:
+        Dict[str, pd.DataFrame]: DataFrame of each Excel sheet by sheet name
+    """
     try:
         organize_logger.info("reading %s", file_path.stem)
-        df = pd.read_excel(file_path, sheet_name=sheet_name)
+        sheets = pd.read_excel(file_path, sheet_name=sheet_names)
     except PermissionError as pe:
         organize_logger.exception(
             "Permission Error probably caused by having file open"
@@ -37,9 +60,16 @@ def read_excel(file_path: Path, sheet_name: str) -> pd.DataFrame:
     except Exception as e:
         organize_logger.exception("Unknown error has occurred.")
         raise Exception("An unknown error has occured") from e
-    organize_logger.info(
-        "Read data from sheet %s from file %s", sheet_name, file_path.name
-    )
+    for sheet_name, df in sheets.items():
+        organize_logger.info(
+            "Read data from sheet %s from file %s", sheet_name, file_path.name
+        )
+        _name_det(df, file_path)
+    return sheets
+
+
+def _name_det(df: pd.DataFrame, file_path: Path) -> None:
+    """Set the firm name of a raw data entry template sheet in its attrs."""
     try:
         df.attrs = {
             # hard coded value of the firm name
@@ -56,7 +86,25 @@ def read_excel(file_path: Path, sheet_name: str) -> pd.DataFrame:
             "name": df.iloc[0, 3]
         }
 
-    return df
+
+def read_workbooks(
+    files: Sequence[Path], sheet_names: List[str], jobs: int = 1
+) -> Dict[Path, Dict[str, pd.DataFrame]]:
+    """Read sheets of raw Data Entry Templates, each workbook opened once.
+
+    Args:
+        files (Sequence[Path]): file paths of raw data entry templates
+        sheet_names (List[str]): Excel sheet names to read from every file
+        jobs (int): Number of worker processes, 1 reads the files in this process
+
+    Returns:
+        Dict[Path, Dict[str, pd.DataFrame]]: Sheets of each file by sheet name
+    """
+    read = partial(read_excel_sheets, sheet_names=sheet_names)
+    if jobs <= 1 or len(files) <= 1:
+        return dict(zip(files, map(read, files)))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return dict(zip(files, executor.map(read, files)))
 
 
 def replace_columns(
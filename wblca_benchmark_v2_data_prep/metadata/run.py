@@ -0,0 +1,378 @@
+"""Metadata pipeline on DataFrames in memory, see scripts/metadata.
+
+Each function does the work of one of the metadata scripts on the data entry
+templates of every firm, keyed by firm name, instead of reading the csv files
+written by the previous script. The scripts rely on the dtypes pandas infers when
+reading those files, e.g. the organized templates only hold object columns until
+they are read again, so templates are passed on the way the next script reads
+them: written to and read from a csv in memory. A template has one row per model,
+which makes this cheap next to the disk round trip it replaces.
+"""
+
+from io import StringIO
+from logging import getLogger
+from pathlib import Path
+from typing import Dict, List, Optional
+import pandas as pd
+import wblca_benchmark_v2_data_prep.metadata.clean as cl_utils
+import wblca_benchmark_v2_data_prep.metadata.finalize as fi_utils
+import wblca_benchmark_v2_data_prep.metadata.general as utils
+import wblca_benchmark_v2_data_prep.metadata.organize as o_utils
+
+run_logger = getLogger("metadata.run")
+
+Dets = Dict[str, pd.DataFrame]
+
+
+def _config(main_directory: Path, script: str) -> dict:
+    """Section of a script in references/config_metadata.yml."""
+    config = utils.read_yaml(main_directory.joinpath("references/config_metadata.yml"))
+    config_dict = config.get(script)
+    assert config_dict is not None, "The config dictionary could not be set"
+    return config_dict
+
+
+def as_read(df: pd.DataFrame, parse_dates: Optional[list] = None) -> pd.DataFrame:
+    """DataFrame as utils.read_csv reads it after utils.write_to_csv wrote it.
+
+    Args:
+        df (pd.DataFrame): Data entry template indexed by CLF Model ID
+        parse_dates (Optional[list]): Columns read as dates, as read_merged_csv does
+
+    Returns:
+        pd.DataFrame: Data entry template with the dtypes inferred from a csv
+    """
+    buffer = StringIO(df.to_csv())
+    if parse_dates is None:
+        read_df = pd.read_csv(buffer)
+    else:
+        read_df = pd.read_csv(buffer, parse_dates=parse_dates, date_format="%Y-%m-%d")
+    read_df = read_df.set_index("CLF Model ID")
+    read_df.attrs = {"name": read_df["CLF Firm ID"].unique()[0]}
+    return read_df
+
+
+def write_dets(
+    dets: Dets, write_directory: Path, file_suffix: str, module_description: str
+) -> List[Path]:
+    """Write data entry templates the way the scripts do.
+
+    Args:
+        dets (Dets): Data entry templates by firm name
+        write_directory (Path): Directory to write the csv files to
+        file_suffix (str): Suffix appended to the firm name
+        module_description (str): For logging, where the files have been saved
+
+    Returns:
+        List[Path]: Paths of the written files
+    """
+    paths = []
+    for det_df in dets.values():
+        utils.write_to_csv(det_df, write_directory, file_suffix, module_description)
+        paths.append(write_directory.joinpath(f"{det_df.attrs.get('name')}{file_suffix}"))
+    return paths
+
+
+RawDets = Dict[Path, Dict[str, pd.DataFrame]]
+
+
+def read_raw_dets(main_directory: Path) -> RawDets:
+    """Read the project and energy tabs of every raw data entry template.
+
+    Each workbook is opened once for both tabs, in the worker processes set by
+    jobs of 1_organize, see scripts/metadata/1_organize.py.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        RawDets: Sheets of each raw template by sheet name
+    """
+    config_dict = _config(main_directory, "1_organize")
+    raw_files = main_directory.joinpath(config_dict.get("read_data_directory")).glob(
+        config_dict.get("read_data_filter")
+    )
+    sheet_names = [config_dict.get(kind).get("sheet_name") for kind in ("project", "energy")]
+    return o_utils.read_workbooks(sorted(raw_files), sheet_names, config_dict.get("jobs") or 1)
+
+
+def organize_dets(
+    main_directory: Path, project_or_energy: str, raw_dets: Optional[RawDets] = None
+) -> Dets:
+    """Organize the project or energy tab of every raw data entry template.
+
+    See scripts/metadata/1_organize.py.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+        project_or_energy (str): "project" or "energy"
+        raw_dets (Optional[RawDets]): Raw templates read by read_raw_dets, None to
+            read the tab of each workbook
+
+    Returns:
+        Dets: Transposed data entry templates by firm name
+    """
+    config_dict = _config(main_directory, "1_organize")
+    project_or_energy_flag = config_dict.get(project_or_energy)
+    assert project_or_energy_flag is not None, (
+        "The config could not set project or energy variable"
+    )
+    replacements = utils.read_yaml(
+        main_directory.joinpath(config_dict.get("col_name_replacements"))
+    )
+    original_column_list = replacements.get(project_or_energy_flag.get("original_column_list"))
+    assert original_column_list is not None, (
+        "The function was not able to read the original column list"
+    )
+
+    dets = {}
+    raw_files = main_directory.joinpath(config_dict.get("read_data_directory")).glob(
+        config_dict.get("read_data_filter")
+    )
+    for file in sorted(raw_files):
+        run_logger.info("Begin organizing data entry template %s", file.stem)
+        sheet_name = project_or_energy_flag.get("sheet_name")
+        if raw_dets is not None and file in raw_dets:
+            # replace_columns changes the sheet, which may be organized again
+            df = raw_dets[file][sheet_name].copy()
+        else:
+            df = o_utils.read_excel(file, sheet_name)
+        o_utils.column_name_test(df, original_column_list)
+        df = o_utils.replace_columns(
+            df, replacements, project_or_energy_flag.get("replacement_list")
+        )
+        det_df = o_utils.transpose_data(df, project_or_energy_flag.get("column_list_to_remove"))
+        o_utils.column_name_after_transpose_test(det_df, original_column_list)
+        dets[det_df.attrs.get("name")] = det_df
+    return dets
+
+
+def write_organized_dets(main_directory: Path, project_or_energy: str, dets: Dets) -> List[Path]:
+    """Write organized data entry templates to the directory of 1_organize."""
+    config_dict = _config(main_directory, "1_organize")
+    return write_dets(
+        dets,
+        main_directory.joinpath(config_dict.get("write_data_directory")),
+        config_dict.get(project_or_energy).get("organized_file_suffix"),
+        config_dict.get("module_description"),
+    )
+
+
+def test_dets(project_or_energy: str, dets: Dets) -> Dict[str, list]:
+    """Test the values of organized data entry templates with pandera.
+
+    See scripts/metadata/2_test.py, errors are logged the same way.
+
+    Args:
+        project_or_energy (str): "project" or "energy"
+        dets (Dets): Organized data entry templates by firm name
+
+    Raises:
+        ValueError: Raised if project_or_energy is neither project nor energy
+
+    Returns:
+        Dict[str, list]: Schema errors of every firm whose template failed
+    """
+    # pylint: disable=C0415
+    import pandera as pa
+    import wblca_benchmark_v2_data_prep.metadata.schema_cache as schema_cache
+    import wblca_benchmark_v2_data_prep.metadata.validate as validate
+
+    main_directory = Path(__file__).parents[2]
+    schema = schema_cache.configured_schema(main_directory, project_or_energy)
+    full_validation = _config(main_directory, "2_test").get("full_validation", False)
+
+    errors = {}
+    for firm, det_df in dets.items():
+        test_df = as_read(det_df)
+        try:
+            validate.validate_frame(schema, test_df, full_validation)
+        except pa.errors.SchemaErrors as e:
+            errors[firm] = list(e.schema_errors)
+            for error in e.schema_errors:
+                run_logger.error(error)
+        run_logger.info("Finished testing schema for firm %s", test_df.attrs.get("name"))
+    return errors
+
+
+def clean_dets(main_directory: Path, project_or_energy: str, dets: Dets) -> Dets:
+    """Replace dropdown values and data types of organized data entry templates.
+
+    See scripts/metadata/3_clean.py, energy templates are passed on unchanged.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+        project_or_energy (str): "project" or "energy"
+        dets (Dets): Organized data entry templates by firm name
+
+    Raises:
+        ValueError: Raised if project_or_energy is neither project nor energy
+
+    Returns:
+        Dets: Cleaned data entry templates by firm name
+    """
+    if project_or_energy == "energy":
+        return {firm: as_read(det_df) for firm, det_df in dets.items()}
+    if project_or_energy != "project":
+        raise ValueError("project_or_energy can only have the inputs project or energy")
+
+    config_dict = _config(main_directory, "3_clean")
+    project_or_energy_flag = config_dict.get(project_or_energy)
+    dropdown_cols = utils.read_yaml(main_directory.joinpath(config_dict.get("dropdown_cols")))
+    dropdown_replacements = utils.read_yaml(
+        main_directory.joinpath(config_dict.get("dropdown_replacements"))
+    )
+    col_dtypes = utils.read_yaml(main_directory.joinpath(config_dict.get("col_dtypes")))
+    assert col_dtypes is not None, "The column dtypes yaml could not be read."
+    dtype_dict = col_dtypes.get(project_or_energy_flag.get("data_types"))
+    assert dtype_dict is not None, "The data types of the columns could not be read."
+    date_list = col_dtypes.get(project_or_energy_flag.get("parse_dates"))
+    assert date_list is not None, "The columns with date formats could not be read."
+
+    string_list = [key for (key, value) in dtype_dict.items() if value == "string"]
+    int_list = [key for (key, value) in dtype_dict.items() if value == "Int64"]
+    float_list = [key for (key, value) in dtype_dict.items() if value == "Float64"]
+
+    cleaned_dets = {}
+    for firm, det_df in dets.items():
+        run_logger.info("Begin cleaning data entry template of firm %s", firm)
+        df = cl_utils.dropdown_replace(as_read(det_df), dropdown_cols, dropdown_replacements)
+        cleaned_dets[firm] = cl_utils.data_type_replace(
+            df, string_list, int_list, float_list, list(date_list)
+        )
+    return cleaned_dets
+
+
+def write_cleaned_dets(main_directory: Path, project_or_energy: str, dets: Dets) -> List[Path]:
+    """Write cleaned data entry templates to the directory of 3_clean."""
+    config_dict = _config(main_directory, "3_clean")
+    return write_dets(
+        dets,
+        main_directory.joinpath(config_dict.get("write_data_directory")),
+        config_dict.get(project_or_energy).get("cleaned_file_suffix"),
+        config_dict.get("module_description"),
+    )
+
+
+def merge_dets(project_dets: Dets, energy_dets: Dets) -> Dets:
+    """Join the project and energy data entry templates of every firm.
+
+    See scripts/metadata/4_merge.py.
+
+    Args:
+        project_dets (Dets): Cleaned project data entry templates by firm name
+        energy_dets (Dets): Cleaned energy data entry templates by firm name
+
+    Returns:
+        Dets: Merged data entry templates by firm name
+    """
+    merged_dets = {}
+    for firm in dict.fromkeys([*project_dets, *energy_dets]):
+        run_logger.info("Merging for firm %s", firm)
+        e_det_df = as_read(energy_dets[firm]).drop(columns=["CLF Proj ID", "CLF Firm ID"])
+        merged_det = as_read(project_dets[firm]).join(e_det_df)
+        merged_det.attrs = {"name": firm}
+        merged_dets[firm] = merged_det
+    return merged_dets
+
+
+def write_merged_dets(main_directory: Path, dets: Dets) -> List[Path]:
+    """Write merged data entry templates to the directory of 4_merge."""
+    config_dict = _config(main_directory, "4_merge")
+    return write_dets(
+        dets,
+        main_directory.joinpath(config_dict.get("write_data_directory")),
+        config_dict.get("merged_file_suffix"),
+        config_dict.get("module_description"),
+    )
+
+
+def combine_dets(main_directory: Path, merged_dets: Dets) -> pd.DataFrame:
+    """Concatenate the merged data entry templates and test the values again.
+
+    See scripts/metadata/5_combine.py, schema errors are logged as warnings.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+        merged_dets (Dets): Merged data entry templates by firm name
+
+    Returns:
+        pd.DataFrame: Combined data entry template
+    """
+    # pylint: disable=C0415
+    import pandera as pa
+    import wblca_benchmark_v2_data_prep.metadata.schema_cache as schema_cache
+    import wblca_benchmark_v2_data_prep.metadata.validate as validate
+
+    config_dict = _config(main_directory, "5_combine")
+    col_dtypes = utils.read_yaml(main_directory.joinpath(config_dict.get("col_dtypes")))
+    final_df = pd.concat(
+        [as_read(det_df, col_dtypes.get("parse_dates")) for det_df in merged_dets.values()]
+    )
+    final_df.attrs = {"name": config_dict.get("dataframe_name")}
+
+    project_schema = schema_cache.configured_schema(main_directory, "project")
+    energy_schema = schema_cache.configured_schema(main_directory, "energy").remove_columns(
+        config_dict.get("schema_column_removal")
+    )
+    schema = project_schema.add_columns(energy_schema.columns)
+    try:
+        validate.validate_frame(schema, final_df, config_dict.get("full_validation", False))
+    except pa.errors.SchemaErrors as e:
+        for error in e.schema_errors:
+            run_logger.warning(error)
+    return final_df
+
+
+def write_combined_det(main_directory: Path, combined_det: pd.DataFrame) -> List[Path]:
+    """Write the combined data entry template to the directory of 5_combine."""
+    config_dict = _config(main_directory, "5_combine")
+    return write_dets(
+        {combined_det.attrs.get("name"): combined_det},
+        main_directory.joinpath(config_dict.get("write_data_directory")),
+        config_dict.get("file_suffix"),
+        config_dict.get("module_description"),
+    )
+
+
+def finalize_det(main_directory: Path, combined_det: pd.DataFrame) -> pd.DataFrame:
+    """Remove, rename, calculate and bin the columns of the combined template.
+
+    See scripts/metadata/6_finalize.py.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+        combined_det (pd.DataFrame): Combined data entry template
+
+    Returns:
+        pd.DataFrame: Finalized project data with clf_model_id as first column
+    """
+    config_dict = _config(main_directory, "6_finalize")
+    col_finalize = utils.read_yaml(main_directory.joinpath(config_dict.get("col_finalize")))
+
+    combined_det = as_read(combined_det)
+    combined_det.attrs = {"name": "Project_Data_Finalized"}
+    combined_det = combined_det.drop(columns=col_finalize.get("column_removal"))
+    combined_det = combined_det.rename(columns=col_finalize.get("column_renaming"))
+    combined_det = fi_utils.calculate_new_columns(combined_det, col_finalize)
+    combined_det = fi_utils.calculate_bins(combined_det)
+    combined_det = combined_det.rename(columns=col_finalize.get("column_finalizing"))
+    finalized_det = combined_det.rename_axis("clf_model_id").reset_index()
+    finalized_det.attrs = {"name": "Project_Data_Finalized"}
+    return finalized_det
+
+
+def write_finalized_det(main_directory: Path, finalized_det: pd.DataFrame) -> List[Path]:
+    """Write the finalized project data to the directories of 6_finalize."""
+    config_dict = _config(main_directory, "6_finalize")
+    paths = []
+    for directory in ("write_data_directory", "write_data_record_directory"):
+        paths.extend(
+            write_dets(
+                {"Project_Data_Finalized": finalized_det},
+                main_directory.joinpath(config_dict.get(directory)),
+                config_dict.get("file_suffix"),
+                "finalized",
+            )
+        )
+    return paths
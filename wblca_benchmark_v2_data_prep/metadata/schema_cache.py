@@ -0,0 +1,128 @@
+"""Built pandera schemas of the data entry templates, cached in and across processes.
+
+det_schema builds the project and energy schemas, some 1,800 lines of columns
+and checks, from references/dropdowns.yml on every call. get_schema builds each
+schema once per process and, given a cache directory, pickles it under the
+sha256 of dropdowns.yml, det_schema.py and the pandera version, so later runs
+unpickle it instead of building it and parsing the dropdowns again. A schema is
+built again once any of them change.
+
+The schemas returned are shared, use the methods that return a new schema, e.g.
+remove_columns or add_columns, rather than changing them in place.
+"""
+
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+from logging import getLogger
+from pathlib import Path
+from typing import Optional
+import pandas as pd
+import pandera
+from pandera import DataFrameSchema
+import wblca_benchmark_v2_data_prep.metadata.det_schema as det_schema
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+schema_logger = getLogger("metadata.schema_cache")
+
+SCHEMA_BUILDERS = {
+    "project": det_schema.get_project_det_schema,
+    "energy": det_schema.get_energy_det_schema,
+}
+
+DROPDOWNS_PATH = Path(det_schema.__file__).parents[2].joinpath("references/dropdowns.yml")
+
+
+def schema_key() -> str:
+    """Hash of everything the built schemas depend on.
+
+    Returns:
+        str: First 32 characters of the sha256 of dropdowns.yml, det_schema.py and
+            the pandera and pandas versions
+    """
+    digest = hashlib.sha256()
+    for file_path in (DROPDOWNS_PATH, Path(det_schema.__file__)):
+        digest.update(gen.file_digest(file_path).encode())
+    digest.update(f"{pandera.__version__};{pd.__version__}".encode())
+    return digest.hexdigest()[:32]
+
+
+@lru_cache(maxsize=4)
+def _load(project_or_energy: str, key: str, cache_directory: Optional[Path]) -> DataFrameSchema:
+    """Build or unpickle a schema of a version of the dropdowns and det_schema."""
+    cache_path = None
+    if cache_directory is not None:
+        cache_path = cache_directory.joinpath(f"{project_or_energy}_schema.{key}.pkl")
+        if cache_path.exists():
+            try:
+                with open(cache_path, "rb") as file:
+                    return pickle.load(file)
+            except Exception:  # pylint: disable=W0718
+                schema_logger.warning("Unable to read %s, building again", cache_path)
+
+    schema_logger.info("Build %s schema from %s", project_or_energy, DROPDOWNS_PATH.name)
+    schema = SCHEMA_BUILDERS[project_or_energy]()
+    if cache_path is not None:
+        cache_directory.mkdir(parents=True, exist_ok=True)
+        for stale_path in cache_directory.glob(f"{project_or_energy}_schema.*.pkl"):
+            stale_path.unlink()
+        temporary_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(temporary_path, "wb") as file:
+                pickle.dump(schema, file)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # e.g. a check built from a lambda, the schema is still cached in process
+            schema_logger.warning("Unable to pickle the %s schema", project_or_energy)
+            temporary_path.unlink(missing_ok=True)
+        else:
+            os.replace(temporary_path, cache_path)
+    return schema
+
+
+def get_schema(project_or_energy: str, cache_directory: Optional[Path] = None) -> DataFrameSchema:
+    """Get the schema of the project or energy tab of the data entry templates.
+
+    Args:
+        project_or_energy (str): "project" or "energy"
+        cache_directory (Optional[Path]): Directory of the pickled schemas, None to
+            build each schema once per process
+
+    Raises:
+        ValueError: Raised if project_or_energy is neither project nor energy
+
+    Returns:
+        DataFrameSchema: Schema of the current dropdowns, shared between calls
+    """
+    if project_or_energy not in SCHEMA_BUILDERS:
+        raise ValueError("project_or_energy can only have the inputs project or energy")
+    return _load(project_or_energy, schema_key(), cache_directory)
+
+
+def configured_directory(main_directory: Path) -> Optional[Path]:
+    """Get the schema cache directory set in references/config_metadata.yml.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        Optional[Path]: Directory of the pickled schemas, None if disabled
+    """
+    config = gen.read_yaml(main_directory.joinpath("references/config_metadata.yml"))
+    cache_config = config.get("schema_cache") or {}
+    if not cache_config.get("enabled", False):
+        return None
+    return main_directory.joinpath(cache_config["directory"])
+
+
+def configured_schema(main_directory: Path, project_or_energy: str) -> DataFrameSchema:
+    """Get a schema with the cache set in references/config_metadata.yml.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+        project_or_energy (str): "project" or "energy"
+
+    Returns:
+        DataFrameSchema: Schema of the current dropdowns, shared between calls
+    """
+    return get_schema(project_or_energy, configured_directory(main_directory))
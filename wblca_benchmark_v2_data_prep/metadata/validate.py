@@ -0,0 +1,296 @@
+"""Validation of organized data entry templates, in parallel worker processes.
+
+validate_files tests each organized template with the pandera schema of its tab,
+in a pool of jobs worker processes or in this process if jobs is 1. Each worker
+gets the schema from schema_cache, unpickled from the cache directory if one is
+set, so only the first run after the dropdowns change builds it. The failure
+cases of every template come back as rows of one table, see FAILURE_COLUMNS,
+written once for all templates by write_failure_cases.
+
+Most rows of a template pass, so validate_frame first tests the dropdowns, ranges
+and nulls the schema declares with vectorized pandas operations, see
+suspect_rows, and only runs pandera on the rows that fail them, which gives the
+same schema errors as running it on every row. Schemas or frames the fast checks
+cannot decide, e.g. a missing column or a value that cannot be coerced, are
+validated in full, as is every frame if full is set.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from logging import getLogger
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+import wblca_benchmark_v2_data_prep.metadata.general as utils
+import wblca_benchmark_v2_data_prep.metadata.schema_cache as schema_cache
+
+validate_logger = getLogger("metadata.validate")
+
+# columns of the failure cases table, model is the CLF Model ID of the failing row
+FAILURE_COLUMNS = ["firm", "model", "column", "check", "value"]
+
+
+# values passing each built-in check the fast checks know, by check name
+_CHECKS = {
+    "isin": lambda s, stats: s.isin(stats["allowed_values"]),
+    "notin": lambda s, stats: ~s.isin(stats["forbidden_values"]),
+    "equal_to": lambda s, stats: s == stats["value"],
+    "not_equal_to": lambda s, stats: s != stats["value"],
+    "greater_than": lambda s, stats: s > stats["min_value"],
+    "greater_than_or_equal_to": lambda s, stats: s >= stats["min_value"],
+    "less_than": lambda s, stats: s < stats["max_value"],
+    "less_than_or_equal_to": lambda s, stats: s <= stats["max_value"],
+}
+
+
+def _failing(series: pd.Series, check) -> Optional[np.ndarray]:
+    """Rows of series failing a check, None if the fast checks do not know it."""
+    passes = _CHECKS.get(getattr(check, "name", None))
+    if passes is None or not getattr(check, "ignore_na", True):
+        return None
+    passed = pd.Series(passes(series, check.statistics), index=series.index)
+    # like pandera, nulls pass the checks, only nullable decides on them
+    return (series.notna() & ~passed.fillna(False).astype(bool)).to_numpy()
+
+
+def _dtype_matches(component, dtype) -> bool:
+    """True if a column or index of the schema accepts a pandas dtype."""
+    # pylint: disable=C0415
+    from pandera.engines import pandas_engine
+
+    if component.dtype is None:
+        return True
+    try:
+        return bool(component.dtype.check(pandas_engine.Engine.dtype(dtype)))
+    except Exception:  # pylint: disable=W0718
+        return False
+
+
+def suspect_rows(schema, df: pd.DataFrame) -> Optional[np.ndarray]:
+    """Find the rows of df that may fail the schema, with vectorized checks.
+
+    Rows not found pass every column check, null and dtype coercion of the
+    schema, so pandera only needs to validate the others.
+
+    Args:
+        schema (DataFrameSchema): Schema to validate df with
+        df (pd.DataFrame): Data entry templates to validate
+
+    Returns:
+        Optional[np.ndarray]: Boolean mask of the rows to validate, None if df has
+            to be validated in full, e.g. if it lacks a required column or uses
+            checks the fast checks do not know
+    """
+    if schema.checks or getattr(schema, "unique", None):
+        return None
+    columns = schema.columns
+    missing = [
+        name for name, column in columns.items() if column.required and name not in df.columns
+    ]
+    extra = [name for name in df.columns if name not in columns]
+    if missing or (schema.strict and extra):
+        return None
+    if schema.coerce or any(column.coerce for column in columns.values()):
+        try:
+            df = schema.coerce_dtype(df)
+        except Exception:  # pylint: disable=W0718
+            # pandera reports each value it cannot coerce
+            return None
+
+    suspect = np.zeros(len(df), dtype=bool)
+    index = schema.index
+    if index is not None:
+        if index.checks or index.unique or not _dtype_matches(index, df.index.dtype):
+            return None
+        if not index.nullable:
+            suspect |= df.index.isna()
+    for name, column in columns.items():
+        if name not in df.columns:
+            continue
+        if column.regex or column.unique or isinstance(df[name], pd.DataFrame):
+            return None
+        series = df[name]
+        if not _dtype_matches(column, series.dtype):
+            # pandera reports the dtype of the column, whatever the rows
+            return None
+        if not column.nullable:
+            suspect |= series.isna().to_numpy()
+        for check in column.checks:
+            failing = _failing(series, check)
+            if failing is None:
+                return None
+            suspect |= failing
+    return suspect
+
+
+def validate_frame(schema, df: pd.DataFrame, full: bool = False) -> None:
+    """Validate df lazily, with pandera only on the rows the fast checks find.
+
+    Args:
+        schema (DataFrameSchema): Schema to validate df with
+        df (pd.DataFrame): Data entry templates to validate
+        full (bool): Validate every row with pandera, skipping the fast checks
+
+    Raises:
+        pandera.errors.SchemaErrors: Raised with the errors of the failing rows,
+            as schema.validate(df, lazy=True) raises them
+    """
+    if not full:
+        suspect = suspect_rows(schema, df)
+        if suspect is not None:
+            if not suspect.any():
+                validate_logger.info("All %s rows pass the fast checks", len(df))
+                return
+            validate_logger.info(
+                "Validating %s of %s rows failing the fast checks", suspect.sum(), len(df)
+            )
+            df = df[suspect]
+    schema.validate(df, lazy=True)
+
+
+@dataclass
+class Validation:
+    """Result of testing one data entry template.
+
+    Attributes:
+        firm (str): Name of the firm of the template
+        errors (List[str]): Messages of the schema errors, empty if it passed
+        failure_cases (pd.DataFrame): Failing values, see FAILURE_COLUMNS
+    """
+
+    firm: str
+    errors: List[str] = field(default_factory=list)
+    failure_cases: pd.DataFrame = field(
+        default_factory=lambda: pd.DataFrame(columns=FAILURE_COLUMNS)
+    )
+
+    @property
+    def passed(self) -> bool:
+        """True if the template has no schema errors."""
+        return not self.errors
+
+
+def failure_table(firm: str, failure_cases: pd.DataFrame) -> pd.DataFrame:
+    """Table of the failure cases of SchemaErrors for one firm.
+
+    Args:
+        firm (str): Name of the firm of the template
+        failure_cases (pd.DataFrame): failure_cases of pandera's SchemaErrors
+
+    Returns:
+        pd.DataFrame: Failure cases with the columns FAILURE_COLUMNS
+    """
+    return pd.DataFrame(
+        {
+            "firm": firm,
+            "model": failure_cases["index"].to_numpy(),
+            "column": failure_cases["column"].to_numpy(),
+            "check": failure_cases["check"].to_numpy(),
+            "value": failure_cases["failure_case"].to_numpy(),
+        },
+        columns=FAILURE_COLUMNS,
+    )
+
+
+def validate_file(
+    file_path: Path,
+    project_or_energy: str,
+    cache_directory: Optional[Path] = None,
+    full: bool = False,
+) -> Validation:
+    """Test an organized data entry template with the schema of its tab.
+
+    Args:
+        file_path (Path): Organized template csv
+        project_or_energy (str): "project" or "energy"
+        cache_directory (Optional[Path]): Directory of the pickled schemas, see
+            schema_cache.get_schema
+        full (bool): Validate every row with pandera, see validate_frame
+
+    Returns:
+        Validation: Errors and failure cases of the template
+    """
+    # pylint: disable=C0415
+    import pandera as pa
+
+    schema = schema_cache.get_schema(project_or_energy, cache_directory)
+    test_df = utils.read_csv(file_path)
+    firm = test_df.attrs.get("name")
+    try:
+        validate_frame(schema, test_df, full)
+    except pa.errors.SchemaErrors as e:
+        # the errors are passed back as text, SchemaError objects hold the data
+        return Validation(
+            firm,
+            [str(error) for error in e.schema_errors],
+            failure_table(firm, e.failure_cases),
+        )
+    return Validation(firm)
+
+
+def validate_files(
+    files: Sequence[Path],
+    project_or_energy: str,
+    cache_directory: Optional[Path] = None,
+    jobs: int = 1,
+    full: bool = False,
+) -> Iterator[Validation]:
+    """Test organized data entry templates, in a pool of worker processes.
+
+    Args:
+        files (Sequence[Path]): Organized template csvs
+        project_or_energy (str): "project" or "energy"
+        cache_directory (Optional[Path]): Directory of the pickled schemas
+        jobs (int): Number of worker processes, 1 tests the files in this process
+        full (bool): Validate every row with pandera, see validate_frame
+
+    Yields:
+        Validation: Result of each file, in the order of files
+    """
+    validate = partial(
+        validate_file,
+        project_or_energy=project_or_energy,
+        cache_directory=cache_directory,
+        full=full,
+    )
+    if jobs <= 1 or len(files) <= 1:
+        yield from map(validate, files)
+        return
+    # a few chunks per worker balance the load while sending each file name once
+    chunk_size = max(1, len(files) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(validate, files, chunksize=chunk_size)
+
+
+def write_failure_cases(tables: Iterable[pd.DataFrame], file_path: Path) -> Path:
+    """Write the failure cases of all templates to one csv or parquet file.
+
+    The file is written even if there are none, so it never lists the failures
+    of an earlier run.
+
+    Args:
+        tables (Iterable[pd.DataFrame]): Failure cases tables, see FAILURE_COLUMNS
+        file_path (Path): Path of the file, parquet if it ends in .parquet
+            (requires pyarrow), csv otherwise
+
+    Returns:
+        Path: Path of the written file
+    """
+    tables = [table for table in tables if not table.empty]
+    failure_cases = (
+        pd.concat(tables, ignore_index=True)
+        if tables
+        else pd.DataFrame(columns=FAILURE_COLUMNS)
+    )
+    # failing values are of any type, e.g. a number in a dropdown column
+    for column in FAILURE_COLUMNS[1:]:
+        failure_cases[column] = failure_cases[column].map(str, na_action="ignore")
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    if file_path.suffix == ".parquet":
+        failure_cases.to_parquet(file_path, index=False)
+    else:
+        failure_cases.to_csv(file_path, index=False)
+    validate_logger.info("%s failure cases written to %s", len(failure_cases), file_path.name)
+    return file_path
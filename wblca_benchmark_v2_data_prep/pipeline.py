@@ -0,0 +1,356 @@
+#!/usr/bin/env python
+"""Runs the metadata, lca_results and data_record pipelines as one graph of stages.
+
+Every script of the three pipelines is a stage of the graph, see pipeline_stages,
+and stages pass their results as DataFrames in memory instead of through the files
+between scripts. Independent branches run at the same time with --jobs, e.g. the
+Tally and One Click models or the project and energy data entry templates, and a
+stage only writes its files, to the directory its script writes to, when it is a
+target or asked for with --write. By default the data entry templates are
+tested and the data record is built and written.
+
+    python -m wblca_benchmark_v2_data_prep.pipeline --jobs 4 --write harmonized
+"""
+
+from argparse import ArgumentParser
+from logging import getLogger
+from pathlib import Path
+from typing import Callable, Collection, Dict, Iterable, List, Optional
+import pandas as pd
+import wblca_benchmark_v2_data_prep.data_record.internal_data_calcs as internal_calc
+import wblca_benchmark_v2_data_prep.data_record.metadata_calcs as meta_calc
+import wblca_benchmark_v2_data_prep.data_record.results_calcs as results_calc
+import wblca_benchmark_v2_data_prep.data_record.run as record_run
+import wblca_benchmark_v2_data_prep.lca_results.ingestion as ingestion_util
+import wblca_benchmark_v2_data_prep.lca_results.mapping_cache as cache_util
+import wblca_benchmark_v2_data_prep.lca_results.run as lca_run
+import wblca_benchmark_v2_data_prep.metadata.run as metadata_run
+import wblca_benchmark_v2_data_prep.utils.artifacts as artifacts
+from wblca_benchmark_v2_data_prep.utils.dag import Stage, run_stages
+from wblca_benchmark_v2_data_prep.utils.loggers import setup_logger
+
+pipeline_logger = getLogger("pipeline")
+
+Models = Dict[str, pd.DataFrame]
+
+# stages run and written by default, the tests of the templates and the data record
+DEFAULT_TARGETS = (
+    "project_tested",
+    "energy_tested",
+    "internal_data",
+    "buildings_metadata",
+    "lca_full_results",
+)
+
+
+def _map_models(
+    map_dfs: Callable[..., List[pd.DataFrame]], suffix: str, cache_dir: Optional[Path]
+) -> Callable[[Models], Models]:
+    """Stage running a function of lca_results.run on the models of a tool."""
+
+    def run(models: Models) -> Models:
+        mapped_dfs = map_dfs(list(models.values()), cache_dir)
+        return {f"{stem}{suffix}": df for stem, df in zip(models, mapped_dfs)}
+
+    return run
+
+
+def _write_models(
+    artifact_format: artifacts.ArtifactFormat, directory: Path
+) -> Callable[[Models], List[Path]]:
+    """Writer of the models of a tool, named the way the scripts name them."""
+
+    def write(models: Models) -> List[Path]:
+        # the index of the models is already a column, see lca_results.run
+        return [
+            artifact_format.write(df, directory, stem, index=False)
+            for stem, df in models.items()
+        ]
+
+    return write
+
+
+def _lca_results_stages(main_directory: Path) -> List[Stage]:
+    """Stages of scripts/lca_results 1 to 7."""
+    lca_directory = main_directory.joinpath("data/lca_results")
+    artifact_format = artifacts.configured_format(main_directory)
+    cache_dir = cache_util.configured_cache_dir(main_directory)
+    ingestion = ingestion_util.configured_ingestion(main_directory)
+    tally_files = sorted(lca_directory.joinpath("raw/tally").glob("*.csv"))
+    oneclick_files = sorted(lca_directory.joinpath("raw/oneclick").glob("*.xlsx"))
+
+    def write_models(directory: str):
+        return _write_models(artifact_format, lca_directory.joinpath(directory))
+
+    def combine(models: Models) -> Optional[pd.DataFrame]:
+        return pd.concat(models.values()) if models else None
+
+    def write_combined(file_name: str):
+        def write(combined_df: Optional[pd.DataFrame]) -> List[Path]:
+            if combined_df is None:
+                return []
+            directory = lca_directory.joinpath("combined")
+            return [artifact_format.write(combined_df, directory, file_name, index=False)]
+
+        return write
+
+    def write_harmonized(harmonized_df: Optional[pd.DataFrame]) -> List[Path]:
+        if harmonized_df is None:
+            return []
+        return [
+            artifact_format.write(harmonized_df, directory, "combined_harmonized")
+            for directory in (
+                lca_directory.joinpath("harmonized"),
+                main_directory.joinpath("data/data_record/raw"),
+            )
+        ]
+
+    return [
+        Stage(
+            "tally_cleaned",
+            lambda: dict(
+                zip([file.stem for file in tally_files], lca_run.clean_tally_files(tally_files))
+            ),
+            write=write_models("cleaned/tally"),
+        ),
+        Stage(
+            "tally_csc",
+            lambda models: {
+                f"{stem}_csc": df
+                for stem, df in zip(
+                    models, lca_run.add_stored_carbon_to_tally_dfs(list(models.values()))
+                )
+            },
+            ("tally_cleaned",),
+            write_models("csc"),
+        ),
+        Stage(
+            "tally_element_mapped",
+            _map_models(lca_run.map_tally_elements, "_EleMapped", cache_dir),
+            ("tally_csc",),
+            write_models("element_mapped/tally"),
+        ),
+        Stage(
+            "tally_material_mapped",
+            _map_models(lca_run.map_tally_materials, "_MatMapped", cache_dir),
+            ("tally_element_mapped",),
+            write_models("material_mapped/tally"),
+        ),
+        Stage(
+            "tally_refined",
+            _map_models(lca_run.map_tally_elements_refined, "_RefMapped", cache_dir),
+            ("tally_material_mapped",),
+            write_models("ref_ele_mapped/tally"),
+        ),
+        Stage(
+            "tally_combined",
+            combine,
+            ("tally_refined",),
+            write_combined("Tally_Model_Combined"),
+        ),
+        Stage(
+            "oneclick_cleaned",
+            lambda: dict(
+                zip(
+                    [file.stem for file in oneclick_files],
+                    lca_run.clean_oneclick_files(oneclick_files, ingestion),
+                )
+            ),
+            write=write_models("cleaned/oneclick"),
+        ),
+        Stage(
+            "oneclick_element_mapped",
+            _map_models(lca_run.map_oneclick_elements, "_EleMapped", cache_dir),
+            ("oneclick_cleaned",),
+            write_models("element_mapped/oneclick"),
+        ),
+        Stage(
+            "oneclick_material_mapped",
+            _map_models(lca_run.map_oneclick_materials, "_MatMapped", cache_dir),
+            ("oneclick_element_mapped",),
+            write_models("material_mapped/oneclick"),
+        ),
+        Stage(
+            "oneclick_refined",
+            _map_models(lca_run.map_oneclick_elements_refined, "_EleMapped", cache_dir),
+            ("oneclick_material_mapped",),
+            write_models("ref_ele_mapped/oneclick"),
+        ),
+        Stage(
+            "oneclick_combined",
+            combine,
+            ("oneclick_refined",),
+            write_combined("OneClick_Model_Combined"),
+        ),
+        Stage(
+            "harmonized",
+            lca_run.harmonize,
+            ("tally_combined", "oneclick_combined"),
+            write_harmonized,
+        ),
+    ]
+
+
+def _metadata_stages(main_directory: Path) -> List[Stage]:
+    """Stages of scripts/metadata 1 to 6."""
+    stages = [Stage("raw_dets", lambda: metadata_run.read_raw_dets(main_directory))]
+    for kind in ("project", "energy"):
+        stages.extend(
+            [
+                Stage(
+                    f"{kind}_organized",
+                    lambda raw_dets, kind=kind: metadata_run.organize_dets(
+                        main_directory, kind, raw_dets
+                    ),
+                    ("raw_dets",),
+                    write=lambda dets, kind=kind: metadata_run.write_organized_dets(
+                        main_directory, kind, dets
+                    ),
+                ),
+                Stage(
+                    f"{kind}_tested",
+                    lambda dets, kind=kind: metadata_run.test_dets(kind, dets),
+                    (f"{kind}_organized",),
+                ),
+                Stage(
+                    f"{kind}_cleaned",
+                    lambda dets, kind=kind: metadata_run.clean_dets(main_directory, kind, dets),
+                    (f"{kind}_organized",),
+                    lambda dets, kind=kind: metadata_run.write_cleaned_dets(
+                        main_directory, kind, dets
+                    ),
+                ),
+            ]
+        )
+    return stages + [
+        Stage(
+            "merged",
+            metadata_run.merge_dets,
+            ("project_cleaned", "energy_cleaned"),
+            lambda dets: metadata_run.write_merged_dets(main_directory, dets),
+        ),
+        Stage(
+            "combined_det",
+            lambda dets: metadata_run.combine_dets(main_directory, dets),
+            ("merged",),
+            lambda det: metadata_run.write_combined_det(main_directory, det),
+        ),
+        Stage(
+            "finalized_det",
+            lambda det: metadata_run.finalize_det(main_directory, det),
+            ("combined_det",),
+            lambda det: metadata_run.write_finalized_det(main_directory, det),
+        ),
+    ]
+
+
+def _data_record_stages(main_directory: Path) -> List[Stage]:
+    """Stages of scripts/data_record 1 to 3."""
+    record_directory = main_directory.joinpath("data/data_record")
+
+    def wblca_output(harmonized_df: pd.DataFrame) -> pd.DataFrame:
+        # the data record scripts read combined_harmonized with its index as column
+        return harmonized_df.reset_index()
+
+    return [
+        Stage(
+            "internal_data",
+            lambda det: record_run.create_internal_data(main_directory, det),
+            ("finalized_det",),
+            lambda internal_data: [
+                internal_calc.write_internal_data_to_excel(
+                    internal_data, record_directory.joinpath("internal")
+                )
+            ],
+        ),
+        Stage(
+            "buildings_metadata",
+            lambda harmonized_df, internal_data: record_run.create_buildings_metadata(
+                main_directory,
+                wblca_output(harmonized_df),
+                record_run.as_read_internal_data(internal_data),
+            ),
+            ("harmonized", "internal_data"),
+            lambda project_metadata: [
+                meta_calc.write_buildings_metadata_to_excel(
+                    project_metadata, record_directory.joinpath("public")
+                )
+            ],
+        ),
+        Stage(
+            "lca_full_results",
+            lambda harmonized_df, internal_data: record_run.create_lca_full_results(
+                main_directory,
+                wblca_output(harmonized_df),
+                record_run.as_read_internal_data(internal_data),
+            ),
+            ("harmonized", "internal_data"),
+            lambda final_output: [
+                results_calc.write_full_lca_results_to_excel(
+                    final_output, record_directory.joinpath("public")
+                )
+            ],
+        ),
+    ]
+
+
+def pipeline_stages(main_directory: Path) -> List[Stage]:
+    """Stages of the metadata, lca_results and data_record pipelines.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        List[Stage]: Every stage, named after the files it writes
+    """
+    return (
+        _metadata_stages(main_directory)
+        + _lca_results_stages(main_directory)
+        + _data_record_stages(main_directory)
+    )
+
+
+def run_pipeline(
+    main_directory: Path,
+    targets: Optional[Iterable[str]] = None,
+    write: Collection[str] = (),
+    jobs: int = 1,
+) -> dict:
+    """Run the stages required by targets and write the targets.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+        targets (Optional[Iterable[str]]): Stages to run with the stages they
+            depend on, DEFAULT_TARGETS if None
+        write (Collection[str]): Further stages whose files are written, "all" to
+            write every stage that is run
+        jobs (int): Stages run at the same time
+
+    Returns:
+        dict: Result of every target by name
+    """
+    stages = pipeline_stages(main_directory)
+    targets = list(targets or DEFAULT_TARGETS)
+    if "all" in write:
+        write = [stage.name for stage in stages]
+    return run_stages(stages, targets, set(write) | set(targets), jobs)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Run the data preparation pipelines in memory.")
+    parser.add_argument(
+        "--targets",
+        nargs="+",
+        default=None,
+        help="Stages to run, the tests and data record by default",
+    )
+    parser.add_argument(
+        "--write", nargs="+", default=[], help='Further stages to write, or "all"'
+    )
+    parser.add_argument("--jobs", type=int, default=1, help="Number of stages run at once")
+    args = parser.parse_args()
+    main_dir = Path(__file__).parents[1]
+    log_path = main_dir.joinpath("data/logs/pipeline.log")
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    setup_logger(log_file_path=log_path, level="info")
+    run_pipeline(main_dir, args.targets, args.write, args.jobs)
@@ -0,0 +1,258 @@
+"""Reading and writing of the files passed between the lca_results stages.
+
+The format is set by artifact_format in references/config_lca_results.yml:
+
+- csv: the default, every stage re-parses the text and infers the dtypes again
+- parquet or feather: columnar files that keep dtypes, including categoricals, and
+  only read the requested columns (requires pyarrow)
+
+Whatever the format, reading a file gives the columns a csv round trip would give.
+An index written with the file comes back as columns, an unnamed index as
+"Unnamed: 0", the same as pd.read_csv of a file written with index=True, and
+repeated column names come back as "name.1". Columns declared in the dtype
+registry, see utils.dtypes, are read with their declared dtype.
+"""
+
+from dataclasses import dataclass, field
+from logging import getLogger
+from pathlib import Path
+from typing import List, Optional
+import pandas as pd
+import wblca_benchmark_v2_data_prep.utils.dtypes as dtypes_util
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+artifacts_logger = getLogger("utils.artifacts")
+
+SUFFIXES = {"csv": ".csv", "parquet": ".parquet", "feather": ".feather"}
+
+# object columns of these kinds are written by pyarrow as they are
+_ARROW_KINDS = (
+    "empty",
+    "string",
+    "bytes",
+    "boolean",
+    "integer",
+    "floating",
+    "mixed-integer-float",
+    "decimal",
+    "datetime",
+    "date",
+    "time",
+)
+
+
+def _index_as_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Move the index into columns named the way pd.read_csv names them."""
+    names = [
+        f"Unnamed: {position}" if name is None else name
+        for position, name in enumerate(df.index.names)
+    ]
+    return df.rename_axis(names).reset_index()
+
+
+def _unique_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Rename repeated columns to "name.1", "name.2", ... the way pd.read_csv does."""
+    if df.columns.is_unique:
+        return df
+    seen = set(df.columns)
+    counts = {}
+    columns = []
+    for column in df.columns:
+        if column in counts:
+            counts[column] += 1
+            renamed = f"{column}.{counts[column]}"
+            while renamed in seen:
+                counts[column] += 1
+                renamed = f"{column}.{counts[column]}"
+            seen.add(renamed)
+            columns.append(renamed)
+        else:
+            counts[column] = 0
+            columns.append(column)
+    df = df.copy()
+    df.columns = columns
+    return df
+
+
+def _arrow_compatible(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert object columns mixing types, e.g. 60 and "As building", to strings.
+
+    pyarrow refuses such columns, and reading them from a csv gives strings as well.
+    """
+    mixed = [
+        column
+        for column in df.columns[df.dtypes == object]
+        if pd.api.types.infer_dtype(df[column], skipna=True) not in _ARROW_KINDS
+    ]
+    if not mixed:
+        return df
+    artifacts_logger.info("Writing mixed type columns %s as strings", mixed)
+    df = df.copy()
+    for column in mixed:
+        df[column] = df[column].map(str, na_action="ignore")
+    return df
+
+
+def arrow_table(df: pd.DataFrame):
+    """Convert the columns of a DataFrame to a pyarrow Table the way write does.
+
+    Args:
+        df (pd.DataFrame): DataFrame whose index is already a column
+
+    Returns:
+        pyarrow.Table: Table of the columns of df, without its index
+    """
+    # pylint: disable=C0415
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(_arrow_compatible(_unique_columns(df)), preserve_index=False)
+
+
+@dataclass(frozen=True)
+class ArtifactFormat:
+    """File format of the data passed between stages.
+
+    Attributes:
+        name (str): One of "csv", "parquet" or "feather"
+        dtypes (Optional[dtypes_util.Registry]): Declared column dtypes of the files
+            by file name, applied when they are read
+    """
+
+    name: str = "csv"
+    dtypes: Optional[dtypes_util.Registry] = field(default=None, compare=False, hash=False)
+
+    def __post_init__(self):
+        if self.name not in SUFFIXES:
+            raise ValueError(f"Unknown artifact format {self.name}, use one of {list(SUFFIXES)}")
+
+    @property
+    def suffix(self) -> str:
+        """Suffix of the files written in this format, e.g. ".parquet"."""
+        return SUFFIXES[self.name]
+
+    def path(self, directory: Path, file_name: str) -> Path:
+        """Path of a file in this format.
+
+        Args:
+            directory (Path): Directory of the file
+            file_name (str): Name of the file without suffix
+
+        Returns:
+            Path: Path of the file
+        """
+        return directory.joinpath(f"{file_name}{self.suffix}")
+
+    def glob(self, directory: Path) -> List[Path]:
+        """Files of this format in a directory, sorted by name.
+
+        Args:
+            directory (Path): Directory to search
+
+        Returns:
+            List[Path]: Paths of the files
+        """
+        return sorted(directory.glob(f"*{self.suffix}"))
+
+    def read(self, file_path: Path, columns: Optional[list] = None) -> pd.DataFrame:
+        """Read a file of this format.
+
+        Args:
+            file_path (Path): Path of the file
+            columns (Optional[list]): Only read these columns, in this order, all
+                columns if None
+
+        Raises:
+            PermissionError: Raised if function does not have permission to access file
+
+        Returns:
+            pd.DataFrame: DataFrame of the file
+        """
+        dtypes = (self.dtypes or {}).get(file_path.stem, {})
+        if self.name == "csv":
+            df = gen.read_csv(file_path, columns=columns, dtypes=dtypes or None)
+            return df if columns is None else df[columns]
+        artifacts_logger.info("Reading %s", file_path.stem)
+        try:
+            if self.name == "parquet":
+                df = pd.read_parquet(file_path, columns=columns)
+            else:
+                df = pd.read_feather(file_path, columns=columns)
+        except PermissionError as pe:
+            artifacts_logger.exception("Permission Error probably caused by having file open")
+            raise PermissionError("Try closing out the file you are trying to read") from pe
+        artifacts_logger.info("Read data from file %s", file_path.name)
+        return dtypes_util.apply_dtypes(df, dtypes)
+
+    def read_columns(self, file_path: Path) -> List[str]:
+        """Read the column names of a file without reading its entries.
+
+        Args:
+            file_path (Path): Path of the file
+
+        Returns:
+            List[str]: Columns of the file in order
+        """
+        if self.name == "csv":
+            return list(pd.read_csv(file_path, nrows=0).columns)
+        # pylint: disable=C0415
+        import pyarrow.parquet as pq
+        from pyarrow import ipc
+
+        if self.name == "parquet":
+            return pq.read_schema(file_path).names
+        with ipc.open_file(file_path) as reader:
+            return reader.schema.names
+
+    def write(
+        self, df: pd.DataFrame, write_directory: Path, file_name: str, index: bool = True
+    ) -> Path:
+        """Write a DataFrame in this format.
+
+        Args:
+            df (pd.DataFrame): DataFrame to write
+            write_directory (Path): Directory to write the file to
+            file_name (str): Name of the file without suffix
+            index (bool): Write the index of df as first column(s)
+
+        Raises:
+            PermissionError: Raised if function does not have permission to access file
+
+        Returns:
+            Path: Path of the written file
+        """
+        if self.name == "csv":
+            gen.write_to_csv(df, write_directory, file_name, index=index)
+            return self.path(write_directory, file_name)
+        if index:
+            df = _index_as_columns(df)
+        df = _arrow_compatible(_unique_columns(df))
+        file_path = self.path(write_directory, file_name)
+        try:
+            if self.name == "parquet":
+                df.to_parquet(file_path, index=False)
+            else:
+                df.reset_index(drop=True).to_feather(file_path)
+        except PermissionError as pe:
+            artifacts_logger.exception("Permission Error probably caused by having file open")
+            raise PermissionError("Try closing the file you are trying to write to") from pe
+        artifacts_logger.info("%s has been saved to %s", file_name, write_directory)
+        return file_path
+
+
+CSV = ArtifactFormat("csv")
+
+
+def configured_format(main_directory: Path) -> ArtifactFormat:
+    """Get the artifact format set in references/config_lca_results.yml.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        ArtifactFormat: Configured format, csv if none is set, with the configured
+            dtype registry
+    """
+    config = gen.read_yaml(main_directory.joinpath("references/config_lca_results.yml"))
+    return ArtifactFormat(
+        config.get("artifact_format") or "csv", dtypes_util.configured_registry(main_directory)
+    )
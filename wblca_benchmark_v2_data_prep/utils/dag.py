@@ -0,0 +1,140 @@
+"""Runs pipeline stages as a graph, passing their results in memory.
+
+A Stage is a function of the results of the stages it depends on. run_stages runs
+every stage as soon as the stages it depends on are done, with up to jobs stages
+at the same time, so independent branches (e.g. Tally and One Click models, or
+project and energy data entry templates) overlap. A result is only written to
+disk if its stage is asked for, and dropped once every stage depending on it is
+done, unless it is a target.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Sequence, Tuple
+
+dag_logger = getLogger("utils.dag")
+
+
+@dataclass(frozen=True)
+class Stage:
+    """Step of a pipeline.
+
+    Attributes:
+        name (str): Unique name of the stage
+        run (Callable[..., Any]): Computes the result of the stage from the results
+            of inputs, passed in their order
+        inputs (Tuple[str, ...]): Names of the stages the result is computed from
+        write (Optional[Callable[[Any], Iterable[Path]]]): Writes the result and
+            returns the paths written, None if the result is never written
+    """
+
+    name: str
+    run: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+    write: Optional[Callable[[Any], Iterable[Path]]] = None
+
+
+def _required(stages: Dict[str, Stage], targets: Iterable[str]) -> List[str]:
+    """Targets and the stages they depend on, each after its inputs."""
+    order = []
+    state = {}
+
+    def visit(name: str, path: Tuple[str, ...]):
+        if name not in stages:
+            raise ValueError(f"Unknown stage {name}, required by {list(path) or 'targets'}")
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"Stages depend on each other: {' -> '.join(path + (name,))}")
+        state[name] = "visiting"
+        for input_name in stages[name].inputs:
+            visit(input_name, path + (name,))
+        state[name] = "done"
+        order.append(name)
+
+    for target in targets:
+        visit(target, ())
+    return order
+
+
+def run_stages(
+    stages: Sequence[Stage],
+    targets: Optional[Iterable[str]] = None,
+    write: Collection[str] = (),
+    jobs: int = 1,
+) -> Dict[str, Any]:
+    """Run the stages required by targets, each once its inputs are done.
+
+    Args:
+        stages (Sequence[Stage]): Stages of the pipeline
+        targets (Optional[Iterable[str]]): Stages whose results are returned, the
+            stages no other stage depends on if None
+        write (Collection[str]): Stages whose results are written to disk
+        jobs (int): Stages run at the same time
+
+    Raises:
+        ValueError: Raised if stage names repeat, are unknown or depend on each other
+
+    Returns:
+        Dict[str, Any]: Result of every target by name
+    """
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Stage {stage.name} is defined twice")
+        by_name[stage.name] = stage
+    # every stage is checked, not only those the targets depend on
+    _required(by_name, by_name)
+    if targets is None:
+        used = {input_name for stage in stages for input_name in stage.inputs}
+        targets = [stage.name for stage in stages if stage.name not in used]
+    targets = list(targets)
+    order = _required(by_name, targets)
+
+    # stages still to run that use each result, a result is dropped at zero
+    users = {name: 0 for name in order}
+    for name in order:
+        for input_name in by_name[name].inputs:
+            users[input_name] += 1
+
+    results = {}
+    pending = list(order)
+    running: Dict[Future, str] = {}
+
+    def finish(name: str, result: Any):
+        stage = by_name[name]
+        if name in write and stage.write is not None:
+            for path in stage.write(result):
+                dag_logger.info("Wrote %s of stage %s", path, name)
+        results[name] = result
+        for input_name in stage.inputs:
+            users[input_name] -= 1
+            if users[input_name] == 0 and input_name not in targets:
+                del results[input_name]
+
+    with ThreadPoolExecutor(max_workers=max(jobs, 1)) as executor:
+        while pending or running:
+            for name in list(pending):
+                if len(running) >= max(jobs, 1):
+                    break
+                stage = by_name[name]
+                if all(input_name in results for input_name in stage.inputs):
+                    pending.remove(name)
+                    dag_logger.info("Begin stage %s", name)
+                    inputs = [results[input_name] for input_name in stage.inputs]
+                    running[executor.submit(stage.run, *inputs)] = name
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception:
+                    dag_logger.exception("Stage %s failed", name)
+                    for other in running:
+                        other.cancel()
+                    raise
+                finish(name, result)
+                dag_logger.info("End stage %s", name)
+    return {name: results[name] for name in targets}
@@ -0,0 +1,103 @@
+"""Declared dtypes of the columns of the lca_results files.
+
+The registry, references/lca_dtypes.yml by default, lists the dtypes of the
+columns of each stage's files, by file name. ArtifactFormat.read applies the
+dtypes of a file whenever it reads it, so impacts are not inferred again on every
+read and label columns such as "MQ_1" or "Life Cycle Stage" are read as
+categories, which keep every distinct label once instead of once per row.
+"""
+
+from logging import getLogger
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+import pandas as pd
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+dtypes_logger = getLogger("utils.dtypes")
+
+# dtypes of the columns of a file by file name without suffix
+Registry = Dict[str, Dict[str, str]]
+
+
+def read_registry(file_path: Path) -> Registry:
+    """Read a dtype registry.
+
+    Each stage of the registry lists the files it applies to under files and
+    the dtypes of their columns under dtypes.
+
+    Args:
+        file_path (Path): Path of the registry yaml
+
+    Raises:
+        ValueError: Raised if a file is listed under more than one stage
+
+    Returns:
+        Registry: Column dtypes of every listed file by file name
+    """
+    stages = gen.read_yaml(file_path)
+    assert stages is not None, "The dtype registry could not be read"
+    registry = {}
+    for stage, entry in stages.items():
+        for file_name in entry.get("files", []):
+            if file_name in registry:
+                raise ValueError(f"{file_name} is listed twice in {file_path.name}")
+            registry[file_name] = dict(entry.get("dtypes") or {})
+        dtypes_logger.info("Read dtypes of %s", stage)
+    return registry
+
+
+def apply_dtypes(df: pd.DataFrame, dtypes: Mapping[str, str]) -> pd.DataFrame:
+    """Convert the columns of df that have a declared dtype.
+
+    Columns already of their dtype, and declared columns not in df, are left
+    as they are.
+
+    Args:
+        df (pd.DataFrame): DataFrame to convert
+        dtypes (Mapping[str, str]): Dtype of each declared column
+
+    Returns:
+        pd.DataFrame: DataFrame with the declared dtypes
+    """
+    convert = {
+        column: dtype
+        for column, dtype in dtypes.items()
+        if column in df.columns and df[column].dtype != dtype
+    }
+    return df.astype(convert) if convert else df
+
+
+def replace_values(series: pd.Series, replacements: Mapping) -> pd.Series:
+    """Series.replace that also replaces the labels of categorical columns.
+
+    Replacing values of a categorical column may merge categories, which
+    Series.replace no longer does, so those are replaced as labels and the
+    categories built again.
+
+    Args:
+        series (pd.Series): Column to replace values in
+        replacements (Mapping): New value of each value to replace
+
+    Returns:
+        pd.Series: Column with the values replaced, categorical if series was
+    """
+    # a repeated column name selects a DataFrame, replaced as before
+    if not isinstance(getattr(series, "dtype", None), pd.CategoricalDtype):
+        return series.replace(replacements)
+    return series.astype(object).replace(replacements).astype("category")
+
+
+def configured_registry(main_directory: Path) -> Optional[Registry]:
+    """Get the dtype registry set in references/config_lca_results.yml.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        Optional[Registry]: Registry, None if dtype_registry is not set
+    """
+    config = gen.read_yaml(main_directory.joinpath("references/config_lca_results.yml"))
+    registry_path = config.get("dtype_registry")
+    if not registry_path:
+        return None
+    return read_registry(main_directory.joinpath(registry_path))
@@ -0,0 +1,124 @@
+"""Reading ahead and writing behind the per-file loops of the pipeline scripts.
+
+The scripts read a file, process it and write the result before reading the next
+file, so nothing is processed while a file is read or written, which on network
+storage is most of the time. read_ahead reads the next files in threads while the
+current one is processed, and WriteBehind writes results in threads while the
+loop goes on, each at most jobs files at a time so memory stays bounded:
+
+    with WriteBehind(jobs) as writer:
+        for file, df in zip(files, read_ahead(read, files, jobs)):
+            writer.submit(write, process(df), file.stem, done=record)
+
+With jobs = 1 both read and write in the calling thread when asked to, the same
+as a plain loop.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Deque, Iterator, Optional, Sequence, Tuple, TypeVar
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+T = TypeVar("T")
+
+
+def read_ahead(read: Callable[[Path], T], files: Sequence[Path], jobs: int = 1) -> Iterator[T]:
+    """Read files in order, with up to jobs files read ahead in threads.
+
+    Args:
+        read (Callable[[Path], T]): Reads one file
+        files (Sequence[Path]): Files to read
+        jobs (int): Files read at the same time, 1 reads each file when needed
+
+    Yields:
+        T: Result of read for each file, in the order of files
+    """
+    if jobs <= 1:
+        for file in files:
+            yield read(file)
+        return
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for file in files:
+            pending.append(executor.submit(read, file))
+            if len(pending) > jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class WriteBehind:
+    """Writes results in threads while the loop producing them goes on.
+
+    At most jobs writes are pending; submitting another waits for the oldest.
+    The done callback of each write is called in the thread that submitted it,
+    in the order of submission, once the write is finished. Leaving the with
+    block waits for every write and raises the error of the first one that
+    failed.
+
+    Args:
+        jobs (int): Writes at the same time, 1 writes when submitted
+    """
+
+    def __init__(self, jobs: int = 1):
+        self.jobs = jobs
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Deque[Tuple[Future, Optional[Callable]]] = deque()
+
+    def __enter__(self) -> "WriteBehind":
+        if self.jobs > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.jobs)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            while self._pending:
+                self._finish_oldest()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+    def _finish_oldest(self) -> None:
+        """Wait for the oldest pending write and call its done callback."""
+        future, done = self._pending.popleft()
+        result = future.result()
+        if done is not None:
+            done(result)
+
+    def submit(
+        self,
+        write: Callable[..., T],
+        *args,
+        done: Optional[Callable[[T], None]] = None,
+        **kwargs,
+    ) -> None:
+        """Write in a thread, or now if jobs is 1.
+
+        Args:
+            write (Callable[..., T]): Writes a result, called with args and kwargs
+            done (Optional[Callable[[T], None]]): Called with the return value of
+                write once it is finished, e.g. to record the written file
+        """
+        if self._executor is None:
+            result = write(*args, **kwargs)
+            if done is not None:
+                done(result)
+            return
+        self._pending.append((self._executor.submit(write, *args, **kwargs), done))
+        while len(self._pending) > self.jobs:
+            self._finish_oldest()
+
+
+def configured_jobs(main_directory: Path) -> int:
+    """Get the files read ahead and written behind set in config_lca_results.yml.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+
+    Returns:
+        int: jobs of file_io, 1 if not set
+    """
+    config = gen.read_yaml(main_directory.joinpath("references/config_lca_results.yml"))
+    return int((config.get("file_io") or {}).get("jobs") or 1)
@@ -1,7 +1,9 @@
 """Utility functions for general use in general workflows."""
 
+import hashlib
 from pathlib import Path
 from logging import getLogger
+from typing import Optional
 import pandas as pd
 import yaml
 # pylint: disable=W0703, W0719
@@ -41,11 +43,31 @@ def read_yaml(file_path: Path) -> dict:
     return yaml_dict
 
 
-def read_csv(file_path: Path) -> pd.DataFrame:
+def file_digest(file_path: Path) -> str:
+    """Hash the content of a file, read in blocks.
+
+    Args:
+        file_path (Path): file path of the file to hash
+
+    Returns:
+        str: sha256 hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_csv(
+    file_path: Path, columns: Optional[list] = None, dtypes: Optional[dict] = None
+) -> pd.DataFrame:
     """Read csv files for general use.
 
     Args:
         file_path (Path): file path of csv to read
+        columns (Optional[list]): Only read these columns, all columns if None
+        dtypes (Optional[dict]): dtypes of the columns, inferred for columns not in it
 
     Raises:
         PermissionError: Raised if function does not have permission to access file
@@ -57,9 +79,7 @@ def read_csv(file_path: Path) -> pd.DataFrame:
     """
     try:
         general_logger.info("Reading %s", file_path.stem)
-        df = pd.read_csv(
-            file_path,
-        )
+        df = pd.read_csv(file_path, usecols=columns, dtype=dtypes)
     except PermissionError as pe:
         general_logger.exception("Permission Error probably caused by having file open")
         raise PermissionError("Try closing out the file you are trying to read") from pe
@@ -74,7 +94,9 @@ def read_csv(file_path: Path) -> pd.DataFrame:
     return df
 
 
-def write_to_csv(df: pd.DataFrame, write_directory: Path, file_name: str) -> None:
+def write_to_csv(
+    df: pd.DataFrame, write_directory: Path, file_name: str, index: bool = True
+) -> None:
     """Write to csv for general use.
 
     This function allows you to name the file based on the name of the firm as well as a file suffix
@@ -84,6 +106,7 @@ def write_to_csv(df: pd.DataFrame, write_directory: Path, file_name: str) -> Non
         df (pd.DataFrame): DataFrame to write to csv
         write_directory (Path): Path location to write csv to
         file_suffix (str): Any additional information to append to the end of the file name
+        index (bool): Write the index of df as first column
 
     Raises:
         PermissionError: Raised if function does not have permission to access file
@@ -92,7 +115,7 @@ def write_to_csv(df: pd.DataFrame, write_directory: Path, file_name: str) -> Non
 
     """
     try:
-        df.to_csv(write_directory.joinpath(f"{file_name}.csv"))
+        df.to_csv(write_directory.joinpath(f"{file_name}.csv"), index=index)
     except PermissionError as pe:
         general_logger.exception("Permission Error probably caused by having file open")
         raise PermissionError("Try closing out the file you are trying to read") from pe
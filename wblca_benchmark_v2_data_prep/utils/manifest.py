@@ -0,0 +1,205 @@
+"""Manifests of the outputs of a script for incremental builds.
+
+A BuildManifest records for every output of a script the sha256 of the files it
+was built from, and for the script as a whole a digest of its dependencies: the
+references it reads (e.g. config_harmonize.yml or stored_carbon_database.xlsx)
+and the source of the code modules it runs. A script skips an output when
+
+- its dependencies are unchanged,
+- every input has the content it had when the output was built, and
+- every output recorded for it still exists as it was written.
+
+Inputs whose size and modification time are unchanged are not hashed again, a
+file that was only touched is hashed and found unchanged. As in git, the size and
+modification time of a file modified within RACY_SECONDS of being recorded are not
+trusted, a later change could keep both. Manifests are enabled by
+incremental_builds in the config file of the scripts, e.g.
+references/config_lca_results.yml.
+"""
+
+import hashlib
+import json
+import os
+import time
+from logging import getLogger
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterable, Optional, Union
+import wblca_benchmark_v2_data_prep.utils.general as gen
+
+manifest_logger = getLogger("utils.manifest")
+
+Dependency = Union[Path, ModuleType]
+
+# files modified this recently are hashed on every check
+RACY_SECONDS = 2
+
+
+def _stat(file_path: Path) -> dict:
+    """Size and modification time of a file."""
+    stat = file_path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _racy(state: dict) -> bool:
+    """Whether a file was modified too recently for its stat to identify it."""
+    return time.time_ns() - state["mtime_ns"] < RACY_SECONDS * 1_000_000_000
+
+
+def dependency_digest(dependencies: Iterable[Dependency]) -> str:
+    """Hash the content of the files and modules a script depends on.
+
+    Args:
+        dependencies (Iterable[Dependency]): Files, e.g. references, and modules
+
+    Returns:
+        str: Hex digest of the dependencies in a fixed order
+    """
+    paths = set()
+    for dependency in dependencies:
+        if isinstance(dependency, ModuleType):
+            dependency = dependency.__file__
+        paths.add(Path(dependency).resolve())
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(f"{path.name}:{gen.file_digest(path)};".encode())
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Inputs and outputs of every output built by a script.
+
+    A manifest without a path is disabled: no output is current and nothing is
+    recorded, so the script builds every output as without a manifest.
+
+    Attributes:
+        path (Optional[Path]): Json file the manifest is stored in, None if disabled
+        dependencies (str): Digest of the dependencies of the script
+        entries (Dict[str, dict]): Inputs and outputs recorded by output key
+    """
+
+    def __init__(self, path: Optional[Path] = None, dependencies: Iterable[Dependency] = ()):
+        self.path = path
+        self.dependencies = dependency_digest(dependencies) if path is not None else ""
+        self.entries: Dict[str, dict] = {}
+        # digests computed during this run by path, size and modification time
+        self._digests: Dict[tuple, str] = {}
+        if path is None or not path.exists():
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                stored = json.load(file)
+        except (OSError, ValueError):
+            manifest_logger.warning("Unable to read %s, building every output", path)
+            return
+        if stored.get("dependencies") == self.dependencies:
+            self.entries = stored.get("entries", {})
+        else:
+            manifest_logger.info("Dependencies changed, building every output of %s", path.stem)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether outputs are recorded and skipped."""
+        return self.path is not None
+
+    def _inputs(self, inputs: Iterable[Path], recorded: Optional[dict] = None) -> dict:
+        """Digest, size and modification time of the inputs by path."""
+        recorded = recorded or {}
+        states = {}
+        for input_path in inputs:
+            state = _stat(input_path)
+            previous = recorded.get(str(input_path))
+            if (
+                previous is not None
+                and not previous.get("racy", False)
+                and all(previous[k] == v for k, v in state.items())
+            ):
+                state["sha256"] = previous["sha256"]
+            else:
+                digest_key = (input_path, state["size"], state["mtime_ns"])
+                if digest_key not in self._digests:
+                    self._digests[digest_key] = gen.file_digest(input_path)
+                state["sha256"] = self._digests[digest_key]
+            if _racy(state):
+                state["racy"] = True
+            states[str(input_path)] = state
+        return states
+
+    def is_current(self, key: str, inputs: Iterable[Path]) -> bool:
+        """Whether an output was built from inputs with their current content.
+
+        Args:
+            key (str): Name of the output, unique within the script
+            inputs (Iterable[Path]): Files the output is built from
+
+        Returns:
+            bool: True if the output does not need to be built again
+        """
+        entry = self.entries.get(key)
+        if not self.enabled or entry is None:
+            return False
+        for output, state in entry["outputs"].items():
+            output_path = Path(output)
+            if not output_path.exists() or _stat(output_path) != state:
+                return False
+        inputs = list(inputs)
+        if {str(input_path) for input_path in inputs} != set(entry["inputs"]):
+            return False
+        current = self._inputs(inputs, entry["inputs"])
+        if any(
+            current[name]["sha256"] != state["sha256"] for name, state in entry["inputs"].items()
+        ):
+            return False
+        # inputs hashed again keep their new stat, saved with the next save
+        entry["inputs"] = current
+        manifest_logger.info("%s is up to date", key)
+        return True
+
+    def record(self, key: str, inputs: Iterable[Path], outputs: Iterable[Path] = ()) -> None:
+        """Record the inputs of an output that was just built.
+
+        Args:
+            key (str): Name of the output, unique within the script
+            inputs (Iterable[Path]): Files the output was built from
+            outputs (Iterable[Path]): Files written for the output
+        """
+        if not self.enabled:
+            return
+        self.entries[key] = {
+            "inputs": self._inputs(inputs),
+            "outputs": {str(output): _stat(output) for output in outputs},
+        }
+
+    def save(self) -> None:
+        """Write the manifest, replacing the previous file in one step."""
+        if not self.enabled:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump({"dependencies": self.dependencies, "entries": self.entries}, file, indent=1)
+        os.replace(temporary_path, self.path)
+
+
+def configured_manifest(
+    main_directory: Path, config_path: Path, name: str, dependencies: Iterable[Dependency]
+) -> BuildManifest:
+    """Load the manifest of a script if incremental builds are enabled in its config.
+
+    Args:
+        main_directory (Path): Root directory of the repository
+        config_path (Path): Config file with the incremental_builds settings, which
+            is a dependency of the script as well
+        name (str): Name of the manifest, e.g. "1_clean_tally"
+        dependencies (Iterable[Dependency]): References and modules of the script
+
+    Returns:
+        BuildManifest: Manifest of the script, disabled if incremental builds are
+            not enabled
+    """
+    config = gen.read_yaml(config_path) or {}
+    incremental_config = config.get("incremental_builds") or {}
+    if not incremental_config.get("enabled", False):
+        return BuildManifest()
+    directory = main_directory.joinpath(incremental_config["directory"])
+    return BuildManifest(directory.joinpath(f"{name}.json"), [config_path, *dependencies])